@@ -4,9 +4,10 @@ Add skill descriptions to ActionSkillsTable.csv and IncidentSkillsTable.csv
 """
 
 import re
-import csv
 from pathlib import Path
 
+from planning_tables import load_table, write_table
+
 def to_camel_case(name):
     """Convert 'Aid Another' to 'aidAnother'"""
     words = name.split()
@@ -42,14 +43,10 @@ def extract_skills_with_descriptions(filepath):
 
 def update_actions_csv():
     """Update ActionSkillsTable.csv with skill descriptions"""
-    csv_path = 'docs/planning/ActionSkillsTable.csv'
+    table = load_table('actions')
+    csv_path = table.relative_path
     pipeline_dir = 'src/pipelines/actions'
-    
-    # Read current CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames
+    rows = table.records()
     
     # Build a map of all pipeline files
     pipeline_files = {}
@@ -90,23 +87,16 @@ def update_actions_csv():
             print(f"✗ No pipeline file found for '{name}' (looking for '{camel_name}.ts')")
     
     # Write updated CSV
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    write_table(table, rows)
     
     print(f"\n✓ Updated {csv_path} ({updated_count}/{len(rows)} rows)")
 
 def update_incidents_csv():
     """Update IncidentSkillsTable.csv with skill descriptions"""
-    csv_path = 'docs/planning/IncidentSkillsTable.csv'
+    table = load_table('incidents')
+    csv_path = table.relative_path
     pipeline_dir = 'src/pipelines/incidents'
-    
-    # Read current CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        fieldnames = reader.fieldnames
+    rows = table.records()
     
     # Build a map of all pipeline files (using kebab-case stem as key)
     pipeline_files = {}
@@ -136,10 +126,7 @@ def update_incidents_csv():
             print(f"✗ No pipeline file found for '{name}' (looking for '{kebab_name}.ts')")
     
     # Write updated CSV
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    write_table(table, rows)
     
     print(f"\n✓ Updated {csv_path} ({updated_count}/{len(rows)} rows)")
 
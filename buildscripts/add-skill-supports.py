@@ -4,9 +4,7 @@ Add 'Supports: [skills]' manualEffects to all skill structures (tiers 1-4).
 Tier 4 already has the reroll effect, so we append the supports line.
 """
 
-import json
-import os
-from pathlib import Path
+from structure_catalog import STRUCTURES_DIR, StructureCatalog
 
 # Define the skill structure files and their skills
 SKILL_STRUCTURES = {
@@ -31,13 +29,11 @@ def get_skills_for_tier(tier_data):
                     skills.append(skill)
     return skills
 
-def process_file(filepath):
-    """Add manualEffects to all tiers in a skill structure file."""
+def process_family(catalog, filepath):
+    """Add manualEffects to all tiers in a skill structure family."""
     print(f"\nProcessing: {filepath.name}")
     
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-    
+    data = catalog.families[filepath]
     modified = False
     
     for tier in data.get('tiers', []):
@@ -63,17 +59,14 @@ def process_file(filepath):
     
     if modified:
         # Save the file with pretty formatting
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-            f.write('\n')  # Add trailing newline
+        catalog.save_family(filepath)
         print(f"✅ Updated {filepath.name}")
     else:
         print(f"⏭️  No changes needed for {filepath.name}")
 
 def main():
-    # Get the data directory
-    script_dir = Path(__file__).parent
-    data_dir = script_dir.parent / 'data' / 'structures'
+    # Load all structure families once
+    catalog = StructureCatalog.load()
     
     print("=" * 60)
     print("ADDING 'Supports:' TO SKILL STRUCTURES")
@@ -81,9 +74,9 @@ def main():
     
     # Process each skill structure file (excluding crime-intrigue which we already did)
     for filename in SKILL_STRUCTURES.keys():
-        filepath = data_dir / filename
-        if filepath.exists():
-            process_file(filepath)
+        filepath = STRUCTURES_DIR / filename
+        if filepath in catalog.families:
+            process_family(catalog, filepath)
         else:
             print(f"⚠️  File not found: {filename}")
     
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Approach dominance and Pareto analysis for EVENT_BALANCE_TABLE.csv.
+
+For every event, each approach (Virtuous / Practical / Ruthless) becomes an
+exact probability distribution: the four outcome cells are weighted by the
+d20 odds at a party level (outcome_odds.py), and each cell's dice are
+convolved exactly (balance_scorer.effect_terms) - no sampling, no means.
+
+Per event it reports:
+
+- first-order stochastic dominance (FSD) of the gold-equivalent value:
+  A dominates B when P(A ≤ x) ≤ P(B ≤ x) for every x, i.e. every
+  player prefers A regardless of risk appetite
+- second-order dominance (SSD): A dominates B for every risk-averse
+  player (integrated CDFs)
+- the Pareto front over expected per-resource deltas, each oriented by
+  the sign of its exchange rate (less unrest is better)
+
+Any table with the EVENT_BALANCE_TABLE columns can be analysed with
+--table, so homebrew tables with hundreds of events run in one pass.
+
+Usage:
+    python buildscripts/analyze-approach-dominance.py [--level 5] [--table PATH]
+                                                      [--rate NAME=VALUE ...]
+                                                      [--format text|json|markdown] [--output PATH]
+    python buildscripts/analyze-approach-dominance.py --self-test
+"""
+
+import argparse
+import json
+import sys
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from balance_scorer import DEFAULT_RATES, EFFECT_COLUMNS, KNOWN_VALUES, Roll, effect_terms, parse_rate
+from outcome_odds import OUTCOMES, counts_for, level_tables
+from planning_tables import PlanningTable, load_table
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+Distribution = Dict[Fraction, Fraction]  # value → probability
+
+
+def roll_distribution(roll: Roll) -> Dict[int, int]:
+    """Exact outcome counts of one roll (weights sum to sides ** count)."""
+    sign, count, sides, bonus = roll
+    counts = {0: 1}
+    for _ in range(count):
+        step: Dict[int, int] = {}
+        for total, weight in counts.items():
+            for face in range(1, sides + 1):
+                step[total + face] = step.get(total + face, 0) + weight
+        counts = step
+    return {sign * (total + bonus): weight for total, weight in counts.items()}
+
+
+def convolve(a: Distribution, b: Distribution) -> Distribution:
+    result: Distribution = {}
+    for x, p in a.items():
+        for y, q in b.items():
+            result[x + y] = result.get(x + y, 0) + p * q
+    return result
+
+
+def cell_distribution(effect: str, rates: Dict[str, Fraction]) -> Distribution:
+    """Distribution of one cell's gold-equivalent value."""
+    distribution: Distribution = {Fraction(0): Fraction(1)}
+    for roll, factors in effect_terms(effect):
+        scale = sum((rates.get(r, 0) * Fraction(f) for r, f in factors.items()), Fraction(0))
+        if not scale:
+            continue
+        counts = roll_distribution(roll)
+        total = sum(counts.values())
+        distribution = convolve(distribution, {scale * v: Fraction(w, total) for v, w in counts.items()})
+    return distribution
+
+
+def cell_means(effect: str) -> Dict[str, Fraction]:
+    """Exact expected delta per resource of one cell."""
+    means: Dict[str, Fraction] = {}
+    for roll, factors in effect_terms(effect):
+        sign, count, sides, bonus = roll
+        mean = sign * (Fraction(count * (sides + 1), 2) + bonus)
+        for resource, factor in factors.items():
+            means[resource] = means.get(resource, Fraction(0)) + Fraction(factor) * mean
+    return means
+
+
+def mean(distribution: Distribution) -> Fraction:
+    return sum((v * p for v, p in distribution.items()), Fraction(0))
+
+
+def cdf_points(distribution: Distribution, support: List[Fraction]) -> List[Fraction]:
+    cumulative, total, values = [], Fraction(0), sorted(distribution)
+    index = 0
+    for x in support:
+        while index < len(values) and values[index] <= x:
+            total += distribution[values[index]]
+            index += 1
+        cumulative.append(total)
+    return cumulative
+
+
+def integrate(cdf: List[Fraction], support: List[Fraction]) -> List[Fraction]:
+    """Integral of a step CDF from the bottom of the support up to each support point."""
+    integral, area = [], Fraction(0)
+    for i, x in enumerate(support):
+        integral.append(area)
+        if i + 1 < len(support):
+            area += cdf[i] * (support[i + 1] - x)
+    return integral
+
+
+def dominates(curve_a: List[Fraction], curve_b: List[Fraction]) -> bool:
+    """a ≥ b when a's (integrated) CDF never lies above b's, and they differ.
+
+    Checking the support points is enough: between them the curves are
+    constant (CDF) or linear (integrated CDF), and past the top both CDFs are 1.
+    """
+    return curve_a != curve_b and all(x <= y for x, y in zip(curve_a, curve_b))
+
+
+def pareto_front(vectors: Dict[str, Dict[str, Fraction]], rates: Dict[str, Fraction]) -> List[str]:
+    """Approaches not Pareto-dominated on rate-oriented expected deltas."""
+    resources = sorted({r for vector in vectors.values() for r in vector if rates.get(r)})
+
+    def oriented(name: str) -> List[Fraction]:
+        return [vectors[name].get(r, Fraction(0)) * (1 if rates[r] > 0 else -1) for r in resources]
+
+    front = []
+    for name in vectors:
+        mine = oriented(name)
+        beaten = any(all(o >= m for o, m in zip(oriented(other), mine)) and oriented(other) != mine
+                     for other in vectors if other != name)
+        if not beaten:
+            front.append(name)
+    return front
+
+
+class EventAnalysis:
+    def __init__(self, event: str, approaches: Dict[str, Distribution], vectors: Dict[str, Dict[str, Fraction]],
+                 rates: Dict[str, Fraction]):
+        self.event = event
+        self.approaches = approaches
+        self.vectors = vectors
+
+        # One shared support, so each approach's curves are computed once
+        support = sorted(set().union(*approaches.values()))
+        cdfs = {name: cdf_points(dist, support) for name, dist in approaches.items()}
+        self.fsd = self.relations(cdfs)
+        self.ssd = self.relations({name: integrate(cdf, support) for name, cdf in cdfs.items()})
+        self.pareto = pareto_front(vectors, rates)
+
+    def relations(self, curves: Dict[str, List[Fraction]]) -> List[Tuple[str, str]]:
+        return [(a, b) for a in curves for b in curves if a != b and dominates(curves[a], curves[b])]
+
+    @property
+    def dominant(self) -> Optional[str]:
+        """Approach that first-order dominates every other, if any."""
+        for name in self.approaches:
+            if all((name, other) in self.fsd for other in self.approaches if other != name):
+                return name
+        return None
+
+    def to_dict(self) -> Dict:
+        return {
+            'event': self.event,
+            'approaches': {
+                name: {
+                    'mean': round(float(mean(dist)), 3),
+                    'min': float(min(dist)),
+                    'max': float(max(dist)),
+                    'expectedDeltas': {r: round(float(v), 3) for r, v in sorted(self.vectors[name].items()) if v},
+                } for name, dist in self.approaches.items()
+            },
+            'firstOrder': [list(pair) for pair in self.fsd],
+            'secondOrder': [list(pair) for pair in self.ssd],
+            'paretoFront': self.pareto,
+            'dominant': self.dominant,
+        }
+
+
+def self_test() -> List[str]:
+    """balance_scorer.KNOWN_VALUES cells whose exact distribution has the wrong mean."""
+    rates = {name: Fraction(str(rate)) for name, rate in DEFAULT_RATES.items()}
+    failures = []
+    for effect, expected in KNOWN_VALUES:
+        value = mean(cell_distribution(effect, rates))
+        if value != Fraction(str(expected)):
+            failures.append(f"{effect!r}: expected {expected:+.2f}, got {float(value):+.2f}")
+    return failures
+
+
+def clamp_level(level: int) -> int:
+    """Party levels covered by the DC and skill-bonus tables."""
+    return max(1, min(20, level))
+
+
+def analyze(table: PlanningTable, level: int, rates: Dict[str, float]) -> List[EventAnalysis]:
+    tables = level_tables()
+    level = clamp_level(level)
+    counts = counts_for(tables['SKILL_BONUS_BY_LEVEL'][level], tables['DC_BY_LEVEL'][level])
+    weights = {outcome: Fraction(count, 20) for outcome, count in zip(OUTCOMES, counts)}
+    exact_rates = {name: Fraction(str(rate)) for name, rate in rates.items()}
+
+    # Identical effect texts ('-1 Unrest') recur across events; convolve each once
+    cells: Dict[str, Tuple[Distribution, Dict[str, Fraction]]] = {}
+
+    results = []
+    for event in table.events():
+        approaches: Dict[str, Distribution] = {}
+        vectors: Dict[str, Dict[str, Fraction]] = {}
+        for row in table.rows_for(event):
+            approach = table.approach[row]
+            if not approach:
+                continue
+            mixture: Distribution = {}
+            vector: Dict[str, Fraction] = {}
+            for outcome in OUTCOMES:
+                effect = table.get(row, EFFECT_COLUMNS[outcome])
+                if effect not in cells:
+                    cells[effect] = (cell_distribution(effect, exact_rates), cell_means(effect))
+                distribution, means = cells[effect]
+                for value, p in distribution.items():
+                    mixture[value] = mixture.get(value, 0) + weights[outcome] * p
+                for resource, delta in means.items():
+                    vector[resource] = vector.get(resource, Fraction(0)) + weights[outcome] * delta
+            approaches[approach] = mixture
+            vectors[approach] = vector
+        if len(approaches) > 1:
+            results.append(EventAnalysis(event, approaches, vectors, exact_rates))
+    return results
+
+
+def text_report(results: List[EventAnalysis], level: int) -> str:
+    lines = []
+    for result in results:
+        data = result.to_dict()
+        means = "  ".join(f"{name} {info['mean']:+.2f} [{info['min']:+.1f}, {info['max']:+.1f}]"
+                          for name, info in data['approaches'].items())
+        lines.append(f"{result.event}: {means}")
+        if result.dominant:
+            lines.append(f"  ⚠️  {result.dominant} dominates every other approach (first order)")
+        else:
+            for a, b in result.fsd:
+                lines.append(f"  ⚠️  {a} ≥ {b} (first order)")
+        for a, b in result.ssd:
+            if (a, b) not in result.fsd:
+                lines.append(f"  ·  {a} ≥ {b} (second order, risk-averse)")
+        if len(result.pareto) < len(result.approaches):
+            lines.append(f"  ·  Pareto front: {', '.join(result.pareto)}")
+
+    dominated = sum(1 for r in results if r.fsd)
+    lines.append(f"\n📊 {len(results)} events at level {level}: {dominated} with a first-order dominated "
+                 f"approach, {sum(1 for r in results if r.dominant)} with a single dominant approach")
+    return "\n".join(lines)
+
+
+def markdown_report(results: List[EventAnalysis], level: int) -> str:
+    lines = [f"## Approach Dominance (party level {level})", "",
+             "| Event | Mean value per approach | First-order dominance | Pareto front |",
+             "|-------|-------------------------|-----------------------|--------------|"]
+    for result in results:
+        data = result.to_dict()
+        means = " / ".join(f"{name} {info['mean']:+.2f}" for name, info in data['approaches'].items())
+        fsd = ", ".join(f"{a} ≥ {b}" for a, b in result.fsd) or "-"
+        lines.append(f"| {result.event} | {means} | {fsd} | {', '.join(result.pareto)} |")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Approach dominance and Pareto analysis")
+    parser.add_argument('--level', type=int, default=5, help="Party level for the outcome odds")
+    parser.add_argument('--table', type=Path, help="Balance CSV (default: docs/planning/EVENT_BALANCE_TABLE.csv)")
+    parser.add_argument('--rate', type=parse_rate, action='append', default=[], help="Override one rate: NAME=VALUE")
+    parser.add_argument('--format', choices=['text', 'json', 'markdown'], default='text')
+    parser.add_argument('--output', type=Path, help="Write the report here instead of stdout")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Check the cell distributions against balance_scorer's known effect values")
+    args = parser.parse_args()
+
+    if args.self_test:
+        failures = self_test()
+        for failure in failures:
+            print(f"❌ {failure}")
+        if failures:
+            sys.exit(1)
+        print(f"✅ {len(KNOWN_VALUES)} known effect values match")
+        return
+
+    rates = dict(DEFAULT_RATES)
+    unknown = [name for name, _ in args.rate if name not in rates]
+    if unknown:
+        print(f"❌ Unknown rate(s): {', '.join(unknown)}")
+        sys.exit(1)
+    rates.update(dict(args.rate))
+
+    level = clamp_level(args.level)
+    if level != args.level:
+        print(f"⚠️  Level {args.level} is outside 1-20; using level {level}", file=sys.stderr)
+
+    table = load_table(str(args.table) if args.table else 'balance')
+    results = analyze(table, level, rates)
+
+    if args.format == 'json':
+        report = json.dumps({'level': level, 'rates': rates,
+                             'events': [r.to_dict() for r in results]}, indent=2)
+    elif args.format == 'markdown':
+        report = markdown_report(results, level)
+    else:
+        report = text_report(results, level)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+        print(f"📁 Report written to: {args.output} ({len(results)} events)")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Streaming analyzer for kingdom saves and simulation dumps.
+
+Kingdom saves (SaveLoadService.ts: {metadata, kingdomData}) and simulation
+dumps (simulation-debug.json) grow with the turn count, mostly in hexes,
+rivers and pipeline state that this analysis never looks at. The files
+are read incrementally: object keys are walked one at a time, the few
+kingdom fields below are kept, and everything else is skipped one
+buffer-sized piece at a time, so memory stays at one read chunk plus one
+turn record whatever the file size (a 92 MB, 60-turn dump peaks at about
+20 MB, against 470 MB for json.load).
+
+Accepted layouts (several can be mixed, plain or .gz):
+- one kingdom or save file per turn (pass them all)
+- a dump holding a list of turn records: a top-level array, or a
+  'turns' / 'history' / 'snapshots' / 'records' array
+- JSON Lines, one turn record per line
+
+A turn record is kingdom data, optionally wrapped in 'kingdomData',
+'kingdom' or 'state'; its turn is 'turn', 'currentTurn' or
+turnState.turnNumber. When several records share a turn, the last one
+wins for the time series.
+
+Outputs (compact JSON, one array per column, in --output-dir):
+- resources.json - per turn: phase, each resource, unrest,
+  imprisonedUnrest, fame, size
+- events.json    - per event / incident id: kind, turns seen, first and
+  last turn (pendingOutcomes, events and unrest phase state)
+- builds.json    - structure build order: turn first seen, settlement,
+  structure (settlement structureIds order within a turn)
+
+Usage:
+    python buildscripts/analyze-saves.py [PATH ...] [--output-dir DIR] [--chunk-size 1048576]
+    python buildscripts/analyze-saves.py                         # simulation-debug.json
+    python buildscripts/analyze-saves.py saves/kingdom-*.json --output-dir save-analysis/campaign
+    python buildscripts/analyze-saves.py --self-test             # chunk-boundary regression check
+"""
+
+import argparse
+import gzip
+import io
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from hex_grid import PROJECT_ROOT, write_json
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+DEFAULT_INPUT = PROJECT_ROOT / "simulation-debug.json"
+OUTPUT_DIR = PROJECT_ROOT / "save-analysis"
+
+CHUNK_SIZE = 1 << 20
+
+# Keys whose value is a list of turn records
+RECORD_LISTS = ('turns', 'history', 'snapshots', 'records')
+# Keys wrapping the kingdom data of one record
+KINGDOM_WRAPPERS = ('kingdomData', 'kingdom', 'state')
+# Kingdom fields decoded per record (everything else is skipped)
+FIELDS = ('turn', 'currentTurn', 'currentPhase', 'resources', 'unrest', 'imprisonedUnrest',
+          'fame', 'size', 'settlements', 'pendingOutcomes', 'events', 'eventId')
+TURN_STATE_FIELDS = ('turnNumber', 'eventsPhase', 'unrestPhase')
+
+SCALAR_SERIES = ('unrest', 'imprisonedUnrest', 'fame', 'size')
+
+_WHITESPACE = re.compile(r'\s*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+class JsonStream:
+    """Incremental reader over a text stream of one or more JSON values."""
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.consumed = 0  # characters dropped from the front of the buffer
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, minimum: int = 0) -> bool:
+        """Drop the consumed prefix and read at least one more chunk."""
+        if self.eof:
+            return False
+        self.consumed += self.pos
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        data = self.f.read(max(self.chunk_size, minimum))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer += data
+        return True
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at character {self.consumed + self.pos}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at the end of the input)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def read_value(self):
+        """Decode the next value, reading more input until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number may continue in the next chunk: '1' out of '1.', '1e' or a bare '1'
+                split_number = (not self.eof and isinstance(value, (int, float)) and not isinstance(value, bool)
+                                and (end >= len(self.buffer) or self.buffer[end] in _NUMBER_CHARS))
+                if not split_number:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    self.pos = e.pos
+                    raise self.error(e.msg) from None
+            self._fill(len(self.buffer))
+
+    def skip_value(self) -> None:
+        """Move past the next value, holding at most one buffer's worth of it."""
+        char = self.peek()
+        if char not in '[{':
+            self.read_value()
+            return
+        try:
+            # Containers that fit in the buffer are decoded and dropped at C speed
+            self.pos = self.decoder.raw_decode(self.buffer, self.pos)[1]
+            return
+        except json.JSONDecodeError:
+            pass
+        if char == '[':
+            for _ in self.iter_array():
+                self.skip_value()
+        else:
+            for _ in self.iter_object():
+                self.skip_value()
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield each key; the caller must read or skip its value."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise self.error("Expected ',' or '}'")
+
+    def iter_array(self) -> Iterator[None]:
+        """Yield once per element; the caller must read or skip it."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield None
+            char = self.peek()
+            self.pos += 1
+            if char == ']':
+                return
+            if char != ',':
+                raise self.error("Expected ',' or ']'")
+
+
+def read_selected(stream: JsonStream, fields: Tuple[str, ...]) -> Dict:
+    """Decode only the given keys of the next object."""
+    selected = {}
+    for key in stream.iter_object():
+        if key in fields:
+            selected[key] = stream.read_value()
+        else:
+            stream.skip_value()
+    return selected
+
+
+def read_fields(stream: JsonStream, record: Dict) -> Iterator[Dict]:
+    """Fill `record` from the next object, yielding any nested turn records."""
+    for key in stream.iter_object():
+        char = stream.peek()
+        if key in RECORD_LISTS and char == '[':
+            yield from read_records(stream)
+        elif key in KINGDOM_WRAPPERS and char == '{':
+            yield from read_fields(stream, record)
+        elif key == 'turnState' and char == '{':
+            record['turnState'] = read_selected(stream, TURN_STATE_FIELDS)
+        elif key in FIELDS:
+            record[key] = stream.read_value()
+        else:
+            stream.skip_value()
+
+
+def read_records(stream: JsonStream) -> Iterator[Dict]:
+    """Yield the selected kingdom fields of every turn record in the next value."""
+    char = stream.peek()
+    if char == '[':
+        for _ in stream.iter_array():
+            yield from read_records(stream)
+    elif char == '{':
+        record: Dict = {}
+        yield from read_fields(stream, record)
+        if record:
+            yield record
+    else:
+        stream.skip_value()
+
+
+def record_turn(record: Dict) -> Optional[int]:
+    for turn in (record.get('turn'), record.get('currentTurn'),
+                 (record.get('turnState') or {}).get('turnNumber')):
+        if isinstance(turn, int):
+            return turn
+    return None
+
+
+def record_checks(record: Dict) -> Iterator[Tuple[str, str]]:
+    """(kind, id) of every event and incident mentioned by a record."""
+    for outcome in record.get('pendingOutcomes') or []:
+        if outcome.get('checkType') in ('event', 'incident') and outcome.get('checkId'):
+            yield outcome['checkType'], outcome['checkId']
+    turn_state = record.get('turnState') or {}
+    events_phase = turn_state.get('eventsPhase') or {}
+    if events_phase.get('eventId'):
+        yield 'event', events_phase['eventId']
+    for applied in events_phase.get('appliedOutcomes') or []:
+        if applied.get('eventId'):
+            yield 'event', applied['eventId']
+    incident = (turn_state.get('unrestPhase') or {}).get('incidentId')
+    if incident:
+        yield 'incident', incident
+    # Simulation dumps may log events directly on the record
+    for event in record.get('events') or []:
+        event_id = event if isinstance(event, str) else (event or {}).get('id') or (event or {}).get('eventId')
+        if event_id:
+            yield 'event', event_id
+    if isinstance(record.get('eventId'), str):
+        yield 'event', record['eventId']
+
+
+class CampaignSeries:
+    """Per-turn aggregates folded from turn records in any order."""
+
+    def __init__(self):
+        self.turns: Dict[int, Dict] = {}
+        self.checks: Dict[Tuple[str, str], set] = {}
+        self.builds: List[Tuple[int, int, str, str]] = []  # (turn, sequence, settlement, structure)
+        self.first_built: Dict[Tuple[str, str], int] = {}
+        self.records = 0
+        self.skipped = 0
+
+    def add(self, record: Dict) -> None:
+        turn = record_turn(record)
+        if turn is None:
+            self.skipped += 1
+            return
+        self.records += 1
+
+        row = self.turns.setdefault(turn, {})
+        if record.get('currentPhase'):
+            row['phase'] = record['currentPhase']
+        if isinstance(record.get('resources'), dict):
+            row['resources'] = record['resources']
+        for name in SCALAR_SERIES:
+            if isinstance(record.get(name), (int, float)):
+                row[name] = record[name]
+
+        for check in record_checks(record):
+            self.checks.setdefault(check, set()).add(turn)
+
+        for settlement in record.get('settlements') or []:
+            name = settlement.get('name') or settlement.get('id') or '?'
+            for structure in settlement.get('structureIds') or []:
+                key = (settlement.get('id') or name, structure)
+                index = self.first_built.get(key)
+                if index is None:
+                    self.first_built[key] = len(self.builds)
+                    self.builds.append((turn, len(self.builds), name, structure))
+                elif turn < self.builds[index][0]:
+                    # Files may arrive out of turn order
+                    self.builds[index] = (turn,) + self.builds[index][1:]
+
+    def resource_columns(self) -> Dict[str, List]:
+        turns = sorted(self.turns)
+        resources = sorted({r for row in self.turns.values() for r in row.get('resources', {})})
+        columns: Dict[str, List] = {'turn': turns, 'phase': [self.turns[t].get('phase') for t in turns]}
+        for resource in resources:
+            columns[resource] = [self.turns[t].get('resources', {}).get(resource) for t in turns]
+        for name in SCALAR_SERIES:
+            columns[name] = [self.turns[t].get(name) for t in turns]
+        return columns
+
+    def event_columns(self) -> Dict[str, List]:
+        ordered = sorted(self.checks.items(), key=lambda item: (-len(item[1]), item[0]))
+        return {
+            'kind': [kind for (kind, _), _ in ordered],
+            'id': [check_id for (_, check_id), _ in ordered],
+            'turns': [len(turns) for _, turns in ordered],
+            'firstTurn': [min(turns) for _, turns in ordered],
+            'lastTurn': [max(turns) for _, turns in ordered],
+        }
+
+    def build_columns(self) -> Dict[str, List]:
+        ordered = sorted(self.builds)
+        return {
+            'turn': [turn for turn, _, _, _ in ordered],
+            'settlement': [settlement for _, _, settlement, _ in ordered],
+            'structure': [structure for _, _, _, structure in ordered],
+        }
+
+
+def open_input(path: Path):
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def analyze(paths: List[Path], chunk_size: int = CHUNK_SIZE) -> Tuple[CampaignSeries, int]:
+    """Fold every record of every file; returns (series, characters read)."""
+    series = CampaignSeries()
+    characters = 0
+    for path in paths:
+        with open_input(path) as f:
+            stream = JsonStream(f, chunk_size)
+            # JSON Lines and concatenated documents are a sequence of top-level values
+            while stream.peek():
+                for record in read_records(stream):
+                    series.add(record)
+            characters += stream.consumed + stream.pos
+    return series, characters
+
+
+# Exercises every split point: numbers in all their forms, escapes, and
+# skipped containers both small and larger than a chunk
+SELF_TEST_DOCUMENT = json.dumps({
+    'config': {'seed': 7, 'ratios': [0.5, -0.0, 1e-3, 2.5E+10, -17]},
+    'turns': [{
+        'turn': turn,
+        'state': {
+            'currentTurn': turn,
+            'resources': {'gold': 1.5 * turn, 'food': -turn, 'lumber': 10 ** turn, 'ore': 3e-2},
+            'unrest': turn % 3, 'fame': 0.0, 'size': 100 + turn,
+            'hexes': [{'id': f"{row}.{col}", 'note': 'q"uo\\te \u00e9', 'v': [1.25, -2e5, True, None]}
+                      for row in range(turn) for col in range(6)],
+            'settlements': [{'id': 's1', 'name': 'Capit\u00e1l', 'structureIds': ['shrine', 'market'][:turn]}],
+            'pendingOutcomes': [{'checkType': 'event', 'checkId': f"event-{turn % 2}", 'checkData': {'dc': 15.0}}],
+        },
+    } for turn in range(1, 6)],
+}) + "\n" + json.dumps({'turn': 6, 'unrest': 12345678901234567890, 'eventId': 'tail'})
+
+SELF_TEST_CHUNK_SIZES = list(range(1, 65)) + [100, 257, 1000, 4096, CHUNK_SIZE]
+
+
+def self_test() -> List[str]:
+    """Decode SELF_TEST_DOCUMENT at many chunk sizes; returns the failures."""
+    values = [json.loads(line) for line in SELF_TEST_DOCUMENT.splitlines()]
+    expected = None
+    failures = []
+    for chunk_size in SELF_TEST_CHUNK_SIZES:
+        try:
+            stream = JsonStream(io.StringIO(SELF_TEST_DOCUMENT), chunk_size)
+            decoded = [stream.read_value(), stream.read_value()]
+            stream = JsonStream(io.StringIO(SELF_TEST_DOCUMENT), chunk_size)
+            stream.skip_value()
+            records = list(read_records(stream)) + [None]
+            stream = JsonStream(io.StringIO(SELF_TEST_DOCUMENT), chunk_size)
+            while stream.peek():
+                records.extend(read_records(stream))
+        except ValueError as e:
+            failures.append(f"chunk size {chunk_size}: {e}")
+            continue
+        if decoded != values:
+            failures.append(f"chunk size {chunk_size}: read_value differs from json.loads")
+        expected = records if expected is None else expected
+        if records != expected:
+            failures.append(f"chunk size {chunk_size}: records differ from chunk size 1")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming analyzer for kingdom saves and simulation dumps")
+    parser.add_argument('paths', nargs='*', type=Path, help="Saves or dumps (default: simulation-debug.json)")
+    parser.add_argument('--output-dir', type=Path, help="Output directory (default: save-analysis/<first input>)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Characters read per chunk")
+    parser.add_argument('--self-test', action='store_true',
+                        help="Check the stream reader against json.loads at many chunk sizes and exit")
+    args = parser.parse_args()
+
+    if args.self_test:
+        failures = self_test()
+        for failure in failures:
+            print(f"❌ {failure}")
+        if failures:
+            sys.exit(1)
+        print(f"✅ Stream reader matches json.loads at {len(SELF_TEST_CHUNK_SIZES)} chunk sizes")
+        return
+
+    paths = args.paths or [DEFAULT_INPUT]
+    missing = [path for path in paths if not path.exists()]
+    if missing:
+        for path in missing:
+            target = f" (links to {path.readlink()})" if path.is_symlink() else ""
+            print(f"❌ Not found: {path}{target}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    try:
+        series, characters = analyze(paths, args.chunk_size)
+    except ValueError as e:
+        print(f"❌ Could not parse input: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    stem = paths[0].name.split('.')[0]
+    output_dir = args.output_dir or OUTPUT_DIR / stem
+    sizes = {
+        'resources.json': write_json(output_dir / 'resources.json', series.resource_columns(), indent=None),
+        'events.json': write_json(output_dir / 'events.json', series.event_columns(), indent=None),
+        'builds.json': write_json(output_dir / 'builds.json', series.build_columns(), indent=None),
+    }
+
+    print(f"📊 {series.records} records over {len(series.turns)} turns from {len(paths)} file(s) "
+          f"({characters / 1e6:.1f}M characters in {elapsed:.1f}s)")
+    if series.skipped:
+        print(f"⚠️  {series.skipped} record(s) without a turn number were skipped")
+    events = series.event_columns()
+    if events['id']:
+        top = ", ".join(f"{check_id} ({turns})" for check_id, turns in zip(events['id'][:5], events['turns'][:5]))
+        print(f"  most frequent: {top}")
+    print(f"  {len(series.builds)} structures built")
+    for name, size in sizes.items():
+        print(f"📁 {output_dir / name} ({size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Audit image assets under src/img for duplicates, dead weight and size.
+
+1. Hashes every file under src/img (SHA-256) to find byte-identical copies
+2. Computes a 64-bit difference hash per image to find near-identical images
+   (needs Pillow; skipped with a warning when it isn't installed)
+3. Collects image references in src/**/*.ts, .svelte, .css and .js:
+   - imports:  import x from '../img/map_icons/foo.webp'
+   - globs:    import.meta.glob('../img/events/*.webp')
+   - templates: `../img/events/${eventId}.webp` (treated as a glob)
+   and lists assets that nothing references
+4. Flags files over the per-file size limit and totals bytes per directory
+
+Writes a machine-readable JSON report (default: asset-report.json in the
+project root) and prints a summary.
+
+Usage:
+    python buildscripts/audit-assets.py [--output PATH] [--max-file-kb N] [--near-distance N]
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+IMG_DIR = SRC_DIR / "img"
+DEFAULT_OUTPUT = PROJECT_ROOT / "asset-report.json"
+
+IMAGE_SUFFIXES = {'.webp', '.png', '.jpg', '.jpeg', '.gif', '.svg'}
+
+# Any quoted or template string containing an img/ path segment
+REFERENCE_PATTERN = re.compile(r"""(['"`])([^'"`\n]*\bimg/[^'"`\n]*)\1""")
+TEMPLATE_EXPR = re.compile(r"\$\{[^}]*\}")
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def difference_hash(path: Path) -> Optional[int]:
+    """64-bit dHash of an image (None if it can't be decoded)."""
+    try:
+        with Image.open(path) as image:
+            small = image.convert('L').resize((9, 8), Image.LANCZOS)
+            pixels = small.tobytes()
+    except Exception:
+        return None
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
+
+def collect_references() -> Dict[str, List[str]]:
+    """
+    Map each reference pattern (relative to src/, may contain globs) to the
+    source files it appears in.
+    """
+    references: Dict[str, List[str]] = defaultdict(list)
+    for pattern in ('*.ts', '*.svelte', '*.css', '*.js'):
+        for source in SRC_DIR.rglob(pattern):
+            try:
+                content = source.read_text(encoding='utf-8')
+            except (UnicodeDecodeError, OSError):
+                continue
+            for match in REFERENCE_PATTERN.finditer(content):
+                reference = TEMPLATE_EXPR.sub('*', match.group(2)).split('?')[0]
+                if reference.startswith('.'):
+                    resolved = os.path.normpath(source.parent / reference)
+                    try:
+                        reference = Path(resolved).relative_to(SRC_DIR).as_posix()
+                    except ValueError:
+                        continue
+                else:
+                    # Module-absolute paths like modules/pf2e-reignmaker/img/...
+                    reference = 'img/' + reference.split('img/', 1)[1]
+                references[reference].append(source.relative_to(PROJECT_ROOT).as_posix())
+    return references
+
+
+def is_referenced(relative: str, references: Dict[str, List[str]]) -> bool:
+    """True if any reference pattern matches the asset path (relative to src/)."""
+    for pattern in references:
+        if pattern == relative:
+            return True
+        if '*' in pattern and fnmatch.fnmatchcase(relative, pattern.replace('**/', '*')):
+            return True
+    return False
+
+
+def near_duplicate_groups(hashes: Dict[str, int], max_distance: int) -> List[List[str]]:
+    """Group images whose dHashes are within max_distance bits (union of pairs)."""
+    paths = sorted(hashes)
+    parent = {p: p for p in paths}
+
+    def find(p):
+        while parent[p] != p:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    for i, a in enumerate(paths):
+        for b in paths[i + 1:]:
+            if bin(hashes[a] ^ hashes[b]).count('1') <= max_distance:
+                parent[find(b)] = find(a)
+
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for p in paths:
+        groups[find(p)].append(p)
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def audit(max_file_bytes: int, near_distance: int) -> Dict:
+    """Build the asset report."""
+    references = collect_references()
+    files = []
+    by_hash: Dict[str, List[str]] = defaultdict(list)
+    dhashes: Dict[str, int] = {}
+    directory_bytes: Dict[str, int] = defaultdict(int)
+
+    for path in sorted(p for p in IMG_DIR.rglob('*') if p.is_file()):
+        relative = path.relative_to(SRC_DIR).as_posix()
+        size = path.stat().st_size
+        digest = file_hash(path)
+        referenced = is_referenced(relative, references)
+        files.append({
+            'path': relative,
+            'bytes': size,
+            'sha256': digest,
+            'referenced': referenced,
+        })
+        by_hash[digest].append(relative)
+        directory_bytes[path.parent.relative_to(SRC_DIR).as_posix()] += size
+        if Image is not None and path.suffix.lower() in IMAGE_SUFFIXES - {'.svg'}:
+            value = difference_hash(path)
+            if value is not None:
+                dhashes[relative] = value
+
+    sizes = {f['path']: f['bytes'] for f in files}
+    duplicates = [sorted(paths) for paths in by_hash.values() if len(paths) > 1]
+    exact = {p for group in duplicates for p in group}
+    near = [
+        group for group in near_duplicate_groups(dhashes, near_distance)
+        if not set(group) <= exact
+    ] if Image is not None else None
+
+    unreferenced = [f['path'] for f in files if not f['referenced']]
+    oversized = [f['path'] for f in files if f['bytes'] > max_file_bytes]
+    total = sum(sizes.values())
+
+    return {
+        'summary': {
+            'files': len(files),
+            'totalBytes': total,
+            'referencedBytes': sum(f['bytes'] for f in files if f['referenced']),
+            'unreferencedBytes': sum(sizes[p] for p in unreferenced),
+            'duplicateBytes': sum(sum(sizes[p] for p in group[1:]) for group in duplicates),
+            'oversizedBytes': sum(sizes[p] for p in oversized),
+            'maxFileBytes': max_file_bytes,
+        },
+        'directories': dict(sorted(directory_bytes.items())),
+        'duplicates': duplicates,
+        'nearDuplicates': near,
+        'unreferenced': unreferenced,
+        'oversized': oversized,
+        'references': {k: sorted(set(v)) for k, v in sorted(references.items())},
+        'files': files,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit src/img assets")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--max-file-kb', type=int, default=1024,
+                        help="Flag files larger than this (default 1024 KB)")
+    parser.add_argument('--near-distance', type=int, default=4,
+                        help="Max differing dHash bits for near-duplicates (default 4)")
+    args = parser.parse_args()
+
+    print("🔍 Auditing assets in src/img...\n")
+    report = audit(args.max_file_kb * 1024, args.near_distance)
+    summary = report['summary']
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    mb = lambda n: f"{n / 1024 / 1024:.1f} MB"
+    print(f"📊 {summary['files']} files, {mb(summary['totalBytes'])} total")
+    for directory, size in sorted(report['directories'].items(), key=lambda kv: -kv[1]):
+        print(f"   {directory:40s} {mb(size)}")
+
+    print(f"\n♻️  Exact duplicates: {len(report['duplicates'])} groups ({mb(summary['duplicateBytes'])} redundant)")
+    for group in report['duplicates']:
+        print(f"   • {', '.join(group)}")
+
+    if report['nearDuplicates'] is None:
+        print("\n⚠️  Pillow not installed - near-duplicate check skipped (pip install Pillow)")
+    else:
+        print(f"\n🪞 Near duplicates: {len(report['nearDuplicates'])} groups")
+        for group in report['nearDuplicates']:
+            print(f"   • {', '.join(group)}")
+
+    print(f"\n🗑️  Unreferenced: {len(report['unreferenced'])} files ({mb(summary['unreferencedBytes'])})")
+    for path in report['unreferenced']:
+        print(f"   • {path}")
+
+    print(f"\n🐘 Over {args.max_file_kb} KB: {len(report['oversized'])} files ({mb(summary['oversizedBytes'])})")
+    print(f"\n📁 Report written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Two-way sync between the planning tables and the event pipelines.
+
+Both sides are loaded into one in-memory model, keyed by
+"<event-file>/<Approach>/<field>":
+
+    Field               Table side                              Pipeline side
+    label               EVENT_BALANCE_TABLE.csv "Approach       strategicChoice option label
+                        Descriptor" (also EVENT_SKILLS_TABLE)
+    skills              EVENT_SKILLS_TABLE.csv "Skills"         option skills (minus 'applicable lore')
+    text.<outcome>      EVENT_SKILLS_TABLE.csv "CS Text", ...   option outcomeDescriptions.<outcome>
+    badges.<outcome>    balance-table-parsed.json badges        option outcomeBadges.<outcome>
+
+Each field is compared three ways against the last synced snapshot
+(docs/planning/balance-sync-snapshot.json):
+
+- table == pipeline           → in sync
+- only the pipeline changed   → written to the table
+- only the table changed      → written to the pipeline
+- both changed differently    → conflict, reported and left alone
+                                 (unless --prefer table|pipeline)
+
+--init-snapshot records the current state without writing anything:
+agreeing fields store their value, differing fields store both sides.
+A recorded difference is left alone until one side is edited, and that
+edit then flows to the other side.
+
+Every source is read and parsed once. Writes are span edits: only the
+changed CSV cells and pipeline values are touched, and each file is
+written at most once. Every new text is built and every edited pipeline
+file re-parsed before anything is written; if one fails, nothing is
+written. Files are then written to temp files and renamed into place,
+and the snapshot is saved last.
+Without a snapshot, every differing field is a conflict. The "//"
+comment entries of balance-table-parsed.json badges are not synced and
+keep their positions when the badges are written.
+
+Usage:
+    python buildscripts/balance-sync.py [--dry-run] [--prefer table|pipeline]
+    python buildscripts/balance-sync.py --init-snapshot
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from planning_tables import event_slug
+from ts_source import ArrayLiteral, ObjectLiteral, apply_edits, line_indent, parse_source, quote, verify_parses
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PLANNING_DIR = PROJECT_ROOT / "docs" / "planning"
+EVENTS_DIR = PROJECT_ROOT / "src" / "pipelines" / "events"
+BALANCE_CSV = PLANNING_DIR / "EVENT_BALANCE_TABLE.csv"
+SKILLS_CSV = PLANNING_DIR / "EVENT_SKILLS_TABLE.csv"
+PARSED_JSON = PLANNING_DIR / "balance-table-parsed.json"
+SNAPSHOT_FILE = PLANNING_DIR / "balance-sync-snapshot.json"
+SNAPSHOT_VERSION = 1
+
+APPROACH_IDS = {
+    'Virtuous': ('idealist', 'virtuous'),
+    'Practical': ('practical',),
+    'Ruthless': ('ruthless',),
+}
+OUTCOMES = ['criticalSuccess', 'success', 'failure', 'criticalFailure']
+TEXT_COLUMNS = {'criticalSuccess': 'CS Text', 'success': 'S Text', 'failure': 'F Text', 'criticalFailure': 'CF Text'}
+LORE = 'applicable lore'
+
+Value = object  # str or list of str
+Edit = Tuple[int, int, str]
+
+
+# ----------------------------------------------------------------------
+# CSV with cell spans
+# ----------------------------------------------------------------------
+
+class CsvCell:
+    __slots__ = ('value', 'start', 'end', 'quoted')
+
+    def __init__(self, value: str, start: int, end: int, quoted: bool):
+        self.value = value
+        self.start = start
+        self.end = end
+        self.quoted = quoted
+
+
+def read_csv_cells(text: str) -> List[List[CsvCell]]:
+    """Parse CSV text keeping each cell's raw span, so cells can be edited in place."""
+    rows: List[List[CsvCell]] = []
+    row: List[CsvCell] = []
+    i, length = 0, len(text)
+    while i < length:
+        start = i
+        if text[i] == '"':
+            i += 1
+            parts = []
+            while i < length:
+                if text[i] == '"':
+                    if text.startswith('""', i):
+                        parts.append('"')
+                        i += 2
+                        continue
+                    i += 1
+                    break
+                parts.append(text[i])
+                i += 1
+            row.append(CsvCell(''.join(parts), start, i, True))
+        else:
+            while i < length and text[i] not in ',\r\n':
+                i += 1
+            row.append(CsvCell(text[start:i], start, i, False))
+
+        if i < length and text[i] == ',':
+            i += 1
+            if i == length or text[i] in '\r\n':
+                row.append(CsvCell('', i, i, False))
+            continue
+        if text.startswith('\r\n', i):
+            i += 2
+        elif i < length:
+            i += 1
+        rows.append(row)
+        row = []
+    if row:
+        rows.append(row)
+    return rows
+
+
+def encode_csv_cell(value: str, quoted: bool) -> str:
+    if quoted or any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class CsvTable:
+    """A CSV file as header + rows of cells, grouped into (event, approach) records."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            self.text = f.read()
+        rows = read_csv_cells(self.text)
+        self.header = [c.value for c in rows[0]]
+        self.records: Dict[Tuple[str, str], Dict[str, CsvCell]] = {}
+        self.edits: List[Edit] = []
+
+        current_event = None
+        for cells in rows[1:]:
+            record = dict(zip(self.header, cells))
+            name = record['Name'].value.strip() if 'Name' in record else ''
+            if name:
+                current_event = event_slug(name)
+            approach = record['Approach'].value.strip() if 'Approach' in record else ''
+            if current_event and approach:
+                self.records[(current_event, approach)] = record
+
+    def get(self, event: str, approach: str, column: str) -> Optional[str]:
+        cell = self.records.get((event, approach), {}).get(column)
+        return cell.value if cell is not None else None
+
+    def set(self, event: str, approach: str, column: str, value: str) -> bool:
+        cell = self.records.get((event, approach), {}).get(column)
+        if cell is None or cell.value == value:
+            return False
+        self.edits.append((cell.start, cell.end, encode_csv_cell(value, cell.quoted)))
+        cell.value = value
+        return True
+
+    def render(self) -> Optional[Tuple[Path, str]]:
+        if not self.edits:
+            return None
+        return self.path, apply_edits(self.text, self.edits)
+
+
+# ----------------------------------------------------------------------
+# Table side
+# ----------------------------------------------------------------------
+
+def split_skills(value: str) -> List[str]:
+    return [s.strip() for s in value.split(',') if s.strip() and s.strip() != LORE]
+
+
+def is_comment(badge: str) -> bool:
+    return badge.startswith('//')
+
+
+def merge_comments(existing: List[str], badges: List[str]) -> List[str]:
+    """New badges with the existing '//' comment entries back at their positions."""
+    merged = list(badges)
+    for position, badge in enumerate(existing):
+        if is_comment(badge):
+            merged.insert(min(position, len(merged)), badge)
+    return merged
+
+
+class TableSide:
+    def __init__(self):
+        self.balance = CsvTable(BALANCE_CSV)
+        self.skills = CsvTable(SKILLS_CSV)
+        with open(PARSED_JSON, 'r', encoding='utf-8') as f:
+            self.parsed = json.load(f)
+        self.parsed_by_file = {e['file']: e for e in self.parsed.values()}
+        self.parsed_changed = False
+
+    def keys(self) -> List[Tuple[str, str]]:
+        return sorted(set(self.balance.records) | set(self.skills.records))
+
+    def values(self) -> Dict[str, Value]:
+        model: Dict[str, Value] = {}
+        for event, approach in self.keys():
+            prefix = f"{event}/{approach}/"
+            label = self.balance.get(event, approach, 'Approach Descriptor')
+            if label is None:
+                label = self.skills.get(event, approach, 'Approach Descriptor')
+            if label is not None:
+                model[prefix + 'label'] = label.strip()
+            skills = self.skills.get(event, approach, 'Skills')
+            if skills is not None:
+                model[prefix + 'skills'] = split_skills(skills)
+            for outcome, column in TEXT_COLUMNS.items():
+                text = self.skills.get(event, approach, column)
+                if text:
+                    model[f"{prefix}text.{outcome}"] = text
+            parsed = self.parsed_by_file.get(event, {}).get('approaches', {}).get(approach)
+            if parsed is not None:
+                for outcome in OUTCOMES:
+                    badges = [b for b in parsed[outcome]['badges'] if not is_comment(b)]
+                    model[f"{prefix}badges.{outcome}"] = badges
+        return model
+
+    def write(self, key: str, value: Value) -> None:
+        event, approach, field = key.split('/')
+        if field == 'label':
+            self.balance.set(event, approach, 'Approach Descriptor', value)
+            self.skills.set(event, approach, 'Approach Descriptor', value)
+            parsed = self.parsed_by_file.get(event, {}).get('approaches', {}).get(approach)
+            if parsed is not None and parsed['name'] != value:
+                parsed['name'] = value
+                self.parsed_changed = True
+        elif field == 'skills':
+            self.skills.set(event, approach, 'Skills', ', '.join(value))
+            self.skills.set(event, approach, 'Skill Count', str(len(value)))
+        elif field.startswith('text.'):
+            self.skills.set(event, approach, TEXT_COLUMNS[field[5:]], value)
+        elif field.startswith('badges.'):
+            outcome = self.parsed_by_file[event]['approaches'][approach][field[7:]]
+            outcome['badges'] = merge_comments(outcome['badges'], value)
+            self.parsed_changed = True
+
+    def render(self) -> List[Tuple[Path, str]]:
+        outputs = [t.render() for t in (self.balance, self.skills)]
+        if self.parsed_changed:
+            outputs.append((PARSED_JSON, json.dumps(self.parsed, indent=2)))
+        return [o for o in outputs if o is not None]
+
+
+# ----------------------------------------------------------------------
+# Pipeline side
+# ----------------------------------------------------------------------
+
+def element_code(node) -> str:
+    """Badge call as a single line, e.g. "valueBadge('Gain {{value}} Gold', ...)"."""
+    return re.sub(r'\s*\n\s*', ' ', node.text)
+
+
+def format_badge_array(badges: List[str], indent: int) -> str:
+    if not badges:
+        return "[]"
+    pad = " " * indent
+    body = ",\n".join(f"{pad}  {badge}" for badge in badges)
+    return f"[\n{body}\n{pad}]"
+
+
+class PipelineFile:
+    def __init__(self, event: str, path: Path):
+        self.event = event
+        self.path = path
+        self.text = path.read_text(encoding='utf-8')
+        pipeline = parse_source(self.text).exported_object()
+        options = pipeline.get_path('strategicChoice.options') if pipeline is not None else None
+        self.options: Dict[str, ObjectLiteral] = {}
+        if isinstance(options, ArrayLiteral):
+            for option in options.elements:
+                option_id = option.get('id') if isinstance(option, ObjectLiteral) else None
+                option_id = option_id.string_value() if option_id is not None else None
+                for approach, ids in APPROACH_IDS.items():
+                    if option_id in ids:
+                        self.options[approach] = option
+        self.edits: List[Edit] = []
+
+    def values(self) -> Dict[str, Value]:
+        model: Dict[str, Value] = {}
+        for approach, option in self.options.items():
+            prefix = f"{self.event}/{approach}/"
+            label = option.get('label')
+            if label is not None and label.string_value() is not None:
+                model[prefix + 'label'] = label.string_value()
+            skills = option.get('skills')
+            if isinstance(skills, ArrayLiteral):
+                names = [e.string_value() for e in skills.elements]
+                model[prefix + 'skills'] = [s for s in names if s and s != LORE]
+            descriptions = option.get('outcomeDescriptions')
+            badges = option.get('outcomeBadges')
+            for outcome in OUTCOMES:
+                if isinstance(descriptions, ObjectLiteral):
+                    text = descriptions.get(outcome)
+                    if text is not None and text.string_value() is not None:
+                        model[f"{prefix}text.{outcome}"] = text.string_value()
+                if isinstance(badges, ObjectLiteral) and isinstance(badges.get(outcome), ArrayLiteral):
+                    model[f"{prefix}badges.{outcome}"] = [element_code(e) for e in badges.get(outcome).elements]
+        return model
+
+    def write(self, key: str, value: Value) -> None:
+        _, approach, field = key.split('/')
+        option = self.options[approach]
+        if field == 'label':
+            node = option.get('label')
+            self.edits.append((node.start, node.end, quote(value)))
+        elif field == 'skills':
+            node = option.get('skills')
+            had_lore = any(e.string_value() == LORE for e in node.elements)
+            names = list(value) + ([LORE] if had_lore else [])
+            self.edits.append((node.start, node.end, '[' + ', '.join(quote(s) for s in names) + ']'))
+        elif field.startswith('text.'):
+            node = option.get('outcomeDescriptions').get(field[5:])
+            self.edits.append((node.start, node.end, quote(value)))
+        elif field.startswith('badges.'):
+            badges = option.get('outcomeBadges')
+            prop = badges.get_property(field[7:])
+            indent = len(line_indent(self.text, prop.key_start))
+            self.edits.append((prop.value.start, prop.value.end, format_badge_array(value, indent)))
+
+    def render(self) -> Optional[Tuple[Path, str]]:
+        if not self.edits:
+            return None
+        new_text = apply_edits(self.text, self.edits)
+        error = verify_parses(new_text)
+        if error:
+            raise ValueError(f"{self.path.name}: edited file does not parse ({error})")
+        return self.path, new_text
+
+
+def write_files(outputs: List[Tuple[Path, str]]) -> None:
+    """Write every text to a temp file next to its target, then rename them all into place."""
+    temps: List[Tuple[Path, Path]] = []
+    try:
+        for path, text in outputs:
+            temp = path.with_name(path.name + '.tmp')
+            with open(temp, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            temps.append((temp, path))
+    except OSError:
+        for temp, _ in temps:
+            temp.unlink(missing_ok=True)
+        raise
+    for temp, path in temps:
+        os.replace(temp, path)
+
+
+# ----------------------------------------------------------------------
+# Three-way merge
+# ----------------------------------------------------------------------
+
+def load_snapshot() -> Dict[str, Value]:
+    if not SNAPSHOT_FILE.exists():
+        return {}
+    with open(SNAPSHOT_FILE, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    return snapshot.get('fields', {}) if snapshot.get('version') == SNAPSHOT_VERSION else {}
+
+
+def save_snapshot(fields: Dict[str, Value]) -> None:
+    text = json.dumps({'version': SNAPSHOT_VERSION, 'fields': dict(sorted(fields.items()))}, indent=2)
+    write_files([(SNAPSHOT_FILE, text + '\n')])
+
+
+def three_way(table: Dict[str, Value], pipeline: Dict[str, Value], base: Dict[str, Value],
+              prefer: Optional[str]) -> Dict[str, List]:
+    """
+    Classify every field present on both sides.
+
+    A base recorded by --init-snapshot for a differing field holds both
+    sides ({'table': ..., 'pipeline': ...}); while neither side moves the
+    field stays 'diverged'.
+    """
+    plan = {'in_sync': [], 'to_table': [], 'to_pipeline': [], 'diverged': [], 'conflicts': []}
+    for key in sorted(set(table) & set(pipeline)):
+        t, p, b = table[key], pipeline[key], base.get(key)
+        if isinstance(b, dict):
+            base_t, base_p = b.get('table'), b.get('pipeline')
+        else:
+            base_t = base_p = b
+        if t == p:
+            plan['in_sync'].append(key)
+        elif isinstance(b, dict) and t == base_t and p == base_p:
+            plan['diverged'].append(key)
+        elif b is not None and t == base_t:
+            plan['to_table'].append(key)
+        elif b is not None and p == base_p:
+            plan['to_pipeline'].append(key)
+        elif prefer == 'table':
+            plan['to_pipeline'].append(key)
+        elif prefer == 'pipeline':
+            plan['to_table'].append(key)
+        else:
+            plan['conflicts'].append(key)
+    return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Two-way sync of planning tables and event pipelines")
+    parser.add_argument('--dry-run', action='store_true')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--prefer', choices=['table', 'pipeline'],
+                      help="Resolve conflicts in favour of one side")
+    mode.add_argument('--init-snapshot', action='store_true',
+                      help="Record the current state of both sides as the snapshot without writing")
+    args = parser.parse_args()
+
+    print("🔄 Balance table ↔ pipeline sync\n")
+    if args.dry_run:
+        print("🔍 DRY RUN MODE - No files will be modified\n")
+
+    table_side = TableSide()
+    pipelines: Dict[str, PipelineFile] = {}
+    for event, _ in table_side.keys():
+        path = EVENTS_DIR / f"{event}.ts"
+        if event not in pipelines and path.exists():
+            pipelines[event] = PipelineFile(event, path)
+
+    table = table_side.values()
+    pipeline: Dict[str, Value] = {}
+    for pipeline_file in pipelines.values():
+        pipeline.update(pipeline_file.values())
+
+    if args.init_snapshot:
+        fields: Dict[str, Value] = {}
+        for key in sorted(set(table) & set(pipeline)):
+            t, p = table[key], pipeline[key]
+            fields[key] = t if t == p else {'table': t, 'pipeline': p}
+        differing = sum(1 for v in fields.values() if isinstance(v, dict))
+        if not args.dry_run:
+            save_snapshot(fields)
+        print(f"📊 {len(fields) - differing} in sync, {differing} differing (recorded as diverged)")
+        print(f"📁 Snapshot {'would be ' if args.dry_run else ''}written to: {SNAPSHOT_FILE}")
+        return
+
+    base = load_snapshot()
+    if not base:
+        print("⚠️  No snapshot found - differing fields are reported as conflicts "
+              "(run with --init-snapshot to record the current state)\n")
+
+    plan = three_way(table, pipeline, base, args.prefer)
+
+    for key in plan['to_pipeline']:
+        pipelines[key.split('/')[0]].write(key, table[key])
+    for key in plan['to_table']:
+        table_side.write(key, pipeline[key])
+
+    # Build and verify every new text before writing any of them
+    try:
+        outputs = table_side.render()
+        outputs += [o for o in (p.render() for p in pipelines.values()) if o is not None]
+    except ValueError as e:
+        print(f"❌ {e}")
+        print("❌ Nothing was written")
+        sys.exit(1)
+    written = [path.name for path, _ in outputs]
+
+    if not args.dry_run:
+        try:
+            write_files(outputs)
+        except OSError as e:
+            print(f"❌ Could not write files: {e}")
+            sys.exit(1)
+
+    for label, keys in (('→ pipeline', plan['to_pipeline']), ('→ table', plan['to_table'])):
+        for key in keys:
+            print(f"  ✓ {label:10s} {key}")
+    for key in plan['conflicts']:
+        print(f"  ⚠️  conflict   {key}")
+        print(f"       table:    {json.dumps(table[key])[:100]}")
+        print(f"       pipeline: {json.dumps(pipeline[key])[:100]}")
+
+    if not args.dry_run:
+        # Everything that now agrees becomes the new base; conflicts keep their old base
+        fields = {k: v for k, v in base.items() if k in plan['conflicts'] or k in plan['diverged']}
+        for key in plan['in_sync'] + plan['to_pipeline']:
+            fields[key] = table[key]
+        for key in plan['to_table']:
+            fields[key] = pipeline[key]
+        save_snapshot(fields)
+
+    print(f"\n📊 {len(plan['in_sync'])} in sync, {len(plan['to_pipeline'])} → pipeline, "
+          f"{len(plan['to_table'])} → table, {len(plan['diverged'])} diverged, "
+          f"{len(plan['conflicts'])} conflicts")
+    print(f"📁 Files {'that would be ' if args.dry_run else ''}written: {len(written)}")
+    for name in written:
+        print(f"   • {name}")
+    if plan['conflicts']:
+        print("\n⚠️  Resolve conflicts by editing one side, or rerun with --prefer table|pipeline")
+
+
+if __name__ == "__main__":
+    main()
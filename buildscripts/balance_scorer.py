@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Score EVENT_BALANCE_TABLE.csv effects against the hand-assigned values.
+
+Every outcome cell (Critical Success / Success / Failure / Critical Failure)
+is parsed with parse_effect() from parse-balance-table.py and turned into
+expected resource deltas - dice count at their mean, game commands at
+their quantity. The deltas form one column array per resource over all
+cells, so a cell's value is a single dot product with the exchange rates:
+
+    value = deltas · rates
+
+The hand values (CS Val / S Val / F Val / CF Val) are on their own scale,
+so by default a single scale factor is fitted (least squares through the
+origin) and a cell is flagged when scale × value drifts from the hand
+value by more than the tolerance. --no-fit compares raw values instead.
+
+Approach expected values weight the four cells by the real roll odds at
+a party level (outcome_odds.py), both for the hand and computed values.
+
+Use from other build scripts:
+
+    from balance_scorer import BalanceScores
+    scores = BalanceScores.load(rates={'fame': 4})
+    scores.drifting(tolerance=2.0)          # cell indexes beyond the tolerance
+    scores.approach_values(level=5)
+
+Usage:
+    python buildscripts/balance_scorer.py [--tolerance 2] [--level 5] [--no-fit]
+                                          [--rates rates.json] [--rate fame=4 ...]
+                                          [--format text|json] [--output PATH]
+    python buildscripts/balance_scorer.py --self-test
+"""
+
+import argparse
+import importlib.util
+import json
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from outcome_odds import OUTCOMES, odds_for_level
+from planning_tables import PlanningTable, load_table
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+EFFECT_COLUMNS = {'criticalSuccess': 'Critical Success', 'success': 'Success',
+                  'failure': 'Failure', 'criticalFailure': 'Critical Failure'}
+VALUE_COLUMNS = {'criticalSuccess': 'CS Val', 'success': 'S Val',
+                 'failure': 'F Val', 'criticalFailure': 'CF Val'}
+
+# Value of one unit of each delta, in gold (docs/planning/EVENT_BALANCE_ANALYSIS.md,
+# "Effect Value Reference")
+DEFAULT_RATES: Dict[str, float] = {
+    'gold': 1.0,
+    'food': 0.8,
+    'resource': 0.7,            # Random resource, lumber, stone, ore, materials
+    'unrest': -1.5,             # Convert X counts here as -X unrest
+    'fame': 2.0,
+    'faction': 1.5,
+    'pardoned': 0.75,           # Pardon 1d3 = 1.5
+    'innocents': -1.5,          # Innocents 1d3 = -3.0
+    'structure': 8.0,
+    'damaged_structure': -8.0,
+    'worksite': 5.0,
+    'hex': 6.0,
+    'fortification': 6.0,
+    'settlement_level': 10.0,
+    'action': 8.0,
+    'army': 1.0,                # ARMY_EFFECTS already holds each condition's value
+}
+
+SPECIFIC_RESOURCES = {'lumber', 'stone', 'ore', 'materials'}
+
+ARMY_EFFECTS = {'well trained': 3, 'equip': 4, 'heal': 3, 'fatigued': -3, 'enfeebled': -3}
+
+# Effect texts with their value at DEFAULT_RATES, checked by --self-test
+KNOWN_VALUES = [
+    ('-1d3 innocents', -3.0),
+    ('+1d3 innocents', -3.0),
+    ('Pardon 1d3', 1.5),
+    ('Convert 1d3', 3.0),
+    ('-1d4 Unrest', 3.75),
+    ('+2 Gold', 2.0),
+    ('Damage 1 structure', -8.0),
+]
+
+# Turns an "Ongoing" effect is assumed to last when the text doesn't say
+ONGOING_TURNS = 3
+
+DICE_FORMULA = re.compile(r'^([+-])?(\d*)d(\d+)([+-]\d+)?$')
+AMOUNT = re.compile(r'([+-])?(\d*d\d+(?:[+-]\d+)?|\d+)')
+
+
+def _load_parse_effect():
+    spec = importlib.util.spec_from_file_location(
+        'parse_balance_table', Path(__file__).parent / 'parse-balance-table.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.parse_effect
+
+
+parse_effect = _load_parse_effect()
+
+
+# A quantity: (sign, dice count, dice sides, bonus); count 0 means a fixed amount
+Roll = Tuple[int, int, int, int]
+# One roll and how much of it lands on each resource ('Lose 1 hex' → hex -1)
+Term = Tuple[Roll, Dict[str, float]]
+
+
+def parse_dice(formula: str) -> Roll:
+    """'-1d4+1' → (-1, 1, 4, 1); the sign applies to the whole roll."""
+    match = DICE_FORMULA.match(formula.strip())
+    if not match:
+        raise ValueError(f"Not a dice formula: {formula!r}")
+    sign, count, sides, bonus = match.groups()
+    return (-1 if sign == '-' else 1), int(count or 1), int(sides), int(bonus or 0)
+
+
+def fixed(value: int) -> Roll:
+    return (-1 if value < 0 else 1), 0, 0, abs(value)
+
+
+def roll_mean(roll: Roll) -> float:
+    sign, count, sides, bonus = roll
+    return sign * (count * (sides + 1) / 2 + bonus)
+
+
+def dice_mean(formula: str) -> float:
+    return roll_mean(parse_dice(formula))
+
+
+def parse_amount(text: str) -> Roll:
+    """Quantity named in a command text ('Convert 1d3+1', '-1d2 innocents'); 1 if none."""
+    match = AMOUNT.search(text)
+    if not match:
+        return fixed(1)
+    sign, value = match.groups()
+    if 'd' in value:
+        return parse_dice((sign or '') + value)
+    return fixed(-int(value) if sign == '-' else int(value))
+
+
+def unsigned(roll: Roll) -> Roll:
+    return (1,) + roll[1:]
+
+
+def amount(text: str) -> float:
+    """Expected quantity named in a command text ('Convert 1d3+1' → 3.0, '-1d2 innocents' → -1.5)."""
+    return roll_mean(parse_amount(text))
+
+
+def command_terms(command: str, text: str) -> List[Term]:
+    """Rolls of one game_command modifier."""
+    lowered = text.lower()
+    quantity = parse_amount(text)
+    if command == 'convert':
+        return [(quantity, {'unrest': -1})]
+    if command == 'pardon':
+        return [(quantity, {'pardoned': 1})]
+    if command == 'innocents':
+        # Always a cost, whether the table writes '1d3' or '-1d3'; the rate carries the sign
+        return [(unsigned(quantity), {'innocents': 1})]
+    if command == 'build_structure':
+        return [(quantity, {'structure': 1})]
+    if command == 'damage_structure':
+        return [(unsigned(quantity), {'damaged_structure': 1})]
+    if command == 'worksite':
+        return [(fixed(1), {'worksite': -1})] if 'lose' in lowered else [(quantity, {'worksite': 1})]
+    if command == 'claim_hex':
+        return [(unsigned(quantity), {'hex': -1 if 'lose' in lowered else 1})]
+    if command == 'fortify_hex':
+        return [(fixed(1), {'fortification': 1})]
+    if command == 'settlement_level':
+        return [(quantity, {'settlement_level': 1})]
+    if command == 'action':
+        return [(fixed(1), {'action': -1 if 'lose' in lowered else 1})]
+    if command == 'army':
+        steps = sum(step for key, step in ARMY_EFFECTS.items() if key in lowered)
+        return [(fixed(1), {'army': steps})] if steps else []
+    if command == 'ongoing':
+        match = re.search(r'(\d+) for (\d+)', text)
+        per_turn, turns = (int(match.group(1)), int(match.group(2))) if match else (1, ONGOING_TURNS)
+        sign = -1 if text.lstrip().startswith('-') else 1
+        for resource in ('gold', 'unrest', 'food', 'fame'):
+            if resource in lowered:
+                return [(fixed(per_turn * turns), {resource: sign})]
+    return []
+
+
+def effect_terms(effect: str) -> List[Term]:
+    """Every roll of one outcome cell with the resources it moves."""
+    terms: List[Term] = []
+    for modifier in parse_effect(effect):
+        if modifier['type'] == 'faction':
+            cell_terms = [(fixed(modifier['value']), {'faction': 1})]
+        elif modifier['type'] == 'static':
+            cell_terms = [(fixed(modifier['value']), {modifier['resource']: 1})]
+        elif modifier['type'] == 'dice':
+            cell_terms = [(parse_dice(modifier['formula']), {modifier['resource']: 1})]
+        else:
+            cell_terms = command_terms(modifier['command'], modifier['text'])
+        for roll, factors in cell_terms:
+            terms.append((roll, {'resource' if r in SPECIFIC_RESOURCES else r: f for r, f in factors.items()}))
+    return terms
+
+
+def effect_deltas(effect: str) -> Dict[str, float]:
+    """Expected resource deltas of one outcome cell."""
+    deltas: Dict[str, float] = {}
+    for roll, factors in effect_terms(effect):
+        mean = roll_mean(roll)
+        for resource, factor in factors.items():
+            deltas[resource] = deltas.get(resource, 0.0) + factor * mean
+    return deltas
+
+
+class BalanceScores:
+    """Per-cell delta columns, computed values and hand values for the balance table."""
+
+    def __init__(self, table: PlanningTable, rates: Optional[Dict[str, float]] = None):
+        self.table = table
+        self.rates = dict(DEFAULT_RATES)
+        unknown = set(rates or {}) - set(DEFAULT_RATES)
+        if unknown:
+            raise ValueError(f"Unknown rate(s): {', '.join(sorted(unknown))}")
+        self.rates.update(rates or {})
+
+        # Cell i is row i // 4, outcome OUTCOMES[i % 4]
+        cells = len(table) * len(OUTCOMES)
+        self.deltas: Dict[str, array] = {name: array('d', bytes(8 * cells)) for name in DEFAULT_RATES}
+        self.hand = array('d', bytes(8 * cells))
+        self.has_hand = bytearray(cells)
+        self.parsed = bytearray(cells)  # 1 where the effect text produced any delta
+
+        for offset, outcome in enumerate(OUTCOMES):
+            effects = table.column(EFFECT_COLUMNS[outcome])
+            values = table.values(VALUE_COLUMNS[outcome])
+            blank = table.blank[VALUE_COLUMNS[outcome]]
+            for row in range(len(table)):
+                cell = row * len(OUTCOMES) + offset
+                for resource, value in effect_deltas(effects[row]).items():
+                    self.deltas[resource][cell] += value
+                    self.parsed[cell] = 1
+                self.hand[cell] = values[row]
+                self.has_hand[cell] = not blank[row]
+
+        self.values = self.score()
+        self.scale = self.fit_scale()
+
+    @classmethod
+    def load(cls, rates: Optional[Dict[str, float]] = None) -> 'BalanceScores':
+        return cls(load_table('balance'), rates)
+
+    def __len__(self) -> int:
+        return len(self.hand)
+
+    def score(self) -> array:
+        """deltas · rates for every cell, one column at a time."""
+        values = array('d', bytes(8 * len(self)))
+        for resource, column in self.deltas.items():
+            rate = self.rates[resource]
+            if rate:
+                values = array('d', [v + d * rate for v, d in zip(values, column)])
+        return values
+
+    def fit_scale(self) -> float:
+        """Least-squares factor mapping computed values onto the hand scale."""
+        dot = sum(v * h for v, h, ok in zip(self.values, self.hand, self.has_hand) if ok)
+        norm = sum(v * v for v, ok in zip(self.values, self.has_hand) if ok)
+        return dot / norm if norm else 1.0
+
+    def drift(self, fit: bool = True) -> array:
+        scale = self.scale if fit else 1.0
+        return array('d', [scale * v - h if ok else 0.0
+                           for v, h, ok in zip(self.values, self.hand, self.has_hand)])
+
+    def drifting(self, tolerance: float, fit: bool = True) -> List[int]:
+        return [cell for cell, d in enumerate(self.drift(fit)) if abs(d) > tolerance]
+
+    # ------------------------------------------------------------------
+    # Cell helpers
+    # ------------------------------------------------------------------
+
+    def cell_row(self, cell: int) -> int:
+        return cell // len(OUTCOMES)
+
+    def cell_outcome(self, cell: int) -> str:
+        return OUTCOMES[cell % len(OUTCOMES)]
+
+    def cell_label(self, cell: int) -> str:
+        row = self.cell_row(cell)
+        return f"{self.table.event[row]} / {self.table.approach[row]} / {self.cell_outcome(cell)}"
+
+    def cell_effect(self, cell: int) -> str:
+        return self.table.get(self.cell_row(cell), EFFECT_COLUMNS[self.cell_outcome(cell)])
+
+    # ------------------------------------------------------------------
+    # Approach expected values
+    # ------------------------------------------------------------------
+
+    def approach_values(self, level: int = 5, fit: bool = True) -> List[Dict]:
+        """Odds-weighted hand and computed value per (event, approach) row."""
+        weights = odds_for_level(level)
+        scale = self.scale if fit else 1.0
+        results = []
+        for row in range(len(self.table)):
+            cells = range(row * len(OUTCOMES), (row + 1) * len(OUTCOMES))
+            results.append({
+                'event': self.table.event[row],
+                'approach': self.table.approach[row],
+                'hand': round(sum(self.hand[c] * weights[self.cell_outcome(c)] for c in cells), 3),
+                'computed': round(sum(scale * self.values[c] * weights[self.cell_outcome(c)] for c in cells), 3),
+            })
+        return results
+
+    def report(self, tolerance: float, level: int, fit: bool = True) -> Dict:
+        drift = self.drift(fit)
+        compared = [d for d, ok in zip(drift, self.has_hand) if ok]
+        return {
+            'rates': self.rates,
+            'scale': round(self.scale if fit else 1.0, 4),
+            'cells': len(self),
+            'unparsed': [self.cell_label(c) for c in range(len(self))
+                         if not self.parsed[c] and self.cell_effect(c).strip()],
+            'rmsDrift': round((sum(d * d for d in compared) / len(compared)) ** 0.5, 3) if compared else 0.0,
+            'tolerance': tolerance,
+            'drifting': [{
+                'event': self.table.event[self.cell_row(c)],
+                'approach': self.table.approach[self.cell_row(c)],
+                'outcome': self.cell_outcome(c),
+                'effect': self.cell_effect(c),
+                'hand': self.hand[c],
+                'computed': round((self.scale if fit else 1.0) * self.values[c], 2),
+                'drift': round(drift[c], 2),
+            } for c in sorted(self.drifting(tolerance, fit), key=lambda c: -abs(drift[c]))],
+            'level': level,
+            'approaches': self.approach_values(level, fit),
+        }
+
+
+def effect_value(effect: str, rates: Optional[Dict[str, float]] = None) -> float:
+    """deltas · rates for one effect text."""
+    rates = {**DEFAULT_RATES, **(rates or {})}
+    return sum(delta * rates[resource] for resource, delta in effect_deltas(effect).items())
+
+
+def self_test() -> List[str]:
+    """Effect texts in KNOWN_VALUES whose value differs; empty when all match."""
+    failures = []
+    for effect, expected in KNOWN_VALUES:
+        value = effect_value(effect)
+        if abs(value - expected) > 1e-9:
+            failures.append(f"{effect!r}: expected {expected:+.2f}, got {value:+.2f}")
+    return failures
+
+
+def parse_rate(value: str) -> Tuple[str, float]:
+    name, _, rate = value.partition('=')
+    try:
+        return name.strip(), float(rate)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected NAME=VALUE, got {value!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score balance table effects against hand values")
+    parser.add_argument('--tolerance', type=float, default=2.0, help="Allowed |drift| per cell")
+    parser.add_argument('--level', type=int, default=5, help="Party level for approach odds")
+    parser.add_argument('--no-fit', action='store_true', help="Compare raw values (no scale fit)")
+    parser.add_argument('--rates', type=Path, help="JSON file of exchange rates")
+    parser.add_argument('--rate', type=parse_rate, action='append', default=[], help="Override one rate: NAME=VALUE")
+    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    parser.add_argument('--output', type=Path, help="Write the report here instead of stdout")
+    parser.add_argument('--self-test', action='store_true', help="Check the scorer against known effect values")
+    args = parser.parse_args()
+
+    if args.self_test:
+        failures = self_test()
+        for failure in failures:
+            print(f"❌ {failure}")
+        if failures:
+            sys.exit(1)
+        print(f"✅ {len(KNOWN_VALUES)} known effect values match")
+        return
+
+    rates: Dict[str, float] = {}
+    if args.rates:
+        with open(args.rates, 'r', encoding='utf-8') as f:
+            rates.update(json.load(f))
+    rates.update(dict(args.rate))
+
+    try:
+        scores = BalanceScores.load(rates)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    result = scores.report(args.tolerance, args.level, fit=not args.no_fit)
+
+    if args.format == 'json':
+        report = json.dumps(result, indent=2)
+    else:
+        lines = [f"{'drift':>6s} {'hand':>5s} {'calc':>6s}  cell / effect"]
+        for entry in result['drifting']:
+            lines.append(f"{entry['drift']:+6.1f} {entry['hand']:5.0f} {entry['computed']:6.1f}  "
+                         f"{entry['event']} / {entry['approach']} / {entry['outcome']}: {entry['effect']}")
+        for label in result['unparsed']:
+            lines.append(f"⚠️  No recognised effect: {label}")
+        lines.append(f"\n📊 {len(result['drifting'])} of {result['cells']} cells drift beyond "
+                     f"±{args.tolerance} (scale {result['scale']}, RMS drift {result['rmsDrift']})")
+        report = "\n".join(lines)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+        print(f"📁 Report written to: {args.output} ({len(result['drifting'])} drifting cells)")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Benchmark buildscripts tools against a synthetic project tree at 1x/10x/100x.
+
+For each scale a throwaway tree is generated in a temp directory by
+replicating the real inputs under new ids:
+
+- data/structures/*.json                     structure families
+- src/pipelines/events/*.ts                  event pipeline files
+- src/view/**/*.svelte                       <style> blocks of the Svelte components
+- docs/planning/EVENT_*_TABLE.csv + balance-table-parsed.json   balance table rows
+- data/piazolands/stolen-lands-map.json      map cells (grid tiled vertically;
+                                             rivers are not replicated)
+- dist/events.json                           synthetic legacy event data for generate-types
+
+buildscripts/ is copied into the tree, so every tool resolves its usual
+paths against the synthetic data. Each case runs in its own subprocess,
+--repeat times; wall time and peak RSS (Linux/macOS) are recorded.
+
+Results are written as JSON (default: benchmark-results.json). Pass
+--compare OLD.json to print the ratio against an earlier run.
+
+Usage:
+    python buildscripts/benchmark.py [--scales 1,10,100] [--cases a,b] [--repeat N]
+                                     [--output PATH] [--compare PATH]
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BUILDSCRIPTS_DIR = PROJECT_ROOT / "buildscripts"
+DEFAULT_OUTPUT = PROJECT_ROOT / "benchmark-results.json"
+
+STYLE_BLOCK = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL)
+
+# Loads a hyphenated buildscripts module by file name inside a case snippet
+LOADER = (
+    "import importlib.util, sys\n"
+    "sys.path.insert(0, 'buildscripts')\n"
+    "def load(name):\n"
+    "    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), f'buildscripts/{name}.py')\n"
+    "    module = importlib.util.module_from_spec(spec)\n"
+    "    spec.loader.exec_module(module)\n"
+    "    return module\n"
+)
+
+# name → (working directory inside the tree, argv or Python snippet)
+CASES: Dict[str, Tuple[str, List[str]]] = {
+    'combine_structures': ('.', ['-c', LOADER + "load('combine-structures').combine_structures()"]),
+    'generate_event_types': ('.', ['-c', LOADER + "load('generate-types').generate_event_types('dist/events.json')"]),
+    'convert_style_block': ('.', ['-c', LOADER + (
+        "import re, pathlib\n"
+        "convert = load('convert-to-rem').convert_style_block\n"
+        "for path in sorted(pathlib.Path('src/view').rglob('*.svelte')):\n"
+        "    for block in re.findall(r'<style[^>]*>(.*?)</style>', path.read_text(encoding='utf-8'), re.DOTALL):\n"
+        "        convert(block)\n"
+    )]),
+    'extract_event_data': ('.', ['-c', LOADER + (
+        "import pathlib\n"
+        "extract = load('extract-event-data').extract_event_data\n"
+        "for path in sorted(pathlib.Path('src/pipelines/events').glob('*.ts')):\n"
+        "    extract(path)\n"
+    )]),
+    'parse-balance-table': ('buildscripts', ['parse-balance-table.py']),
+    'sync-balance-table': ('buildscripts', ['sync-balance-table.py', '--dry-run']),
+    'balance-sync': ('.', ['buildscripts/balance-sync.py', '--dry-run']),
+    'lint-pipelines': ('.', ['buildscripts/lint-pipelines.py', '--format', 'json', '--output', 'lint.json']),
+    'road-connectivity': ('.', ['buildscripts/road-connectivity.py', '--output', 'connectivity.json']),
+}
+
+# Exit codes other than 0 that still mean the tool ran to completion
+EXPECTED_EXIT_CODES = {
+    'lint-pipelines': {0, 1},  # 1 = error-level findings
+}
+
+
+# ----------------------------------------------------------------------
+# Synthetic tree
+# ----------------------------------------------------------------------
+
+def copy_structures(root: Path, scale: int) -> int:
+    target = root / "data" / "structures"
+    target.mkdir(parents=True)
+    count = 0
+    for path in sorted((PROJECT_ROOT / "data" / "structures").glob("*.json")):
+        data = json.loads(path.read_text(encoding='utf-8'))
+        for k in range(scale):
+            copy = json.loads(json.dumps(data))
+            if k:
+                copy['family'] = f"{copy.get('family', path.stem)} {k}"
+                for tier in copy.get('tiers', []):
+                    if 'id' in tier:
+                        tier['id'] = f"{tier['id']}-{k}"
+            name = path.stem if not k else f"{path.stem}-{k}"
+            (target / f"{name}.json").write_text(json.dumps(copy, indent=2), encoding='utf-8')
+            count += 1
+    return count
+
+
+def copy_events(root: Path, scale: int) -> int:
+    target = root / "src" / "pipelines" / "events"
+    target.mkdir(parents=True)
+    count = 0
+    for path in sorted((PROJECT_ROOT / "src" / "pipelines" / "events").glob("*.ts")):
+        text = path.read_text(encoding='utf-8')
+        for k in range(scale):
+            name = path.stem if not k else f"{path.stem}-{k}"
+            (target / f"{name}.ts").write_text(text, encoding='utf-8')
+            count += 1
+    return count
+
+
+def copy_styles(root: Path, scale: int) -> int:
+    source_dir = PROJECT_ROOT / "src" / "view"
+    count = 0
+    for path in sorted(source_dir.rglob("*.svelte")):
+        blocks = STYLE_BLOCK.findall(path.read_text(encoding='utf-8'))
+        if not blocks:
+            continue
+        relative = path.relative_to(source_dir)
+        for k in range(scale):
+            target = root / "src" / "view" / (f"copy-{k}" if k else "") / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text("\n".join(blocks), encoding='utf-8')
+            count += 1
+    return count
+
+
+def scale_csv(path: Path, target: Path, scale: int) -> int:
+    """Replicate event blocks; copy k renames '2. Feud' to '2. Feud k'."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.reader(f))
+    header, body = rows[0], rows[1:]
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(header)
+    for k in range(scale):
+        for row in body:
+            row = list(row)
+            if k and row and row[0].strip():
+                row[0] = f"{row[0].strip()} {k}"
+            writer.writerow(row)
+    target.write_text(out.getvalue(), encoding='utf-8')
+    return len(body) * scale
+
+
+def copy_planning(root: Path, scale: int) -> int:
+    source_dir = PROJECT_ROOT / "docs" / "planning"
+    target_dir = root / "docs" / "planning"
+    target_dir.mkdir(parents=True)
+    rows = scale_csv(source_dir / "EVENT_BALANCE_TABLE.csv", target_dir / "EVENT_BALANCE_TABLE.csv", scale)
+    scale_csv(source_dir / "EVENT_SKILLS_TABLE.csv", target_dir / "EVENT_SKILLS_TABLE.csv", scale)
+
+    parsed = json.loads((source_dir / "balance-table-parsed.json").read_text(encoding='utf-8'))
+    scaled = {}
+    for k in range(scale):
+        for name, event in parsed.items():
+            copy = json.loads(json.dumps(event))
+            if k:
+                copy['file'] = f"{event['file']}-{k}"
+            scaled[f"{name} {k}" if k else name] = copy
+    (target_dir / "balance-table-parsed.json").write_text(json.dumps(scaled, indent=2), encoding='utf-8')
+    return rows
+
+
+def copy_map(root: Path, scale: int) -> int:
+    source = PROJECT_ROOT / "data" / "piazolands" / "stolen-lands-map.json"
+    data = json.loads(source.read_text(encoding='utf-8'))
+    rows = 1 + max(int(cell['id'].split('.')[0]) for cell in data['terrain'])
+
+    def shift(hex_id: str, k: int) -> str:
+        row, col = hex_id.split('.')
+        return f"{int(row) + k * rows}.{col}"
+
+    terrain, roads, settlements = [], [], []
+    for k in range(scale):
+        terrain.extend({**cell, 'id': shift(cell['id'], k)} for cell in data['terrain'])
+        roads.extend(shift(hex_id, k) for hex_id in data['roads'])
+        settlements.extend(
+            {**s, 'id': f"{s.get('id', '')}-{k}"} if isinstance(s, dict) else s
+            for s in data.get('settlements', []))
+    data.update({'terrain': terrain, 'roads': roads, 'settlements': settlements})
+
+    target = root / "data" / "piazolands" / "stolen-lands-map.json"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(json.dumps(data), encoding='utf-8')
+    (root / "data" / "kingmaker-support").mkdir(parents=True, exist_ok=True)
+    shutil.copy2(PROJECT_ROOT / "data" / "kingmaker-support" / "waterways.json",
+                 root / "data" / "kingmaker-support" / "waterways.json")
+    return len(terrain)
+
+
+def write_legacy_events(root: Path, scale: int) -> int:
+    """dist/events.json in the pre-pipeline JSON shape generate-types reads."""
+    skills = ['diplomacy', 'intimidation', 'society', 'religion', 'nature', 'stealth']
+    events = []
+    for i in range(35 * scale):
+        events.append({
+            'id': f"event-{i}",
+            'traits': ['beneficial' if i % 2 else 'dangerous'] + (['ongoing'] if i % 5 == 0 else []),
+            'location': ['kingdom', 'settlement', 'hex'][i % 3],
+            'skills': [{'skill': skills[(i + j) % len(skills)], 'description': 'synthetic'} for j in range(3)],
+            'effects': {
+                outcome: {'modifiers': [{'selector': resource, 'value': i % 4 - 2}
+                                        for resource in ('gold', 'unrest', 'food')]}
+                for outcome in ('criticalSuccess', 'success', 'failure', 'criticalFailure')
+            },
+        })
+    (root / "dist").mkdir(exist_ok=True)
+    (root / "dist" / "events.json").write_text(json.dumps(events), encoding='utf-8')
+    return len(events)
+
+
+def build_tree(root: Path, scale: int) -> Dict[str, int]:
+    """Generate the synthetic tree; returns input sizes."""
+    shutil.copytree(BUILDSCRIPTS_DIR, root / "buildscripts",
+                    ignore=shutil.ignore_patterns('__pycache__', '*.txt', '*.json', '*.js', '*.cjs', '*.mjs'))
+    (root / "src" / "types").mkdir(parents=True)
+    shutil.copy2(PROJECT_ROOT / "src" / "types" / "events.ts", root / "src" / "types" / "events.ts")
+    return {
+        'structureFamilies': copy_structures(root, scale),
+        'eventPipelines': copy_events(root, scale),
+        'svelteStyleFiles': copy_styles(root, scale),
+        'balanceTableRows': copy_planning(root, scale),
+        'mapCells': copy_map(root, scale),
+        'legacyEvents': write_legacy_events(root, scale),
+    }
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+# Runs the case as its own child and reports wall time and peak RSS. A
+# forked child inherits its parent's high-water RSS on Linux, so measuring
+# from this small launcher keeps the harness's own memory out of the numbers.
+LAUNCHER = (
+    "import json, os, subprocess, sys, time\n"
+    "started = time.perf_counter()\n"
+    "process = subprocess.Popen(sys.argv[1:], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)\n"
+    "_, status, usage = os.wait4(process.pid, 0)\n"
+    "print(json.dumps([time.perf_counter() - started, usage.ru_maxrss, os.waitstatus_to_exitcode(status)]))\n"
+)
+
+
+def run_case(root: Path, cwd: str, argv: List[str]) -> Tuple[float, Optional[int], int]:
+    """Run one case; returns (seconds, peak RSS in KB or None, exit code)."""
+    command = [sys.executable] + argv
+    if not hasattr(os, 'wait4'):
+        started = time.perf_counter()
+        code = subprocess.call(command, cwd=root / cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return time.perf_counter() - started, None, code
+
+    output = subprocess.run([sys.executable, '-c', LAUNCHER] + command, cwd=root / cwd,
+                            capture_output=True, text=True, check=True).stdout
+    elapsed, peak, code = json.loads(output.strip().splitlines()[-1])
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return elapsed, peak // 1024 if sys.platform == 'darwin' else peak, code
+
+
+def compare(results: List[Dict], baseline_path: Path) -> None:
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {(r['case'], r['scale']): r for r in json.load(f)['results']}
+    print(f"\n📊 Compared with {baseline_path}:")
+    for result in results:
+        old = baseline.get((result['case'], result['scale']))
+        if old and old.get('best') and result.get('best'):
+            ratio = result['best'] / old['best']
+            flag = '⚠️ ' if ratio > 1.2 else '  '
+            print(f"  {flag}{result['case']:24s} {result['scale']:>4}x  {old['best']:.3f}s → "
+                  f"{result['best']:.3f}s ({ratio:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark buildscripts tools on synthetic inputs")
+    parser.add_argument('--scales', default='1,10,100')
+    parser.add_argument('--cases', help=f"Comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--compare', type=Path, help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',')]
+    names = args.cases.split(',') if args.cases else list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        print(f"❌ Unknown case(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    results = []
+    for scale in scales:
+        with tempfile.TemporaryDirectory(prefix=f"reignmaker-bench-{scale}x-") as temp:
+            root = Path(temp)
+            started = time.perf_counter()
+            inputs = build_tree(root, scale)
+            print(f"🏗️  {scale}x tree built in {time.perf_counter() - started:.1f}s: "
+                  + ", ".join(f"{k}={v}" for k, v in inputs.items()))
+
+            for name in names:
+                cwd, argv = CASES[name]
+                runs = [run_case(root, cwd, argv) for _ in range(args.repeat)]
+                seconds = [r[0] for r in runs]
+                peaks = [r[1] for r in runs if r[1] is not None]
+                failed = any(r[2] not in EXPECTED_EXIT_CODES.get(name, {0}) for r in runs)
+                result = {
+                    'case': name,
+                    'scale': scale,
+                    'inputs': inputs,
+                    'seconds': [round(s, 4) for s in seconds],
+                    'best': None if failed else round(min(seconds), 4),
+                    'median': None if failed else round(statistics.median(seconds), 4),
+                    'peakRssKb': max(peaks) if peaks else None,
+                    'ok': not failed,
+                }
+                results.append(result)
+                status = f"{result['best']:.3f}s" if not failed else "❌ failed"
+                rss = f"{result['peakRssKb'] / 1024:.0f} MB" if result['peakRssKb'] else "n/a"
+                print(f"   {name:24s} {status:>10s}  peak {rss}")
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📁 Results written to: {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Pack map icons and army tokens into sprite atlas sheets.
+
+Inputs:  src/img/map_icons/*.webp, src/img/army_tokens/*.webp
+Output:  src/img-derived/atlas/atlas-{n}.webp
+         src/img-derived/atlas/sprite-atlas.json (frame map)
+
+Sprites are scaled down to at most MAX_SPRITE px on their longest side
+(army tokens are 896 px sources but render far smaller on the map), then
+shelf-packed tallest-first into sheets of at most MAX_SHEET px. Frames are
+keyed by the existing file stems, e.g. "settlement_town" or "army-wolves":
+
+    {
+      "sheets": [{"image": "img-derived/atlas/atlas-0.webp", "size": {"w": .., "h": ..}}],
+      "frames": {
+        "settlement_town": {"sheet": 0, "frame": {"x": .., "y": .., "w": .., "h": ..},
+                            "source": "img/map_icons/settlement_town.webp"}
+      },
+      "inputs": {"settlement_town": "<sha256>"}
+    }
+
+The atlas is only rebuilt when an input hash (or the packing settings)
+changes. The map layer does not bind the atlas yet (armyTypes.ts still
+imports each icon), so the frame map stays next to the sheets instead of
+in src/data-compiled, which the build copies into dist.
+Requires Pillow (pip install Pillow).
+
+Usage:
+    python buildscripts/build-sprite-atlas.py [--force]
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+INPUT_DIRS = (SRC_DIR / "img" / "map_icons", SRC_DIR / "img" / "army_tokens")
+OUTPUT_DIR = SRC_DIR / "img-derived" / "atlas"
+FRAME_MAP_FILE = OUTPUT_DIR / "sprite-atlas.json"
+
+MAX_SPRITE = 256   # Longest side of a packed sprite
+MAX_SHEET = 2048   # Longest side of an atlas sheet
+PADDING = 2        # Transparent gutter around each sprite (avoids bleeding)
+QUALITY = 90
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def settings() -> Dict:
+    return {'maxSprite': MAX_SPRITE, 'maxSheet': MAX_SHEET, 'padding': PADDING, 'quality': QUALITY}
+
+
+def collect_inputs() -> Dict[str, Path]:
+    """Map file stem → source path; stems must be unique across input dirs."""
+    inputs: Dict[str, Path] = {}
+    for directory in INPUT_DIRS:
+        for path in sorted(directory.glob("*.webp")):
+            if path.stem in inputs:
+                raise ValueError(f"Duplicate sprite stem '{path.stem}': {inputs[path.stem]} and {path}")
+            inputs[path.stem] = path
+    return inputs
+
+
+def is_up_to_date(hashes: Dict[str, str]) -> bool:
+    """True if the existing frame map was built from identical inputs and settings."""
+    if not FRAME_MAP_FILE.exists():
+        return False
+    with open(FRAME_MAP_FILE, 'r', encoding='utf-8') as f:
+        previous = json.load(f)
+    if previous.get('inputs') != hashes or previous.get('settings') != settings():
+        return False
+    return all((SRC_DIR / sheet['image']).exists() for sheet in previous.get('sheets', []))
+
+
+def shelf_pack(sizes: Dict[str, Tuple[int, int]]) -> List[Dict[str, Tuple[int, int]]]:
+    """
+    Shelf-pack sprites tallest-first into as many sheets as needed.
+
+    Returns one {stem: (x, y)} placement dict per sheet.
+    """
+    order = sorted(sizes, key=lambda s: (-sizes[s][1], -sizes[s][0], s))
+    sheets: List[Dict[str, Tuple[int, int]]] = []
+    placements: Dict[str, Tuple[int, int]] = {}
+    x = y = shelf_height = 0
+
+    for stem in order:
+        w, h = sizes[stem][0] + PADDING * 2, sizes[stem][1] + PADDING * 2
+        if x + w > MAX_SHEET:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + h > MAX_SHEET:
+            sheets.append(placements)
+            placements, x, y, shelf_height = {}, 0, 0, 0
+        placements[stem] = (x + PADDING, y + PADDING)
+        x += w
+        shelf_height = max(shelf_height, h)
+
+    if placements:
+        sheets.append(placements)
+    return sheets
+
+
+def build_atlas(inputs: Dict[str, Path], hashes: Dict[str, str]) -> Dict:
+    """Scale, pack and write the atlas sheets; return the frame map."""
+    sprites = {}
+    for stem, path in inputs.items():
+        image = Image.open(path).convert('RGBA')
+        image.thumbnail((MAX_SPRITE, MAX_SPRITE), Image.LANCZOS)
+        sprites[stem] = image
+
+    sheets = shelf_pack({stem: image.size for stem, image in sprites.items()})
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in OUTPUT_DIR.glob("atlas-*.webp"):
+        stale.unlink()
+
+    frame_map = {'sheets': [], 'frames': {}, 'inputs': hashes, 'settings': settings()}
+    for index, placements in enumerate(sheets):
+        width = max(x + sprites[s].width + PADDING for s, (x, _) in placements.items())
+        height = max(y + sprites[s].height + PADDING for s, (_, y) in placements.items())
+        sheet = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        for stem, (x, y) in placements.items():
+            sheet.paste(sprites[stem], (x, y))
+            frame_map['frames'][stem] = {
+                'sheet': index,
+                'frame': {'x': x, 'y': y, 'w': sprites[stem].width, 'h': sprites[stem].height},
+                'source': inputs[stem].relative_to(SRC_DIR).as_posix(),
+            }
+        target = OUTPUT_DIR / f"atlas-{index}.webp"
+        sheet.save(target, 'WEBP', quality=QUALITY, method=6)
+        frame_map['sheets'].append({
+            'image': target.relative_to(SRC_DIR).as_posix(),
+            'size': {'w': width, 'h': height},
+        })
+
+    frame_map['frames'] = {stem: frame_map['frames'][stem] for stem in sorted(frame_map['frames'])}
+    return frame_map
+
+
+def main():
+    force = '--force' in sys.argv
+
+    if Image is None:
+        print("❌ Pillow is required: pip install Pillow")
+        sys.exit(1)
+
+    inputs = collect_inputs()
+    hashes = {stem: file_hash(path) for stem, path in inputs.items()}
+    print(f"🧩 Sprite atlas: {len(inputs)} sprites")
+
+    if not force and is_up_to_date(hashes):
+        print("✅ Atlas is up to date (no input changes)")
+        return
+
+    frame_map = build_atlas(inputs, hashes)
+
+    FRAME_MAP_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(FRAME_MAP_FILE, 'w', encoding='utf-8') as f:
+        json.dump(frame_map, f, indent=2)
+
+    for sheet in frame_map['sheets']:
+        print(f"  ✓ {sheet['image']} ({sheet['size']['w']}×{sheet['size']['h']})")
+    print(f"✅ Packed {len(frame_map['frames'])} frames into {len(frame_map['sheets'])} sheet(s)")
+    print(f"📁 Frame map written to: {FRAME_MAP_FILE}")
+
+
+if __name__ == "__main__":
+    main()
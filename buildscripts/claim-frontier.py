@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Hex adjacency and claim-frontier precompute for a kingdom or map.
+
+src/domain/territory/adjacencyLogic.ts and claimHexesLogic.ts look up
+every neighbor with kingdom.hexes.find(), so one frontier pass costs
+O(claimed x hexes). This tool converts a kingdom (starter-kingdom.json,
+a SaveLoadService save, or a map export) into dense integer hex IDs
+with a flat neighbor array and computes, in linear time:
+
+- the claimable frontier: unclaimed hexes adjacent to the faction's
+  territory (getClaimableHexes with the explored set from
+  initializeExploredHexes, i.e. every hex next to the territory)
+- a distance-to-capital field: hex steps from the capital over the map
+  (-1 where unreachable), plus the claimed hexes that are not connected
+  to the capital through claimed territory
+
+Neighbors are getAdjacentHexIds() (hex_grid.py), dense IDs follow
+map_hex_index() (row, col) order, and neighbor slots follow
+EDGE_DIRECTIONS.
+
+The capital is the faction's isCapital settlement (location x.y), else
+--capital. --found claims the capital plus every hex within --radius
+(the starting 7 hexes at radius 1), which turns an unclaimed starter
+kingdom or map into a kingdom of any size. --compare also times the
+TS-style list scan on the same data.
+
+Output (compact JSON, default golden-vectors/claim-frontier-<source>.json):
+    {"source": ..., "faction": "player", "hexIds": ["0.0", ...],
+     "neighbors": [n0_e, n0_se, ..., -1, ...], "capital": 42,
+     "claimed": [...], "frontier": [...], "detached": [...],
+     "distanceToCapital": [...]}
+
+Usage:
+    python buildscripts/claim-frontier.py [--kingdom PATH | --map PATH] [--faction player]
+                                          [--capital HEX] [--found HEX [--radius 1]]
+                                          [--compare] [--output PATH]
+    python buildscripts/claim-frontier.py --found 5.5
+    python buildscripts/claim-frontier.py --map big.json.gz --found 150.160 --radius 60 --compare
+"""
+
+import argparse
+import sys
+import time
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from hex_grid import (
+    PROJECT_ROOT,
+    format_hex_id,
+    hex_distance,
+    load_json,
+    map_hex_index,
+    neighbor_table,
+    parse_hex_id,
+    write_json,
+)
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+STARTER_KINGDOM_PATH = PROJECT_ROOT / "data" / "simulation" / "starter-kingdom.json"
+OUTPUT_DIR = PROJECT_ROOT / "golden-vectors"
+
+# src/types/ownership.ts
+PLAYER_KINGDOM = "player"
+
+# Longest list-scan comparison worth waiting for (it is quadratic)
+COMPARE_LIMIT = 20_000
+
+SLOTS = 6
+
+
+class Territory:
+    """Dense-ID view of a kingdom's hexes and one faction's claims."""
+
+    def __init__(self, hexes: List[Dict], settlements: List[Dict], faction: str):
+        # map_hex_index() only needs the 'id' of each entry
+        self.hex_index = map_hex_index({'terrain': hexes})
+        self.hex_ids = list(self.hex_index)
+        self.faction = faction
+        self.neighbors = array('i', (n for row in neighbor_table(self.hex_index) for n in row))
+
+        # 0 = unclaimed, 1 = this faction, 2 = another faction
+        self.owner = bytearray(len(self.hex_ids))
+        for hex_ in hexes:
+            claimed_by = hex_.get('claimedBy')
+            if claimed_by:
+                self.owner[self.hex_index[hex_['id']]] = 1 if claimed_by == faction else 2
+
+        self.capital: Optional[int] = None
+        for settlement in settlements:
+            location = settlement.get('location') or {}
+            hex_id = format_hex_id(location.get('x', 0), location.get('y', 0))
+            if settlement.get('isCapital') and hex_id in self.hex_index \
+                    and self.owner[self.hex_index[hex_id]] == 1:
+                self.capital = self.hex_index[hex_id]
+                break
+
+    def found(self, hex_id: str, radius: int) -> int:
+        """Claim every unclaimed hex within `radius` of a new capital; returns the count."""
+        center = parse_hex_id(hex_id)
+        self.capital = self.hex_index[hex_id]
+        claimed = 0
+        for index, other in enumerate(self.hex_ids):
+            if not self.owner[index] and hex_distance(center, parse_hex_id(other)) <= radius:
+                self.owner[index] = 1
+                claimed += 1
+        return claimed
+
+    def claimed(self) -> List[int]:
+        return [index for index, owner in enumerate(self.owner) if owner == 1]
+
+    def frontier(self) -> List[int]:
+        """Unclaimed hexes next to the faction's territory, in dense-ID order."""
+        neighbors, owner = self.neighbors, self.owner
+        marked = bytearray(len(owner))
+        for index in self.claimed():
+            for n in neighbors[index * SLOTS:(index + 1) * SLOTS]:
+                if n >= 0 and not owner[n]:
+                    marked[n] = 1
+        return [index for index, flag in enumerate(marked) if flag]
+
+    def distances(self, start: int, claimed_only: bool = False) -> array:
+        """Breadth-first hex steps from `start` (-1 where unreachable)."""
+        neighbors, owner = self.neighbors, self.owner
+        distance = array('i', [-1]) * len(owner)
+        distance[start] = 0
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            step = distance[index] + 1
+            for n in neighbors[index * SLOTS:(index + 1) * SLOTS]:
+                if n >= 0 and distance[n] < 0 and (not claimed_only or owner[n] == 1):
+                    distance[n] = step
+                    queue.append(n)
+        return distance
+
+
+def naive_frontier(hexes: List[Dict], faction: str) -> List[str]:
+    """getClaimableHexes() as written in TS: a kingdom.hexes.find() per neighbor."""
+    def find(hex_id: str) -> Optional[Dict]:
+        return next((h for h in hexes if h['id'] == hex_id), None)
+
+    def adjacent_ids(row: int, col: int) -> List[str]:
+        if row % 2 == 0:
+            ids = [(row - 1, col - 1), (row - 1, col), (row, col - 1), (row, col + 1), (row + 1, col - 1), (row + 1, col)]
+        else:
+            ids = [(row - 1, col), (row - 1, col + 1), (row, col - 1), (row, col + 1), (row + 1, col), (row + 1, col + 1)]
+        return [format_hex_id(r, c) for r, c in ids if r >= 0 and c >= 0]
+
+    explored = set()
+    for hex_ in hexes:
+        if hex_.get('claimedBy') == faction:
+            explored.add(hex_['id'])
+            for neighbor_id in adjacent_ids(*parse_hex_id(hex_['id'])):
+                neighbor = find(neighbor_id)
+                if neighbor and not neighbor.get('claimedBy'):
+                    explored.add(neighbor_id)
+
+    return [hex_['id'] for hex_ in hexes
+            if not hex_.get('claimedBy') and hex_['id'] in explored
+            and any((find(n) or {}).get('claimedBy') == faction for n in adjacent_ids(*parse_hex_id(hex_['id'])))]
+
+
+def load_source(kingdom_path: Optional[Path], map_path: Optional[Path]):
+    """(hexes, settlements, name) from a kingdom, a save file or a map export."""
+    if map_path:
+        data = load_json(map_path)
+        hexes = [{'id': t['id']} for t in data.get('terrain', [])]
+        return hexes, [], map_path
+    path = kingdom_path or STARTER_KINGDOM_PATH
+    data = load_json(path)
+    kingdom = data.get('kingdomData', data)  # SaveLoadService wraps the kingdom with metadata
+    return kingdom.get('hexes', []), kingdom.get('settlements', []), path
+
+
+def output_name(path: Path) -> str:
+    name = path.name
+    for suffix in ('.gz', '.json'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return f"claim-frontier-{name}.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hex adjacency and claim-frontier precompute")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--kingdom', type=Path, help="Kingdom JSON or save file (default: starter-kingdom.json)")
+    source.add_argument('--map', type=Path, help="Map export (.json or .json.gz); nothing is claimed")
+    parser.add_argument('--faction', default=PLAYER_KINGDOM, help="Faction whose territory is expanded")
+    parser.add_argument('--capital', help="Capital hex when the kingdom has no isCapital settlement")
+    parser.add_argument('--found', help="Found the capital here and claim the hexes around it")
+    parser.add_argument('--radius', type=int, default=1, help="Claim radius for --found (1 = starting 7 hexes)")
+    parser.add_argument('--compare', action='store_true', help="Also time the TS-style list scan")
+    parser.add_argument('--output', type=Path, help="Output path (default: golden-vectors/claim-frontier-<source>.json)")
+    args = parser.parse_args()
+
+    path = args.map or args.kingdom
+    if path and not path.exists():
+        print(f"❌ Source not found: {path}")
+        sys.exit(1)
+
+    hexes, settlements, path = load_source(args.kingdom, args.map)
+    started = time.perf_counter()
+    territory = Territory(hexes, settlements, args.faction)
+    built = time.perf_counter() - started
+
+    for hex_id in (args.found, args.capital):
+        if hex_id and hex_id not in territory.hex_index:
+            print(f"❌ Hex {hex_id} is not on the map")
+            sys.exit(1)
+    if args.found:
+        claimed = territory.found(args.found, args.radius)
+        print(f"🏰 Founded at {args.found}: claimed {claimed} hexes within {args.radius}")
+    elif args.capital:
+        territory.capital = territory.hex_index[args.capital]
+
+    started = time.perf_counter()
+    claimed = territory.claimed()
+    frontier = territory.frontier()
+    capital = territory.capital
+    if capital is None and claimed:
+        capital = claimed[0]
+        print(f"⚠️  No capital found; measuring distances from {territory.hex_ids[capital]}")
+    distance = territory.distances(capital) if capital is not None else array('i', [-1]) * len(hexes)
+    connected = territory.distances(capital, claimed_only=True) if capital is not None else distance
+    detached = [index for index in claimed if connected[index] < 0]
+    elapsed = time.perf_counter() - started
+
+    if not claimed:
+        print(f"⚠️  {args.faction} has no claimed hexes; use --found HEX to found a capital")
+
+    output = args.output or OUTPUT_DIR / output_name(path)
+    size = write_json(output, {
+        'source': path.name,
+        'faction': args.faction,
+        'hexIds': territory.hex_ids,
+        'neighbors': territory.neighbors.tolist(),
+        'capital': capital,
+        'claimed': claimed,
+        'frontier': frontier,
+        'detached': detached,
+        'distanceToCapital': distance.tolist(),
+    }, indent=None)
+
+    print(f"📊 {len(territory.hex_ids)} hexes, {len(claimed)} claimed, {len(frontier)} claimable, "
+          f"{len(detached)} detached from the capital")
+    print(f"  array layout  {built * 1000:9.1f} ms build  {elapsed * 1000:9.1f} ms frontier + distances")
+
+    if args.compare:
+        if len(hexes) > COMPARE_LIMIT:
+            print(f"⚠️  Skipping the list scan above {COMPARE_LIMIT} hexes")
+        else:
+            scan_hexes = [{'id': hex_id, 'claimedBy': None} for hex_id in territory.hex_ids]
+            for index, owner in enumerate(territory.owner):
+                if owner:
+                    scan_hexes[index]['claimedBy'] = args.faction if owner == 1 else 'other'
+            started = time.perf_counter()
+            naive = naive_frontier(scan_hexes, args.faction)
+            scanned = time.perf_counter() - started
+            if sorted(naive, key=parse_hex_id) != [territory.hex_ids[i] for i in frontier]:
+                print("❌ List scan and array frontier disagree")
+                sys.exit(1)
+            print(f"  list scan     {scanned * 1000:9.1f} ms frontier (same {len(naive)} hexes)")
+
+    print(f"📁 Written to: {output} ({size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Codemod framework for src/pipelines.
+
+A codemod is a function that receives a parsed pipeline file and returns
+span edits (start, end, replacement) - see ts_source.py. Codemods register
+themselves with a name and a version:
+
+    from codemod import register
+
+    @register('rename-special-effects', version=1, paths='src/pipelines/actions/*.ts')
+    def rename_special_effects(source):
+        prop = source.pipeline.get_property('specialEffects') if source.pipeline else None
+        return [(prop.key_start, prop.key_start + len('specialEffects'), 'outcomeBadges')] if prop else []
+
+The runner (run-codemods.py) then:
+
+1. Skips files whose content hash the ledger already records for that
+   codemod@version (i.e. files already at the target version)
+2. Transforms the remaining files in parallel worker processes, applying
+   the selected codemods in order and re-parsing after each one
+3. Writes a journal with the original contents BEFORE touching any file,
+   replaces files atomically, and restores every file if a write fails
+4. Records the resulting content hashes in the ledger
+
+`run-codemods.py rollback` restores the files of the last journaled run.
+
+Files:
+    .codemod-ledger.json    {relative path: {"name@version": sha256}}
+    .codemod-journal/       journal.json + originals of the last run
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ts_source import ObjectLiteral, SourceFile, apply_edits, parse_source, verify_parses
+
+PROJECT_ROOT = Path(__file__).parent.parent
+LEDGER_FILE = PROJECT_ROOT / ".codemod-ledger.json"
+JOURNAL_DIR = PROJECT_ROOT / ".codemod-journal"
+JOURNAL_FILE = JOURNAL_DIR / "journal.json"
+
+Edit = Tuple[int, int, str]
+
+
+class Codemod:
+    def __init__(self, name: str, version: int, paths: str, description: str,
+                 transform: Callable[['PipelineSource'], List[Edit]]):
+        self.name = name
+        self.version = version
+        self.paths = paths
+        self.description = description
+        self.transform = transform
+        self.module = transform.__module__
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@{self.version}"
+
+
+CODEMODS: Dict[str, Codemod] = {}
+
+
+def register(name: str, version: int = 1, paths: str = 'src/pipelines/**/*.ts'):
+    """Decorator registering a transform as a codemod."""
+    def decorator(transform: Callable[['PipelineSource'], List[Edit]]):
+        description = (transform.__doc__ or '').strip().split('\n')[0]
+        CODEMODS[name] = Codemod(name, version, paths, description, transform)
+        return transform
+    return decorator
+
+
+class PipelineSource:
+    """What a transform sees: the file text plus its lazily parsed form."""
+
+    def __init__(self, path: Path, text: str):
+        self.path = path
+        self.text = text
+        self._parsed: Optional[SourceFile] = None
+
+    @property
+    def parsed(self) -> SourceFile:
+        if self._parsed is None:
+            self._parsed = parse_source(self.text)
+        return self._parsed
+
+    @property
+    def pipeline(self) -> Optional[ObjectLiteral]:
+        """The first exported object literal (the pipeline definition)."""
+        return self.parsed.exported_object()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def relative_path(path: Path) -> str:
+    return path.resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+
+
+# ----------------------------------------------------------------------
+# Ledger
+# ----------------------------------------------------------------------
+
+def load_ledger() -> Dict[str, Dict[str, str]]:
+    if LEDGER_FILE.exists():
+        with open(LEDGER_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def save_ledger(ledger: Dict[str, Dict[str, str]]) -> None:
+    with open(LEDGER_FILE, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(ledger.items())), f, indent=2)
+
+
+def pending_codemods(path: Path, text: str, codemods: List[Codemod],
+                     ledger: Dict[str, Dict[str, str]]) -> List[Codemod]:
+    """Codemods that still need to run on this exact file content."""
+    digest = content_hash(text)
+    done = ledger.get(relative_path(path), {})
+    return [c for c in codemods if done.get(c.key) != digest]
+
+
+# ----------------------------------------------------------------------
+# Transform (runs in worker processes)
+# ----------------------------------------------------------------------
+
+def transform_file(path: str, names: List[str], modules: List[str]) -> Dict:
+    """
+    Apply the named codemods to one file in order.
+
+    Returns {'path', 'text' (new content or None if unchanged), 'applied', 'error'}.
+    """
+    for module in modules:
+        importlib.import_module(module)  # Registers codemods under spawn-based pools
+
+    file_path = Path(path)
+    original = file_path.read_text(encoding='utf-8')
+    text = original
+    applied = []
+    try:
+        for name in names:
+            edits = CODEMODS[name].transform(PipelineSource(file_path, text))
+            if not edits:
+                continue
+            new_text = apply_edits(text, edits)
+            error = verify_parses(new_text)
+            if error:
+                return {'path': path, 'text': None, 'applied': applied,
+                        'error': f"{name} produced unparseable output: {error}"}
+            text = new_text
+            applied.append(name)
+    except Exception as e:
+        return {'path': path, 'text': None, 'applied': applied, 'error': f"{type(e).__name__}: {e}"}
+
+    return {'path': path, 'text': text if text != original else None, 'applied': applied, 'error': None}
+
+
+# ----------------------------------------------------------------------
+# Journal
+# ----------------------------------------------------------------------
+
+def write_journal(codemods: List[Codemod], changes: List[Tuple[Path, str, str]]) -> None:
+    """Record originals of every file about to change (write-ahead)."""
+    if JOURNAL_DIR.exists():
+        shutil.rmtree(JOURNAL_DIR)
+    originals = JOURNAL_DIR / "originals"
+    originals.mkdir(parents=True)
+
+    entries = []
+    for index, (path, before, after) in enumerate(changes):
+        backup = originals / f"{index}.ts"
+        backup.write_text(before, encoding='utf-8')
+        entries.append({
+            'path': relative_path(path),
+            'backup': backup.relative_to(JOURNAL_DIR).as_posix(),
+            'before': content_hash(before),
+            'after': content_hash(after),
+        })
+
+    with open(JOURNAL_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'codemods': [c.key for c in codemods],
+            'files': entries,
+        }, f, indent=2)
+
+
+def replace_file(path: Path, text: str) -> None:
+    """Write via a temp file and rename so a file is never half-written."""
+    temp = path.with_name(path.name + '.codemod-tmp')
+    temp.write_text(text, encoding='utf-8')
+    os.replace(temp, path)
+
+
+def rollback(force: bool = False) -> Dict[str, List[str]]:
+    """
+    Restore the files changed by the last journaled run.
+
+    Files edited since that run are left alone unless force is set.
+    """
+    result = {'restored': [], 'skipped': []}
+    if not JOURNAL_FILE.exists():
+        return result
+    with open(JOURNAL_FILE, 'r', encoding='utf-8') as f:
+        journal = json.load(f)
+
+    ledger = load_ledger()
+    for entry in journal['files']:
+        path = PROJECT_ROOT / entry['path']
+        current = path.read_text(encoding='utf-8') if path.exists() else None
+        if current is not None and content_hash(current) != entry['after'] and not force:
+            result['skipped'].append(entry['path'])
+            continue
+        replace_file(path, (JOURNAL_DIR / entry['backup']).read_text(encoding='utf-8'))
+        ledger.pop(entry['path'], None)
+        result['restored'].append(entry['path'])
+
+    save_ledger(ledger)
+    shutil.rmtree(JOURNAL_DIR)
+    return result
+
+
+# ----------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------
+
+def collect_files(codemods: List[Codemod], paths: Optional[str] = None) -> Dict[Path, List[Codemod]]:
+    """Map each target file to the codemods whose path pattern matches it."""
+    files: Dict[Path, List[Codemod]] = {}
+    for codemod in codemods:
+        for path in PROJECT_ROOT.glob(paths or codemod.paths):
+            if path.is_file():
+                files.setdefault(path, []).append(codemod)
+    return dict(sorted(files.items()))
+
+
+def run(codemods: List[Codemod], paths: Optional[str] = None, workers: int = 0,
+        dry_run: bool = False) -> Dict:
+    """Run codemods over their files; returns a report of what happened."""
+    ledger = load_ledger()
+    report = {'changed': [], 'unchanged': [], 'skipped': [], 'errors': {}}
+
+    jobs = []
+    for path, matching in collect_files(codemods, paths).items():
+        text = path.read_text(encoding='utf-8')
+        pending = pending_codemods(path, text, matching, ledger)
+        if pending:
+            jobs.append((path, text, pending))
+        else:
+            report['skipped'].append(relative_path(path))
+
+    modules = sorted({c.module for c in codemods})
+    with ProcessPoolExecutor(max_workers=workers or None) as pool:
+        results = list(pool.map(
+            transform_file,
+            [str(path) for path, _, _ in jobs],
+            [[c.name for c in pending] for _, _, pending in jobs],
+            [modules] * len(jobs),
+        ))
+
+    changes: List[Tuple[Path, str, str]] = []
+    for (path, before, pending), result in zip(jobs, results):
+        relative = relative_path(path)
+        if result['error']:
+            report['errors'][relative] = result['error']
+        elif result['text'] is None:
+            report['unchanged'].append(relative)
+        else:
+            changes.append((path, before, result['text']))
+            report['changed'].append({'path': relative, 'codemods': result['applied']})
+
+    if dry_run:
+        return report
+
+    if changes:
+        write_journal(codemods, changes)
+        written: List[Tuple[Path, str]] = []
+        try:
+            for path, before, after in changes:
+                replace_file(path, after)
+                written.append((path, before))
+        except OSError:
+            for path, before in written:
+                replace_file(path, before)
+            raise
+
+    # Record final hashes for every file that ran cleanly
+    finals = {relative_path(path): after for path, _, after in changes}
+    for (path, before, pending), result in zip(jobs, results):
+        relative = relative_path(path)
+        if result['error']:
+            continue
+        digest = content_hash(finals.get(relative, before))
+        entry = {k: v for k, v in ledger.get(relative, {}).items() if v == digest}
+        entry.update({c.key: digest for c in pending})
+        ledger[relative] = entry
+    save_ledger(ledger)
+
+    return report
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Combine individual JSON files for factions (and optionally structures)
-into their respective monolithic dist/ files.
+into their respective monolithic dist/ files, then merge the waterways and
+precompute road connectivity for the map export.
 
 NOTE: Events, incidents, and player actions are now fully defined in TypeScript
 pipeline files (src/pipelines/). The JSON files in archived-implementations/data-json/
@@ -9,6 +10,7 @@ are kept for historical reference only.
 """
 
 import json
+import sys
 from pathlib import Path
 
 def combine_factions():
@@ -87,5 +89,42 @@ def main():
         else:
             print(f"⚠️  Error updating structures: {result.stderr}")
 
+    # Merge Kingmaker waterways with the map export's river layer
+    waterways_script = Path(__file__).parent / "merge-waterways.py"
+    if waterways_script.exists():
+        print("\n" + "=" * 60)
+        print("MERGING WATERWAYS")
+        print("=" * 60)
+        import subprocess
+        result = subprocess.run(
+            ["python3", str(waterways_script)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            print("✅ Waterways merged successfully")
+        else:
+            # TerritoryService imports the merged files; the Vite build cannot succeed without them
+            print(f"❌ Error merging waterways: {result.stderr}")
+            sys.exit(1)
+
+    # Precompute road connectivity components for the map export
+    roads_script = Path(__file__).parent / "road-connectivity.py"
+    if roads_script.exists():
+        print("\n" + "=" * 60)
+        print("ROAD CONNECTIVITY")
+        print("=" * 60)
+        import subprocess
+        result = subprocess.run(
+            ["python3", str(roads_script)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            print("✅ Road connectivity precomputed successfully")
+        else:
+            # Nothing imports road-connectivity.json yet, so the build can go on without it
+            print(f"⚠️  Error precomputing road connectivity: {result.stderr}")
+
 if __name__ == "__main__":
     main()
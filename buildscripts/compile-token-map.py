@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Compile token-map.json into a compact lookup table.
+
+token-map.json is nested as compendium → actorId → {actor, token}, where
+token is either an image path or {img, scale}. Most paths share long
+directory prefixes, so this script:
+
+1. Interns directory prefixes into a string table
+2. Interns each distinct image path once as [prefixIndex, fileName]
+3. Emits a flat index of actor IDs sorted for binary search, with
+   parallel columns for compendium, actor image, token image and scale
+4. Reports referenced images that are missing from the Foundry data folder
+
+Output: token-map.compiled.json (project root)
+
+No runtime code reads the compiled table yet, so it is written next to
+token-map.json rather than into src/data-compiled, which the build
+copies into dist.
+
+Layout:
+    {
+      "prefixes":   ["pf2e-reignmaker-tokens/kingmaker", ...],
+      "paths":      [[0, "Token - Elk.webp"], ...],
+      "compendia":  ["kingmaker-bestiary", ...],
+      "ids":        ["0AbC...", ...],         # sorted
+      "compendium": [1, ...],                 # index into compendia
+      "actor":      [0, ...],                 # index into paths
+      "token":      [0, ...],                 # index into paths
+      "scale":      [null, 1.5, ...]
+    }
+
+Usage:
+    python buildscripts/compile-token-map.py [--data-root PATH] [--strict]
+
+--data-root defaults to the _foundry-data link in the project root.
+--strict exits with an error if any images are missing.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TOKEN_MAP_PATH = PROJECT_ROOT / "token-map.json"
+OUTPUT_FILE = PROJECT_ROOT / "token-map.compiled.json"
+DEFAULT_DATA_ROOT = PROJECT_ROOT / "_foundry-data"
+
+
+class StringTable:
+    """Assigns a stable index to each distinct value."""
+
+    def __init__(self):
+        self.values: List = []
+        self._index: Dict = {}
+
+    def intern(self, value) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = len(self.values)
+            self._index[value] = index
+            self.values.append(value)
+        return index
+
+
+def split_token(token) -> Tuple[str, Optional[float]]:
+    """Normalize a token entry to (image path, scale)."""
+    if isinstance(token, dict):
+        return token.get('img', ''), token.get('scale')
+    return token, None
+
+
+def compile_token_map(token_map: Dict) -> Dict:
+    """Flatten and intern the nested token map."""
+    prefixes = StringTable()
+    paths = StringTable()
+    compendia = StringTable()
+
+    def intern_path(path: str) -> int:
+        prefix, _, name = path.rpartition('/')
+        return paths.intern((prefixes.intern(prefix), name))
+
+    rows = []
+    for compendium, actors in token_map.items():
+        compendium_index = compendia.intern(compendium)
+        for actor_id, entry in actors.items():
+            token_path, scale = split_token(entry.get('token', entry.get('actor', '')))
+            rows.append((
+                actor_id,
+                compendium_index,
+                intern_path(entry.get('actor', token_path)),
+                intern_path(token_path),
+                scale,
+            ))
+
+    rows.sort(key=lambda row: (row[0], row[1]))
+
+    return {
+        'prefixes': prefixes.values,
+        'paths': [list(p) for p in paths.values],
+        'compendia': compendia.values,
+        'ids': [row[0] for row in rows],
+        'compendium': [row[1] for row in rows],
+        'actor': [row[2] for row in rows],
+        'token': [row[3] for row in rows],
+        'scale': [row[4] for row in rows],
+    }
+
+
+def find_missing_images(compiled: Dict, data_root: Path) -> List[str]:
+    """
+    List image paths that do not exist under the Foundry data folder.
+
+    Paths are tried relative to Data/ and Data/modules/.
+    """
+    missing = []
+    for prefix_index, name in compiled['paths']:
+        prefix = compiled['prefixes'][prefix_index]
+        relative = f"{prefix}/{name}" if prefix else name
+        candidates = (data_root / relative, data_root / "modules" / relative)
+        if not any(candidate.exists() for candidate in candidates):
+            missing.append(relative)
+    return missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile token-map.json into a lookup table")
+    parser.add_argument('--data-root', type=Path, default=DEFAULT_DATA_ROOT,
+                        help="Foundry Data folder used to check image paths")
+    parser.add_argument('--output', type=Path, default=OUTPUT_FILE)
+    parser.add_argument('--strict', action='store_true', help="Fail on missing images")
+    args = parser.parse_args()
+
+    print("🎭 Compiling token map...")
+    with open(TOKEN_MAP_PATH, 'r', encoding='utf-8') as f:
+        token_map = json.load(f)
+
+    compiled = compile_token_map(token_map)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(compiled, separators=(',', ':'))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+    source_size = TOKEN_MAP_PATH.stat().st_size
+    print(f"✅ {len(compiled['ids'])} actors, {len(compiled['paths'])} images, "
+          f"{len(compiled['prefixes'])} prefixes")
+    print(f"📁 Output written to: {args.output} "
+          f"({len(text) / 1024:.1f} KB, source {source_size / 1024:.1f} KB)")
+
+    if not args.data_root.exists():
+        print(f"\n⚠️  Data root not found, skipping image check: {args.data_root}")
+        return
+
+    missing = find_missing_images(compiled, args.data_root.resolve())
+    if missing:
+        print(f"\n⚠️  {len(missing)} referenced images are missing:")
+        for path in missing:
+            print(f"   • {path}")
+        if args.strict:
+            sys.exit(1)
+    else:
+        print("✅ All referenced images exist")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Incremental directory sync used by deploy.js.
+
+Instead of deleting and re-copying dist/, data/ and img/ on every deploy,
+this keeps a manifest of what was deployed and only touches what changed:
+
+1. Files whose size and mtime match the manifest are skipped without reading
+2. Otherwise the source is hashed; files whose content hash matches the
+   manifest are skipped (only the recorded stat is refreshed)
+3. Changed files are cloned with a reflink where the filesystem supports it
+   (Linux FICLONE), hardlinked with --hardlink, or copied
+4. Anything in the target directories that is not in the source is deleted
+   in the same walk
+
+Manifest: <target>/.deploy-manifest.json
+
+Usage:
+    python buildscripts/deploy-sync.py SOURCE_ROOT TARGET_ROOT DIR [DIR ...] [--hardlink] [--dry-run]
+
+Example:
+    python buildscripts/deploy-sync.py . ~/FoundryVTT/Data/modules/pf2e-reignmaker dist data img
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+MANIFEST_NAME = ".deploy-manifest.json"
+MANIFEST_VERSION = 1
+
+# ioctl number for FICLONE on Linux (copy-on-write clone, e.g. btrfs / xfs)
+FICLONE = 0x40049409
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def try_reflink(source: Path, target: Path) -> bool:
+    """Clone source into target with FICLONE; False if unsupported."""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        import fcntl
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        shutil.copystat(source, target)
+        return True
+    except (OSError, ImportError):
+        if target.exists():
+            target.unlink()
+        return False
+
+
+def place_file(source: Path, target: Path, hardlink: bool) -> str:
+    """Put source at target; returns the method used."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    if hardlink:
+        try:
+            os.link(source, target)
+            return 'link'
+        except OSError:
+            pass  # Different filesystem - fall through
+    if try_reflink(source, target):
+        return 'reflink'
+    shutil.copy2(source, target)
+    return 'copy'
+
+
+def load_manifest(target_root: Path) -> Dict:
+    path = target_root / MANIFEST_NAME
+    if path.exists():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+    return {'version': MANIFEST_VERSION, 'files': {}}
+
+
+def save_manifest(target_root: Path, manifest: Dict) -> None:
+    with open(target_root / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+
+def sync_directory(source_root: Path, target_root: Path, directory: str,
+                   manifest: Dict, hardlink: bool, dry_run: bool) -> Dict[str, int]:
+    """Sync one directory; returns counts per action."""
+    counts = {'unchanged': 0, 'copied': 0, 'deleted': 0}
+    files = manifest['files']
+    source_dir = source_root / directory
+    target_dir = target_root / directory
+
+    seen = set()
+    for dirpath, _, filenames in os.walk(source_dir):
+        for name in filenames:
+            source = Path(dirpath) / name
+            relative = source.relative_to(source_root).as_posix()
+            target = target_root / relative
+            seen.add(relative)
+
+            stat = source.stat()
+            entry = files.get(relative)
+            stat_key: Tuple[int, int] = (stat.st_size, stat.st_mtime_ns)
+            target_ok = target.exists() and entry is not None and target.stat().st_size == stat.st_size
+
+            if target_ok and (entry['size'], entry['mtime']) == stat_key:
+                counts['unchanged'] += 1
+                continue
+
+            digest = file_hash(source)
+            if target_ok and entry['sha256'] == digest:
+                entry['size'], entry['mtime'] = stat_key
+                counts['unchanged'] += 1
+                continue
+
+            if not dry_run:
+                place_file(source, target, hardlink)
+            files[relative] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': digest}
+            counts['copied'] += 1
+
+    # Single pass over the target to remove anything the source no longer has
+    if target_dir.exists():
+        for dirpath, dirnames, filenames in os.walk(target_dir, topdown=False):
+            for name in filenames:
+                target = Path(dirpath) / name
+                relative = target.relative_to(target_root).as_posix()
+                if relative not in seen:
+                    if not dry_run:
+                        target.unlink()
+                    files.pop(relative, None)
+                    counts['deleted'] += 1
+            if not dry_run and dirpath != str(target_dir) and not os.listdir(dirpath):
+                os.rmdir(dirpath)
+
+    # Drop manifest entries for files that vanished from both sides
+    prefix = f"{directory}/"
+    for relative in [r for r in files if r.startswith(prefix) and r not in seen]:
+        files.pop(relative)
+
+    return counts
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    hardlink = '--hardlink' in sys.argv
+    dry_run = '--dry-run' in sys.argv
+
+    if len(args) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    source_root, target_root = Path(args[0]).resolve(), Path(args[1]).resolve()
+    directories = args[2:]
+
+    started = time.perf_counter()
+    target_root.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(target_root)
+
+    if dry_run:
+        print("🔍 DRY RUN MODE - No files will be modified\n")
+
+    for directory in directories:
+        if not (source_root / directory).exists():
+            print(f"   ⚠️  Skipping {directory}/ (not found)")
+            continue
+        counts = sync_directory(source_root, target_root, directory, manifest, hardlink, dry_run)
+        print(f"   📁 {directory}/: {counts['copied']} updated, {counts['deleted']} removed, "
+              f"{counts['unchanged']} unchanged")
+
+    if not dry_run:
+        save_manifest(target_root, manifest)
+
+    print(f"✅ Sync finished in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
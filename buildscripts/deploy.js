@@ -7,7 +7,7 @@
 
 import fs from 'fs';
 import path from 'path';
-import { execSync } from 'child_process';
+import { execSync, spawnSync } from 'child_process';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
 
@@ -112,8 +112,16 @@ filesToCopy.forEach(file => {
     }
 });
 
+// Sync directories incrementally (only changed files are copied, stale files removed)
+// Falls back to a full remove-and-copy if the Python sync fails
+const syncSucceeded = syncDirectories(directoriesToCopy);
+
 // Copy directories
 directoriesToCopy.forEach(dir => {
+    if (syncSucceeded) {
+        return;
+    }
+
     const sourcePath = path.join(PROJECT_ROOT, dir);
     const targetPath = path.join(TARGET_DIR, dir);
     
@@ -130,6 +138,28 @@ directoriesToCopy.forEach(dir => {
     }
 });
 
+/**
+ * Sync directories into the target using buildscripts/deploy-sync.py
+ * Keeps a hash manifest in the target so repeat deploys only copy changed files
+ * @returns true if the sync succeeded
+ */
+function syncDirectories(dirs) {
+    console.log('   🔄 Syncing directories (incremental)...');
+    const result = spawnSync('node', [
+        path.join(__dirname, 'run-python.js'),
+        path.join(__dirname, 'deploy-sync.py'),
+        PROJECT_ROOT,
+        TARGET_DIR,
+        ...dirs
+    ], { stdio: 'inherit', cwd: PROJECT_ROOT });
+
+    if (result.status !== 0) {
+        console.log('   ⚠️  Incremental sync failed, falling back to full copy');
+        return false;
+    }
+    return true;
+}
+
 /**
  * Clean old build artifacts from the target directory
  * Removes hash-named JS files, source maps, and CSS files
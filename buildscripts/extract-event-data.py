@@ -6,9 +6,10 @@ and update the EVENT_SKILLS_TABLE.csv file.
 
 import os
 import re
-import csv
 from pathlib import Path
 
+from planning_tables import load_table, write_table
+
 # Map event file names to CSV event numbers
 EVENT_FILE_MAP = {
     'criminal-trial': 1,
@@ -171,13 +172,10 @@ def extract_event_data(filepath):
 
 def update_csv():
     """Update the CSV file with extracted data."""
-    csv_path = Path('docs/planning/EVENT_SKILLS_TABLE.csv')
+    table = load_table('events')
+    csv_path = table.relative_path
     events_dir = Path('src/pipelines/events')
-    
-    # Read existing CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    rows = table.records()
     
     # Extract data from all event files
     event_data = {}
@@ -197,35 +195,15 @@ def update_csv():
                 for app in approaches:
                     print(f"  Found {app['approach']}: {app['skills'][:50]}...")
     
-    # Update CSV rows
-    # Track which event we're in and which approach (row 0, 1, 2 for virtuous, practical, ruthless)
-    current_event = None
-    approach_index = 0
-    
-    for row in rows:
-        # Check if this is a new event (Name column is not empty)
-        name = row.get('Name', '').strip()
-        if name:
-            # Extract event number
-            match = re.match(r'^(\d+)\.', name)
-            if match:
-                current_event = int(match.group(1))
-                approach_index = 0  # First row is virtuous
-            else:
-                current_event = None
-        else:
-            # Empty Name means continuation of previous event
-            approach_index += 1
+    # Update CSV rows (the table resolves each row's event and approach)
+    for index, row in enumerate(rows):
+        match = re.match(r'^(\d+)\.', table.event[index])
+        current_event = int(match.group(1)) if match else None
         
         if current_event == 27:  # Skip deleted event
             continue
         
-        # Map approach_index to approach type
-        approach_map = ['virtuous', 'practical', 'ruthless']
-        if approach_index < len(approach_map):
-            approach_type = approach_map[approach_index]
-        else:
-            approach_type = None
+        approach_type = (table.approach[index] or '').lower() or None
         
         # Update row if we have data
         if current_event and current_event in event_data and approach_type and approach_type in event_data[current_event]:
@@ -238,11 +216,7 @@ def update_csv():
             print(f"✓ Updated Event {current_event} - {approach_type}")
     
     # Write updated CSV
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        fieldnames = rows[0].keys()
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    write_table(table, rows)
     
     print(f"\n✅ Updated {csv_path}")
 
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Golden-vector generator for the kingdom economy (TS hot path).
+
+Builds randomized but valid kingdom states from the
+data/simulation/starter-kingdom.json schema - hexes, settlements with
+structures from data/structures/, armies, resources - and writes them as
+JSON Lines, together with the aggregates the TS functions should return.
+The expected values are computed here from the rules (tables below), not
+from the TS sources, so a benchmark or equivalence test can check
+src/services/economics/ and the src/domain/*Logic.ts functions against
+an independent implementation.
+
+One case is written as:
+
+    {"type": "kingdom", "case": "case-0000", "kingdom": {... "hexes": []}, "inputs": {...}}
+    {"type": "hexes", "case": "case-0000", "offset": 0, "hexes": [...]}     # --chunk-size per line
+    ...
+    {"type": "expected", "case": "case-0000", "expected": {...}}
+
+preceded by one {"type": "meta"} line. Hexes are generated, written and
+folded into the expected aggregates one chunk at a time, so a case with a
+million hexes never holds more than one chunk (plus its settlements) in
+memory. Concatenate the hex chunks into kingdom.hexes to rebuild the state.
+
+Expected keys name the function they check:
+
+    economics.activeModifiers   EconomicsService.getActiveModifiers(kingdom + inputs)
+    economics.production        calculateProduction(hexes, activeModifiers)
+    economics.consumption       calculateConsumption(settlements, armies, hexes, activeModifiers)
+    economics.military          EconomicsService.calculateMilitarySupport(settlements, armies, hexes)
+    economics.settlementGold    EconomicsService.calculateSettlementGoldIncome(settlements, hexes)
+    economics.foodSupply        checkFoodSupply(resources.food, consumption)
+    domain.*                    collectionLogic, feedingLogic, capacityLogic, worksiteLogic
+                                (capacityLogic reads settlement.structures; pass
+                                structureIds.map(id => ({ id })))
+
+Usage:
+    python buildscripts/generate-golden-vectors.py [--cases 20] [--hexes 500] [--seed 1]
+                                                   [--chunk-size 1000] [--output PATH]
+    python buildscripts/generate-golden-vectors.py --cases 1 --hexes 1000000 --output big.jsonl.gz
+"""
+
+import argparse
+import gzip
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from structure_catalog import StructureCatalog
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+STARTER_KINGDOM = PROJECT_ROOT / "data" / "simulation" / "starter-kingdom.json"
+DEFAULT_OUTPUT = PROJECT_ROOT / "golden-vectors" / "economics.jsonl"
+
+FORMAT_VERSION = 1
+
+PLAYER_KINGDOM = 'player'
+RIVAL_FACTIONS = ('Pitax', 'Brevoy', 'Mivon')
+
+TERRAIN_WEIGHTS = {
+    'plains': 25, 'forest': 25, 'hills': 15, 'mountains': 10,
+    'swamp': 10, 'desert': 5, 'water': 10,
+}
+
+TIERS = ('Village', 'Town', 'City', 'Metropolis')
+TIER_WEIGHTS = (50, 30, 15, 5)
+
+# ----------------------------------------------------------------------
+# Rules (each table names the TS code it must agree with)
+# ----------------------------------------------------------------------
+
+# services/economics/production.ts getWorksiteBaseProduction: (type, terrain) → production
+SERVICE_WORKSITES = {
+    'Farmstead': lambda t: {'food': 2 if t == 'plains' else 1},
+    'Logging Camp': lambda t: {'lumber': 2} if t == 'forest' else {},
+    'Quarry': lambda t: {'stone': 1} if t in ('hills', 'mountains') else {},
+    'Mine': lambda t: {'ore': 1} if t in ('mountains', 'swamp') else {},
+    'Bog Mine': lambda t: {'ore': 1} if t in ('mountains', 'swamp') else {},
+    'Hunting/Fishing Camp': lambda t: {'food': 1} if t == 'swamp' else {},
+    'Oasis Farm': lambda t: {'food': 1} if t == 'desert' else {},
+}
+
+# domain/territory/worksiteLogic.ts WORKSITE_CONFIG: type → (valid terrains, production)
+DOMAIN_WORKSITES = {
+    'Farmstead': (('plains', 'forest', 'hills', 'swamp'), lambda t: {'food': 2 if t == 'plains' else 1}),
+    'Logging Camp': (('forest',), lambda t: {'lumber': 2}),
+    'Quarry': (('hills', 'mountains'), lambda t: {'stone': 2}),
+    'Mine': (('mountains',), lambda t: {'ore': 2}),
+    'Bog Mine': (('swamp',), lambda t: {'ore': 1}),
+}
+
+# Worksites a player would actually build per terrain (most generated hexes)
+VALID_WORKSITES = {
+    'plains': ('Farmstead',),
+    'forest': ('Logging Camp', 'Farmstead'),
+    'hills': ('Quarry', 'Farmstead'),
+    'mountains': ('Mine', 'Quarry'),
+    'swamp': ('Hunting/Fishing Camp', 'Bog Mine', 'Farmstead'),
+    'desert': ('Oasis Farm',),
+    'water': ('Farmstead',),
+}
+
+# models/Settlement.ts SettlementTierConfig (used by services/economics)
+SERVICE_TIER_FOOD = {'Village': 1, 'Town': 3, 'City': 6, 'Metropolis': 9}
+SERVICE_TIER_ARMY_SUPPORT = {'Village': 1, 'Town': 2, 'City': 3, 'Metropolis': 4}
+MAX_STRUCTURES = {'Village': 2, 'Town': 5, 'City': 8, 'Metropolis': 12}  # Metropolis is unlimited
+
+# services/economics/production.ts getTierGoldValue
+SERVICE_TIER_GOLD = {'village': 1, 'town': 2, 'city': 4, 'metropolis': 6}
+
+# domain/settlements/tierLogic.ts SETTLEMENT_TIER_CONFIG (tier, consumption)
+DOMAIN_TIER = {'Village': (1, 1), 'Town': (2, 2), 'City': (3, 4), 'Metropolis': (4, 6)}
+
+# domain/resources/collectionLogic.ts
+DOMAIN_GOLD_INCOME = {'Village': 1, 'Town': 2, 'City': 4, 'Metropolis': 6}
+DOMAIN_FOOD_CONSUMPTION = {'Village': 1, 'Town': 2, 'City': 4, 'Metropolis': 6}
+
+# domain/structures/capacityLogic.ts
+FOOD_STORAGE_BY_STRUCTURE = {'granary': 4, 'storehouses': 8, 'warehouses': 16, 'strategic-reserves': 36}
+ARMY_SUPPORT_BY_STRUCTURE = {'garrison': 1, 'barracks': 2, 'fortress': 3, 'citadel': 4}
+DOMAIN_TIER_ARMY_SUPPORT = {'Village': 1, 'Town': 2, 'City': 3, 'Metropolis': 4}
+
+# services/economics/bonuses.ts
+LEADERSHIP_RESOURCES = {'agriculture': ('Agriculture Leadership', 'food'),
+                        'mining': ('Mining Leadership', 'ore'),
+                        'forestry': ('Forestry Leadership', 'lumber')}
+SEASONS = {
+    'winter': {'name': 'Winter', 'type': 'production', 'affectedResources': ['food'], 'multiplier': 0.75},
+    'summer': {'name': 'Summer', 'type': 'production', 'affectedResources': ['food'], 'multiplier': 1.25},
+}
+
+
+def active_modifiers(is_at_war: bool, season: Optional[str], economy: Optional[int], unrest: Optional[int],
+                     leadership: Dict[str, int]) -> List[Dict]:
+    """EconomicsService.getActiveModifiers, modifier for modifier."""
+    modifiers = []
+    if is_at_war:
+        modifiers.append({'name': 'War Effort', 'type': 'both', 'affectedResources': [], 'multiplier': 0.9})
+    if season and season.lower() in SEASONS:
+        modifiers.append(dict(SEASONS[season.lower()]))
+    if economy is not None and unrest is not None:
+        efficiency = 1.0
+        efficiency += min(economy * 0.01, 0.5)
+        efficiency -= unrest * 0.02
+        efficiency = max(0.1, min(2.0, efficiency))
+        if efficiency != 1.0:
+            modifiers.append({'name': 'Economic Efficiency', 'type': 'production',
+                              'affectedResources': [], 'multiplier': efficiency})
+    for skill, value in leadership.items():
+        if skill.lower() in LEADERSHIP_RESOURCES and value > 0:
+            source, resource = LEADERSHIP_RESOURCES[skill.lower()]
+            modifiers.append({'name': source, 'type': 'production', 'affectedResources': [resource],
+                              'flatBonus': value // 5})
+    return modifiers
+
+
+def apply_production_modifiers(base: Dict[str, int], modifiers: List[Dict]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """production.ts applyModifier over every production/both modifier; returns (total, bonuses)."""
+    total, bonuses = dict(base), {}
+    for modifier in modifiers:
+        if modifier['type'] not in ('production', 'both'):
+            continue
+        for resource in modifier['affectedResources'] or list(total):
+            current = total.get(resource, 0)
+            bonus = 0
+            multiplier = modifier.get('multiplier')
+            if multiplier and multiplier != 1.0:
+                bonus += math.floor(current * (multiplier - 1))
+            if modifier.get('flatBonus'):
+                bonus += modifier['flatBonus']
+            if bonus != 0:
+                total[resource] = current + bonus
+                bonuses[resource] = bonuses.get(resource, 0) + bonus
+    return total, bonuses
+
+
+def apply_consumption_modifiers(food: int, modifiers: List[Dict]) -> int:
+    """consumption.ts applyConsumptionModifier for food."""
+    for modifier in modifiers:
+        if modifier['type'] not in ('consumption', 'both'):
+            continue
+        if modifier['affectedResources'] and 'food' not in modifier['affectedResources']:
+            continue
+        if modifier.get('multiplier'):
+            food = math.ceil(food * modifier['multiplier'])
+        if modifier.get('flatBonus'):
+            food += modifier['flatBonus']
+        food = max(0, food)
+    return food
+
+
+# ----------------------------------------------------------------------
+# Generation
+# ----------------------------------------------------------------------
+
+def weighted(rng: random.Random, weights: Dict[str, int]) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def grid_size(hex_count: int) -> Tuple[int, int]:
+    """(rows, cols) of the smallest near-square grid holding hex_count hexes."""
+    cols = max(1, math.ceil(math.sqrt(hex_count)))
+    return math.ceil(hex_count / cols), cols
+
+
+def structure_families(catalog: StructureCatalog) -> List[List[str]]:
+    """Tier ids per family category, lowest tier first."""
+    families: Dict[str, List[Tuple[int, str]]] = {}
+    for tier_id, category, number in zip(catalog.tier_id, catalog.category, catalog.tier):
+        families.setdefault(category, []).append((number, tier_id))
+    return [[tier_id for _, tier_id in sorted(tiers)] for _, tiers in sorted(families.items())]
+
+
+class CaseGenerator:
+    """One randomized kingdom, streamed hex chunk by hex chunk."""
+
+    def __init__(self, name: str, rng: random.Random, hex_count: int, template: Dict, families: List[List[str]]):
+        self.name = name
+        self.rng = rng
+        self.hex_count = hex_count
+        self.rows, self.cols = grid_size(hex_count)
+        self.families = families
+
+        self.claim_rate = rng.uniform(0.2, 0.9)
+        self.worksite_rate = rng.uniform(0.3, 0.8)
+        self.settlements = self.make_settlements()
+        self.armies = self.make_armies()
+
+        # Settlement hexes get a fixed owner; everything else is rolled as it streams
+        self.settlement_owner: Dict[Tuple[int, int], Optional[str]] = {}
+        for settlement in self.settlements:
+            location = (settlement['location']['x'], settlement['location']['y'])
+            if location != (0, 0):
+                self.settlement_owner.setdefault(
+                    location, PLAYER_KINGDOM if rng.random() < 0.9 else rng.choice((None,) + RIVAL_FACTIONS))
+
+        kingdom = json.loads(json.dumps(template))
+        kingdom.pop('_comment', None)
+        food_need = sum(DOMAIN_TIER[s['tier']][1] for s in self.settlements)
+        kingdom.update({
+            'name': f"Golden Kingdom {name}",
+            'currentTurn': rng.randint(1, 40),
+            'setupComplete': True,
+            'hexes': [],
+            'settlements': self.settlements,
+            'armies': self.armies,
+            'unrest': rng.randint(0, 20),
+            'fame': rng.randint(0, 3),
+            'isAtWar': rng.random() < 0.3,
+            'partyLevel': rng.randint(1, 20),
+        })
+        kingdom['resources'] = dict(template.get('resources', {}), **{
+            'gold': rng.randint(0, 200),
+            'food': rng.randint(0, food_need * 2 + 4),
+            'lumber': rng.randint(0, 30),
+            'stone': rng.randint(0, 30),
+            'ore': rng.randint(0, 30),
+        })
+        self.kingdom = kingdom
+        self.inputs = {
+            'season': rng.choice((None, 'winter', 'summer', 'spring')),
+            'economy': rng.randint(0, 60),
+            'leadershipSkills': {skill: rng.randint(0, 20) for skill in rng.sample(
+                ['agriculture', 'mining', 'forestry', 'diplomacy'], rng.randint(0, 4))},
+        }
+
+    def make_settlements(self) -> List[Dict]:
+        rng = self.rng
+        count = max(1, min(self.hex_count // 60, 20000))
+        cells = rng.sample(range(self.hex_count), count)
+        has_capital = rng.random() < 0.8
+        settlements = []
+        for index, cell in enumerate(cells):
+            row, col = divmod(cell, self.cols)
+            if rng.random() < 0.03:
+                row, col = 0, 0  # Unmapped settlement (never counted)
+            tier = rng.choices(TIERS, weights=TIER_WEIGHTS)[0]
+            families = rng.sample(self.families, min(len(self.families), rng.randint(0, MAX_STRUCTURES[tier])))
+            settlements.append({
+                'id': f"{self.name}-settlement-{index}",
+                'name': f"Settlement {index}",
+                'location': {'x': row, 'y': col},
+                'level': rng.randint(1, 20),
+                'tier': tier,
+                'structureIds': [rng.choice(family) for family in families],
+                'connectedByRoads': rng.random() < 0.5,
+                'isCapital': has_capital and index == 0,
+                'ownedBy': PLAYER_KINGDOM,
+                'storedFood': 0,
+                'imprisonedUnrest': 0,
+                'supportedUnits': [],
+                'wasFedLastTurn': rng.random() < 0.8,
+            })
+        return settlements
+
+    def make_armies(self) -> List[Dict]:
+        rng = self.rng
+        count = int(len(self.settlements) * rng.uniform(0.3, 2.0))
+        return [{
+            'id': f"{self.name}-army-{index}",
+            'name': f"Army {index}",
+            'level': rng.randint(1, 20),
+            'type': rng.choice(('infantry', 'cavalry', 'engineers')),
+            'ledBy': PLAYER_KINGDOM,
+            'supportedBy': PLAYER_KINGDOM,
+            'isSupported': True,
+            'supportedBySettlementId': None,
+            'turnsUnsupported': 0,
+        } for index in range(count)]
+
+    def make_hex(self, cell: int) -> Dict:
+        rng = self.rng
+        row, col = divmod(cell, self.cols)
+        terrain = weighted(rng, TERRAIN_WEIGHTS)
+        if (row, col) in self.settlement_owner:
+            owner = self.settlement_owner[(row, col)]
+        elif rng.random() < self.claim_rate:
+            owner = PLAYER_KINGDOM
+        else:
+            owner = rng.choice(RIVAL_FACTIONS) if rng.random() < 0.2 else None
+
+        hex_data = {
+            'id': f"{row}.{col}",
+            'row': row,
+            'col': col,
+            'terrain': terrain,
+            'claimedBy': owner,
+            'hasRoad': rng.random() < 0.15,
+            'features': [],
+        }
+        # Unclaimed worksites are rare but legal (production.ts does not check ownership)
+        if rng.random() < (self.worksite_rate if owner == PLAYER_KINGDOM else 0.05):
+            valid = rng.random() < 0.85
+            hex_data['worksite'] = {'type': rng.choice(VALID_WORKSITES[terrain] if valid else list(SERVICE_WORKSITES))}
+            hex_data['hasCommodityBonus'] = rng.random() < 0.1
+        return hex_data
+
+    def hex_chunks(self, chunk_size: int) -> Iterator[Tuple[int, List[Dict]]]:
+        for offset in range(0, self.hex_count, chunk_size):
+            yield offset, [self.make_hex(cell) for cell in range(offset, min(offset + chunk_size, self.hex_count))]
+
+
+# ----------------------------------------------------------------------
+# Expected aggregates
+# ----------------------------------------------------------------------
+
+class Expected:
+    """Folds hex chunks into the aggregates; settlements and armies are small."""
+
+    def __init__(self, case: CaseGenerator):
+        self.case = case
+        self.base_production: Dict[str, int] = {}
+        self.worksite_hexes = 0
+        self.domain_worksites = {'food': 0, 'lumber': 0, 'stone': 0, 'ore': 0}
+        # First hex per settlement location (hexes.find semantics)
+        self.location_owner: Dict[Tuple[int, int], Optional[str]] = {}
+
+    def add_hexes(self, hexes: List[Dict]) -> None:
+        settlement_cells = self.case.settlement_owner
+        for hex_data in hexes:
+            key = (hex_data['row'], hex_data['col'])
+            if key in settlement_cells and key not in self.location_owner:
+                self.location_owner[key] = hex_data['claimedBy']
+
+            worksite = hex_data.get('worksite')
+            if not worksite:
+                continue
+            terrain = hex_data['terrain'].lower()
+
+            self.worksite_hexes += 1
+            production = dict(SERVICE_WORKSITES.get(worksite['type'], lambda t: {})(terrain))
+            if hex_data.get('hasCommodityBonus'):
+                production = {r: amount + 1 for r, amount in production.items()}
+            for resource, amount in production.items():
+                self.base_production[resource] = self.base_production.get(resource, 0) + amount
+
+            if hex_data['claimedBy'] == PLAYER_KINGDOM and worksite['type'] in DOMAIN_WORKSITES:
+                valid, produce = DOMAIN_WORKSITES[worksite['type']]
+                if terrain in valid:
+                    for resource, amount in produce(terrain).items():
+                        self.domain_worksites[resource] += amount
+
+    def in_claimed_territory(self, settlement: Dict) -> bool:
+        location = (settlement['location']['x'], settlement['location']['y'])
+        if location == (0, 0):
+            return False
+        return self.location_owner.get(location) == PLAYER_KINGDOM
+
+    def result(self) -> Dict:
+        case = self.case
+        kingdom, inputs = case.kingdom, case.inputs
+        settlements, armies = kingdom['settlements'], kingdom['armies']
+        modifiers = active_modifiers(kingdom['isAtWar'], inputs['season'], inputs['economy'],
+                                     kingdom['unrest'], inputs['leadershipSkills'])
+
+        total, bonuses = apply_production_modifiers(self.base_production, modifiers)
+
+        mapped = [s for s in settlements if self.in_claimed_territory(s)]
+        settlement_food = sum(SERVICE_TIER_FOOD[s['tier']] for s in mapped)
+        total_food = apply_consumption_modifiers(settlement_food + len(armies), modifiers)
+        capacity = sum(SERVICE_TIER_ARMY_SUPPORT[s['tier']] for s in mapped)
+
+        has_capital = any(s['isCapital'] for s in settlements)
+        gold = 0
+        for s in mapped:
+            if s['wasFedLastTurn']:
+                value = SERVICE_TIER_GOLD[s['tier'].lower()]
+                gold += value * 2 if s['isCapital'] or (has_capital and s['connectedByRoads']) else value
+
+        # feedingLogic.ts: capital first, then tier descending (stable sort)
+        ordered = sorted(settlements, key=lambda s: (not s['isCapital'], -DOMAIN_TIER[s['tier']][0]))
+        food = kingdom['resources']['food']
+        fed, unfed, consumed, unrest = [], [], 0, 0
+        for s in ordered:
+            need = DOMAIN_TIER[s['tier']][1]
+            if food >= need:
+                fed.append(s['id'])
+                consumed += need
+                food -= need
+            else:
+                unfed.append(s['id'])
+                unrest += DOMAIN_TIER[s['tier']][0]
+
+        army_support = sum(DOMAIN_TIER_ARMY_SUPPORT[s['tier']]
+                           + sum(ARMY_SUPPORT_BY_STRUCTURE.get(i, 0) for i in s['structureIds'])
+                           for s in settlements)
+
+        return {
+            'economics': {
+                'activeModifiers': modifiers,
+                'production': {
+                    'baseProduction': self.base_production,
+                    'bonuses': bonuses,
+                    'totalProduction': total,
+                    'worksiteHexes': self.worksite_hexes,
+                },
+                'consumption': {
+                    'settlementFood': settlement_food,
+                    'armyFood': len(armies),
+                    'totalFood': total_food,
+                },
+                'military': {
+                    'capacity': capacity,
+                    'current': len(armies),
+                    'unsupported': max(0, len(armies) - capacity),
+                },
+                'settlementGold': gold,
+                'foodSupply': {
+                    'canFeed': total_food <= kingdom['resources']['food'],
+                    'shortage': max(0, total_food - kingdom['resources']['food']),
+                },
+            },
+            'domain': {
+                'totalWorksiteProduction': self.domain_worksites,
+                'settlementGoldIncome': sum(DOMAIN_GOLD_INCOME.get(s['tier'], 0)
+                                            for s in settlements if s['wasFedLastTurn']),
+                'totalFoodConsumption': sum(DOMAIN_FOOD_CONSUMPTION.get(s['tier'], 0) for s in settlements),
+                'feeding': {'fed': fed, 'unfed': unfed, 'foodConsumed': consumed, 'unrestGenerated': unrest},
+                'totalFoodStorage': sum(max([FOOD_STORAGE_BY_STRUCTURE.get(i, 0) for i in s['structureIds']] + [0])
+                                        for s in settlements),
+                'totalArmySupport': army_support,
+                'unsupportedArmies': max(0, len(armies) - army_support),
+            },
+        }
+
+
+# ----------------------------------------------------------------------
+# Output
+# ----------------------------------------------------------------------
+
+def open_output(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.gz':
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    return open(path, 'w', encoding='utf-8')
+
+
+def write_line(out, record: Dict) -> None:
+    out.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+
+def generate(output: Path, cases: int, hex_count: int, seed: int, chunk_size: int) -> Dict[str, int]:
+    """Stream all cases to output; returns totals for the summary line."""
+    with open(STARTER_KINGDOM, 'r', encoding='utf-8') as f:
+        template = json.load(f)
+    families = structure_families(StructureCatalog.load())
+
+    totals = {'cases': 0, 'hexes': 0, 'settlements': 0, 'armies': 0}
+    with open_output(output) as out:
+        write_line(out, {
+            'type': 'meta',
+            'version': FORMAT_VERSION,
+            'seed': seed,
+            'cases': cases,
+            'hexesPerCase': hex_count,
+            'chunkSize': chunk_size,
+            'template': STARTER_KINGDOM.relative_to(PROJECT_ROOT).as_posix(),
+        })
+        for index in range(cases):
+            name = f"case-{index:04d}"
+            case = CaseGenerator(name, random.Random(f"{seed}:{name}"), hex_count, template, families)
+            expected = Expected(case)
+
+            write_line(out, {'type': 'kingdom', 'case': name, 'hexCount': hex_count,
+                             'kingdom': case.kingdom, 'inputs': case.inputs})
+            for offset, hexes in case.hex_chunks(chunk_size):
+                expected.add_hexes(hexes)
+                write_line(out, {'type': 'hexes', 'case': name, 'offset': offset, 'hexes': hexes})
+            write_line(out, {'type': 'expected', 'case': name, 'expected': expected.result()})
+
+            totals['cases'] += 1
+            totals['hexes'] += hex_count
+            totals['settlements'] += len(case.settlements)
+            totals['armies'] += len(case.armies)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate golden vectors for the kingdom economy")
+    parser.add_argument('--cases', type=int, default=20, help="Number of kingdom states")
+    parser.add_argument('--hexes', type=int, default=500, help="Hexes per kingdom")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed (same seed → same file)")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="Hexes per JSON line")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help="JSONL output (.gz to compress)")
+    args = parser.parse_args()
+
+    if args.cases < 1 or args.hexes < 1 or args.chunk_size < 1:
+        parser.error("--cases, --hexes and --chunk-size must be positive")
+
+    started = time.perf_counter()
+    totals = generate(args.output, args.cases, args.hexes, args.seed, args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    try:
+        shown = args.output.resolve().relative_to(PROJECT_ROOT.resolve())
+    except ValueError:
+        shown = args.output
+    print(f"📁 Golden vectors written to: {shown}")
+    print(f"📊 {totals['cases']} cases, {totals['hexes']:,} hexes, {totals['settlements']:,} settlements, "
+          f"{totals['armies']:,} armies in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
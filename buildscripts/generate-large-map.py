@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Generate large synthetic map exports for pathfinding and rendering scale tests.
+
+Writes a map in the stolen-lands-map.json schema (terrain, roads,
+rivers.paths / crossings / waterfalls, waterFeatures.lakes / swamps) at
+any size - 10k, 100k, 1M hexes. Terrain comes from layered value noise
+(elevation + moisture), so every hex is a pure function of (row, col,
+seed) and is written as it is computed; the map is never held in memory.
+Only the sparse layers are kept: river and road hexes, plus the cell
+indexes of lake and swamp hexes (array('i')) for the waterFeatures lists.
+
+River networks follow the elevation field: sources on high ground walk
+downhill hex by hex, with a little jitter, until they reach water, the
+map border or another river (a confluence). A pit becomes a lake. Each
+step is written as a point on the shared edge, the same shape the river
+editor produces, so merge-waterways.py and the pathfinding services read
+them like the real map. Steep steps get waterfalls, roads that cross a
+river get a bridge, and some river edges get fords.
+
+The pixel-level layers (rivers.cellPaths / rasterizedCells,
+waterFeatures.lakeCells / passageCells) depend on the scene's canvas
+geometry and are written empty; NavigationGrid falls back to the paths.
+
+The same --seed and --hexes always produce the same file.
+
+Usage:
+    python buildscripts/generate-large-map.py [--hexes 10k] [--seed 1] [--output PATH]
+    python buildscripts/generate-large-map.py --hexes 1m --output big-map.json.gz
+"""
+
+import argparse
+import gzip
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from hex_grid import Hex, canonical_edge_id, format_hex_id, neighbors
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+OUTPUT_DIR = PROJECT_ROOT / "synthetic-maps"
+
+# Fixed so the same seed gives a byte-identical file
+EXPORT_DATE = '2000-01-01T00:00:00.000Z'
+
+# src/types/terrain.ts getTravelDifficultyFromTerrain
+TRAVEL = {
+    'plains': 'open',
+    'desert': 'open',
+    'hills': 'difficult',
+    'forest': 'difficult',
+    'mountains': 'greater-difficult',
+    'swamp': 'greater-difficult',
+    'water': 'water',
+}
+
+SEA_LEVEL = 0.3
+# Elevation drop per hex, in noise-cell units, that makes a waterfall
+WATERFALL_GRADIENT = 1.0
+FORD_RATE = 0.05
+
+
+def parse_count(value: str) -> int:
+    """'10k' → 10000, '1m' → 1000000, '2500' → 2500."""
+    text = value.strip().lower()
+    scale = {'k': 1_000, 'm': 1_000_000}.get(text[-1:], 1)
+    try:
+        count = int(float(text[:-1] if scale > 1 else text) * scale)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a hex count: {value!r}")
+    if count < 1:
+        raise argparse.ArgumentTypeError("hex count must be positive")
+    return count
+
+
+# ----------------------------------------------------------------------
+# Terrain field
+# ----------------------------------------------------------------------
+
+def _lattice(x: int, y: int, seed: int) -> float:
+    """Deterministic pseudo-random value in [0, 1) for a lattice point."""
+    h = (x * 374761393 + y * 668265263 + seed * 2246822519) & 0xFFFFFFFF
+    h = ((h ^ (h >> 13)) * 1274126177) & 0xFFFFFFFF
+    return (h ^ (h >> 16)) / 4294967296.0
+
+
+_corners: Dict[Tuple[int, int, int], Tuple[float, float, float, float]] = {}
+
+
+def _value_noise(x: float, y: float, seed: int) -> float:
+    x0, y0 = math.floor(x), math.floor(y)
+    # Neighbouring hexes share lattice cells; the corner cache stays small (cells, not hexes)
+    key = (x0, y0, seed)
+    corners = _corners.get(key)
+    if corners is None:
+        corners = _corners[key] = (_lattice(x0, y0, seed), _lattice(x0 + 1, y0, seed),
+                                   _lattice(x0, y0 + 1, seed), _lattice(x0 + 1, y0 + 1, seed))
+    a, b, c, d = corners
+    tx, ty = x - x0, y - y0
+    tx, ty = tx * tx * (3 - 2 * tx), ty * ty * (3 - 2 * ty)
+    top = a + (b - a) * tx
+    bottom = c + (d - c) * tx
+    return top + (bottom - top) * ty
+
+
+class TerrainField:
+    """Elevation and moisture as pure functions of (row, col)."""
+
+    OCTAVES = ((1.0, 0.55), (2.0, 0.3), (4.0, 0.15))  # (frequency, weight)
+
+    def __init__(self, hex_count: int, cols: int, seed: int):
+        self.hex_count = hex_count
+        self.cols = cols
+        self.rows = math.ceil(hex_count / cols)
+        self.seed = seed
+        # Continent-sized features: a few noise cells across the map
+        self.scale = max(6.0, max(self.rows, cols) / 6.0)
+
+    def _layered(self, row: int, col: int, seed: int) -> float:
+        # Offset odd rows by half a hex so the field is isotropic on the grid
+        x = (col + 0.5 * (row & 1)) / self.scale
+        y = row * 0.866 / self.scale
+        return sum(weight * _value_noise(x * f, y * f, seed + i)
+                   for i, (f, weight) in enumerate(self.OCTAVES))
+
+    def elevation(self, row: int, col: int) -> float:
+        return self._layered(row, col, self.seed * 16)
+
+    def moisture(self, row: int, col: int) -> float:
+        return self._layered(row, col, self.seed * 16 + 8)
+
+    def terrain(self, row: int, col: int, lakes: Set[Hex]) -> str:
+        if (row, col) in lakes:
+            return 'water'
+        elevation = self.elevation(row, col)
+        if elevation < SEA_LEVEL:
+            return 'water'
+        if elevation > 0.72:
+            return 'mountains'
+        if elevation > 0.62:
+            return 'hills'
+        moisture = self.moisture(row, col)
+        if moisture > 0.66 and elevation < 0.42:
+            return 'swamp'
+        if moisture > 0.52:
+            return 'forest'
+        if moisture < 0.3:
+            return 'desert'
+        return 'plains'
+
+    def in_grid(self, row: int, col: int) -> bool:
+        # The last row may be partial
+        return 0 <= row and 0 <= col < self.cols and row * self.cols + col < self.hex_count
+
+
+# ----------------------------------------------------------------------
+# Sparse layers
+# ----------------------------------------------------------------------
+
+class MapLayers:
+    """Rivers, lakes, roads and crossings (everything except per-hex terrain)."""
+
+    def __init__(self, field: TerrainField, hex_count: int, rng: random.Random):
+        self.field = field
+        self.hex_count = hex_count
+        self.rng = rng
+
+        self.lakes: Set[Hex] = set()
+        self.river_hexes: Dict[Hex, int] = {}
+        self.river_edges: Dict[str, Tuple[int, int]] = {}  # edge id → (path index, point index)
+        self.paths: List[Dict] = []
+        self.waterfalls: List[Dict] = []
+        self.crossings: List[Dict] = []
+        self.roads: Set[Hex] = set()
+
+    def new_id(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def cell(self, index: int) -> Hex:
+        return divmod(index, self.field.cols)
+
+    def is_water(self, hex_: Hex) -> bool:
+        return hex_ in self.lakes or self.field.elevation(*hex_) < SEA_LEVEL
+
+    # Rivers ------------------------------------------------------------
+
+    def build_rivers(self) -> None:
+        field, rng = self.field, self.rng
+        candidates = [self.cell(i) for i in rng.sample(range(self.hex_count), max(1, self.hex_count // 25))]
+        sources = sorted((h for h in candidates if field.elevation(*h) > 0.5),
+                         key=lambda h: -field.elevation(*h))
+        max_length = int(4 * math.sqrt(self.hex_count)) + 20
+        for source in sources:
+            if source not in self.river_hexes:
+                self.trace_river(source, max_length)
+
+    def trace_river(self, source: Hex, max_length: int) -> None:
+        field, rng = self.field, self.rng
+        chain, edges = [source], []
+        seen = {source}
+        current = source
+        while len(chain) < max_length:
+            steps = [(edge, h) for edge, h in neighbors(*current) if h not in seen]
+            if any(not field.in_grid(*h) for _, h in steps):
+                break  # Runs off the map edge
+            joined = next(((e, h) for e, h in steps if h in self.river_hexes or self.is_water(h)), None)
+            if joined:
+                edges.append(joined[0])
+                chain.append(joined[1])
+                break
+            here = field.elevation(*current)
+            edge, lowest = min(steps, key=lambda s: field.elevation(*s[1]) + rng.uniform(0, 0.015))
+            if field.elevation(*lowest) >= here:
+                self.lakes.add(current)  # Pit: the river pools here
+                break
+            edges.append(edge)
+            chain.append(lowest)
+            seen.add(lowest)
+            current = lowest
+
+        if len(edges) < 2:
+            return
+
+        path_index = len(self.paths)
+        path_id = self.new_id()
+        points = [{'hexI': source[0], 'hexJ': source[1], 'isCenter': True, 'order': 10}]
+        for step, edge in enumerate(edges):
+            row, col = chain[step]
+            point_index = len(points)
+            points.append({'hexI': row, 'hexJ': col, 'edge': edge, 'isCenter': False,
+                           'order': 10 * (point_index + 1)})
+            self.river_edges.setdefault(canonical_edge_id(row, col, edge), (path_index, point_index))
+
+            drop = field.elevation(row, col) - field.elevation(*chain[step + 1])
+            if drop * field.scale > WATERFALL_GRADIENT and rng.random() < 0.5:
+                # segmentIndex/position resolve to this edge point (see merge-waterways.py)
+                self.waterfalls.append({'id': self.new_id(), 'pathId': path_id,
+                                        'segmentIndex': point_index - 1, 'position': 1})
+            elif rng.random() < FORD_RATE:
+                self.crossings.append({'id': self.new_id(), 'pathId': path_id,
+                                       'segmentIndex': point_index - 1, 'position': 1, 'type': 'ford'})
+        for hex_ in chain[:-1]:
+            self.river_hexes.setdefault(hex_, path_index)
+        self.paths.append({'id': path_id, 'points': points})
+
+    # Roads -------------------------------------------------------------
+
+    @staticmethod
+    def cube(hex_: Hex) -> Tuple[int, int]:
+        """(q, r) axial coordinates for the odd-row-shifted grid of hex_grid.py."""
+        row, col = hex_
+        return col - (row - (row & 1)) // 2, row
+
+    def distance(self, a: Hex, b: Hex) -> int:
+        (q1, r1), (q2, r2) = self.cube(a), self.cube(b)
+        return (abs(q1 - q2) + abs(r1 - r2) + abs(q1 + r1 - q2 - r2)) // 2
+
+    def build_roads(self) -> None:
+        rng = self.rng
+        towns = [h for h in (self.cell(i) for i in rng.sample(range(self.hex_count), max(2, self.hex_count // 400)))
+                 if not self.is_water(h)]
+        towns.sort()
+        bridged: Set[str] = set()
+        for index, town in enumerate(towns[1:], start=1):
+            previous = towns[max(0, index - 32):index]
+            target = min(previous, key=lambda h: self.distance(town, h))
+            self.trace_road(town, target, bridged)
+
+    def trace_road(self, start: Hex, target: Hex, bridged: Set[str]) -> None:
+        field, rng = self.field, self.rng
+        current = start
+        for _ in range(2 * self.distance(start, target) + 2):
+            if not self.is_water(current):
+                self.roads.add(current)
+            if current == target:
+                return
+            remaining = self.distance(current, target)
+            options = [(e, h) for e, h in neighbors(*current)
+                       if field.in_grid(*h) and self.distance(h, target) < remaining]
+            if not options:
+                return
+            edge, step = rng.choice(options)
+            edge_id = canonical_edge_id(current[0], current[1], edge)
+            if edge_id in self.river_edges and edge_id not in bridged:
+                bridged.add(edge_id)
+                self.crossings.append({'id': self.new_id(), 'hexI': current[0], 'hexJ': current[1],
+                                       'edge': edge, 'type': 'bridge'})
+            current = step
+
+
+# ----------------------------------------------------------------------
+# Streaming writer
+# ----------------------------------------------------------------------
+
+def open_output(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.gz':
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    return open(path, 'w', encoding='utf-8')
+
+
+def write_array(out, key: str, items: Iterator, indent: str = '  ', last: bool = False) -> int:
+    """Write '"key": [ ... ]' with one compact item per line; returns the item count."""
+    out.write(f'{indent}{json.dumps(key)}: [')
+    count = 0
+    for item in items:
+        out.write(',\n' if count else '\n')
+        out.write(f'{indent}  {json.dumps(item, separators=(", ", ": "))}')
+        count += 1
+    out.write(f'\n{indent}]' if count else ']')
+    out.write('\n' if last else ',\n')
+    return count
+
+
+def generate(output: Path, hex_count: int, seed: int) -> Dict[str, int]:
+    cols = max(1, math.ceil(math.sqrt(hex_count)))
+    field = TerrainField(hex_count, cols, seed)
+    rng = random.Random(seed)
+    layers = MapLayers(field, hex_count, rng)
+    layers.build_rivers()
+    layers.build_roads()
+
+    lake_cells, swamp_cells = array('i'), array('i')
+
+    def terrain_rows() -> Iterator[Dict]:
+        for index in range(hex_count):
+            row, col = divmod(index, cols)
+            terrain = field.terrain(row, col, layers.lakes)
+            if terrain == 'water':
+                lake_cells.append(index)
+            elif terrain == 'swamp':
+                swamp_cells.append(index)
+            yield {'id': format_hex_id(row, col), 'terrain': terrain, 'travel': TRAVEL[terrain]}
+
+    def features(cells: array) -> Iterator[Dict]:
+        for index in cells:
+            row, col = divmod(index, cols)
+            yield {'id': layers.new_id(), 'hexI': row, 'hexJ': col}
+
+    counts = {}
+    with open_output(output) as out:
+        out.write('{\n')
+        out.write(f'  "version": "1.0.0",\n  "exportDate": "{EXPORT_DATE}",\n')
+        out.write(f'  "mapName": {json.dumps(f"Synthetic {hex_count} hexes (seed {seed})")},\n')
+        counts['hexes'] = write_array(out, 'terrain', terrain_rows())
+        counts['roads'] = write_array(out, 'roads', (format_hex_id(*h) for h in sorted(layers.roads)))
+
+        out.write('  "rivers": {\n')
+        write_array(out, 'cellPaths', iter(()), '    ')
+        write_array(out, 'rasterizedCells', iter(()), '    ')
+        counts['crossings'] = write_array(out, 'crossings', iter(layers.crossings), '    ')
+        counts['waterfalls'] = write_array(out, 'waterfalls', iter(layers.waterfalls), '    ')
+        counts['rivers'] = write_array(out, 'paths', iter(layers.paths), '    ', last=True)
+        out.write('  },\n')
+
+        out.write('  "waterFeatures": {\n')
+        write_array(out, 'lakeCells', iter(()), '    ')
+        write_array(out, 'passageCells', iter(()), '    ')
+        counts['lakes'] = write_array(out, 'lakes', features(lake_cells), '    ')
+        counts['swamps'] = write_array(out, 'swamps', features(swamp_cells), '    ', last=True)
+        out.write('  },\n')
+
+        write_array(out, 'settlements', iter(()), last=True)
+        out.write('}\n')
+
+    counts['riverPoints'] = sum(len(p['points']) for p in layers.paths)
+    counts['rows'], counts['cols'] = field.rows, cols
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a large synthetic map export")
+    parser.add_argument('--hexes', type=parse_count, default=10_000, help="Hex count (10k, 100k, 1m, ...)")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed (same seed → same file)")
+    parser.add_argument('--output', type=Path, help="Output path (.gz to compress; "
+                                                    "default: synthetic-maps/synthetic-<hexes>.json)")
+    args = parser.parse_args()
+
+    output = args.output or OUTPUT_DIR / f"synthetic-{args.hexes}.json"
+    started = time.perf_counter()
+    counts = generate(output, args.hexes, args.seed)
+    elapsed = time.perf_counter() - started
+
+    try:
+        shown = output.resolve().relative_to(PROJECT_ROOT.resolve())
+    except ValueError:
+        shown = output
+    print(f"📁 Map written to: {shown} ({counts['rows']} × {counts['cols']})")
+    print(f"📊 {counts['hexes']:,} hexes, {counts['rivers']:,} rivers ({counts['riverPoints']:,} points), "
+          f"{counts['lakes']:,} water hexes, {counts['swamps']:,} swamps, {counts['roads']:,} road hexes, "
+          f"{counts['crossings']:,} crossings, {counts['waterfalls']:,} waterfalls in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared hex grid helpers for the Python map tools.
+
+Mirrors the offset coordinate rules used at runtime:
+- Hex IDs are "row.col" strings (src/domain/territory/adjacencyLogic.ts)
+- Edge IDs are canonical "i:j:dir,i:j:dir" strings (src/utils/edgeUtils.ts)
+
+Even rows take their diagonal neighbors from columns (col - 1, col),
+odd rows from columns (col, col + 1).
+
+This module is imported by the map build scripts; it is not run directly.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MAP_PATH = PROJECT_ROOT / "data" / "piazolands" / "stolen-lands-map.json"
+WATERWAYS_PATH = PROJECT_ROOT / "data" / "kingmaker-support" / "waterways.json"
+DATA_COMPILED_DIR = PROJECT_ROOT / "src" / "data-compiled"
+
+# Clockwise edge order used by the river editor (e, se, sw, w, nw, ne)
+EDGE_DIRECTIONS = ('e', 'se', 'sw', 'w', 'nw', 'ne')
+
+OPPOSITE_EDGE = {
+    'e': 'w',
+    'se': 'nw',
+    'sw': 'ne',
+    'w': 'e',
+    'nw': 'se',
+    'ne': 'sw',
+}
+
+# (row delta, col delta) per edge, for even and odd rows
+_EVEN_ROW_OFFSETS = {
+    'e': (0, 1),
+    'se': (1, 0),
+    'sw': (1, -1),
+    'w': (0, -1),
+    'nw': (-1, -1),
+    'ne': (-1, 0),
+}
+_ODD_ROW_OFFSETS = {
+    'e': (0, 1),
+    'se': (1, 1),
+    'sw': (1, 0),
+    'w': (0, -1),
+    'nw': (-1, 0),
+    'ne': (-1, 1),
+}
+
+Hex = Tuple[int, int]
+
+
+def parse_hex_id(hex_id: str) -> Hex:
+    """Convert a "row.col" hex ID into a (row, col) tuple."""
+    row, col = hex_id.split('.')
+    return int(row), int(col)
+
+
+def format_hex_id(row: int, col: int) -> str:
+    """Convert (row, col) into a "row.col" hex ID."""
+    return f"{row}.{col}"
+
+
+def neighbor(row: int, col: int, edge: str) -> Hex:
+    """Get the hex across the given edge (may lie outside the map)."""
+    offsets = _EVEN_ROW_OFFSETS if row % 2 == 0 else _ODD_ROW_OFFSETS
+    d_row, d_col = offsets[edge]
+    return row + d_row, col + d_col
+
+
+def neighbors(row: int, col: int) -> Iterator[Tuple[str, Hex]]:
+    """Yield (edge, (row, col)) for all six neighbors in EDGE_DIRECTIONS order."""
+    for edge in EDGE_DIRECTIONS:
+        yield edge, neighbor(row, col, edge)
+
+
+def canonical_edge_id(row: int, col: int, edge: str) -> str:
+    """
+    Build the canonical edge ID for one side of a hex.
+
+    Matches getCanonicalEdgeId(): the hex with the smaller (i, j) comes first,
+    so both hexes sharing the edge produce the same ID.
+    """
+    other_row, other_col = neighbor(row, col, edge)
+    opposite = OPPOSITE_EDGE[edge]
+    if (row, col) <= (other_row, other_col):
+        return f"{row}:{col}:{edge},{other_row}:{other_col}:{opposite}"
+    return f"{other_row}:{other_col}:{opposite},{row}:{col}:{edge}"
+
+
+def center_id(row: int, col: int) -> str:
+    """ID used for a path point sitting on a hex center."""
+    return f"{row}:{col}:c"
+
+
+def load_json(path: Path) -> Dict:
+    """Load a JSON file with UTF-8 encoding (gzip-compressed when it ends in .gz)."""
+    opener = gzip.open if Path(path).suffix == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_map(path: Optional[Path] = None) -> Dict:
+    """Load a map export (defaults to the Stolen Lands map)."""
+    return load_json(path or MAP_PATH)
+
+
+def map_hex_index(map_data: Dict) -> Dict[str, int]:
+    """
+    Assign dense integer IDs to the hexes of a map export.
+
+    IDs follow (row, col) order so they are stable across exports.
+    """
+    hex_ids = sorted((t['id'] for t in map_data.get('terrain', [])), key=parse_hex_id)
+    return {hex_id: index for index, hex_id in enumerate(hex_ids)}
+
+
+def neighbor_table(hex_index: Dict[str, int]) -> List[List[int]]:
+    """
+    Dense neighbor array for map_hex_index() IDs.
+
+    Row n holds the IDs of hex n's neighbors in EDGE_DIRECTIONS order,
+    with -1 where the neighbor lies outside the map.
+    """
+    table = [[-1] * len(EDGE_DIRECTIONS) for _ in hex_index]
+    for hex_id, index in hex_index.items():
+        row, col = parse_hex_id(hex_id)
+        for slot, (_, (n_row, n_col)) in enumerate(neighbors(row, col)):
+            table[index][slot] = hex_index.get(format_hex_id(n_row, n_col), -1)
+    return table
+
+
+def hex_distance(a: Hex, b: Hex) -> int:
+    """Steps between two hexes (axial distance on the odd-row-shifted grid)."""
+    a_q, b_q = a[1] - (a[0] - (a[0] & 1)) // 2, b[1] - (b[0] - (b[0] & 1)) // 2
+    d_q, d_r = a_q - b_q, a[0] - b[0]
+    return (abs(d_q) + abs(d_r) + abs(d_q + d_r)) // 2
+
+
+def write_json(path: Path, data, indent: Optional[int] = 2) -> int:
+    """Write JSON (compact when indent is None) and return the byte size."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    separators = (',', ':') if indent is None else None
+    text = json.dumps(data, indent=indent, separators=separators)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return len(text.encode('utf-8'))
+
+
+def sorted_points(path: Dict) -> List[Dict]:
+    """Return a river path's points in drawing order."""
+    return sorted(path.get('points', []), key=lambda p: p.get('order', 0))
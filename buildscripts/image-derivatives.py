@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Build size-tiered derivatives of event and incident illustrations.
+
+Each source image in src/img/events and src/img/incidents/{minor,moderate,major}
+is ~3.5 MB. This script writes smaller WebP versions for the sizes the UI
+actually shows:
+
+    thumb  -  256 px wide   (lists, badges)
+    card   -  768 px wide   (event / incident cards)
+    full   - 1600 px wide   (expanded view)
+
+Sources are never upscaled. Results are cached by source hash and settings
+in .image-derivatives-cache.json, so unchanged images are skipped, and the
+work runs across a process pool. Derivatives and cache entries whose source
+image (or tier) no longer exists are removed.
+
+Output:
+    src/img-derived/{tier}/{events|incidents/...}/{name}.webp
+    src/img-derived/manifest.json   (manifest for the UI)
+
+Nothing reads the derivatives at runtime yet and the package still ships
+the original art, so the manifest stays next to the derivatives instead
+of in src/data-compiled, which the build copies into dist.
+
+Requires Pillow (pip install Pillow).
+
+Usage:
+    python buildscripts/image-derivatives.py [--force] [--workers N]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+IMG_DIR = PROJECT_ROOT / "src" / "img"
+OUTPUT_DIR = PROJECT_ROOT / "src" / "img-derived"
+MANIFEST_FILE = OUTPUT_DIR / "manifest.json"
+# Written by build-sprite-atlas.py; never pruned here
+ATLAS_DIR = OUTPUT_DIR / "atlas"
+CACHE_FILE = PROJECT_ROOT / ".image-derivatives-cache.json"
+
+SOURCE_GLOBS = (
+    "events/*.webp",
+    "incidents/*/*.webp",
+)
+
+# name -> (max width, WebP quality)
+TIERS = {
+    'thumb': (256, 70),
+    'card': (768, 78),
+    'full': (1600, 85),
+}
+
+# Bump when the resize pipeline changes so cached entries are rebuilt
+PIPELINE_VERSION = 1
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def settings_key() -> str:
+    """Cache key component covering tier settings and pipeline version."""
+    return json.dumps({'tiers': TIERS, 'version': PIPELINE_VERSION}, sort_keys=True)
+
+
+def build_derivatives(source: str, relative: str) -> Dict:
+    """
+    Write all tiers for one source image (runs in a worker process).
+
+    Returns the manifest entry for the image.
+    """
+    entry = {'tiers': {}}
+    with Image.open(source) as image:
+        image.load()
+        entry['width'], entry['height'] = image.size
+        for tier, (max_width, quality) in TIERS.items():
+            if image.width > max_width:
+                height = round(image.height * max_width / image.width)
+                resized = image.resize((max_width, height), Image.LANCZOS)
+            else:
+                resized = image
+            target = OUTPUT_DIR / tier / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            resized.save(target, 'WEBP', quality=quality, method=6)
+            entry['tiers'][tier] = {
+                'path': target.relative_to(PROJECT_ROOT / "src").as_posix(),
+                'width': resized.width,
+                'height': resized.height,
+                'bytes': target.stat().st_size,
+            }
+    return entry
+
+
+def collect_sources() -> List[Path]:
+    """All source images covered by SOURCE_GLOBS, sorted."""
+    sources = set()
+    for pattern in SOURCE_GLOBS:
+        sources.update(IMG_DIR.glob(pattern))
+    return sorted(sources)
+
+
+def load_cache() -> Dict:
+    if CACHE_FILE.exists():
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('settings') == settings_key():
+            return cache
+    return {'settings': settings_key(), 'images': {}}
+
+
+def outputs_exist(entry: Dict) -> bool:
+    return all((PROJECT_ROOT / "src" / t['path']).exists() for t in entry.get('tiers', {}).values())
+
+
+def prune_outputs(sources: List[Path]) -> int:
+    """Delete derivatives without a current source image or tier; returns the file count."""
+    expected = {OUTPUT_DIR / tier / source.relative_to(IMG_DIR) for source in sources for tier in TIERS}
+    removed = 0
+    if not OUTPUT_DIR.exists():
+        return removed
+    for path in sorted(OUTPUT_DIR.rglob('*'), reverse=True):
+        if path == MANIFEST_FILE or path == ATLAS_DIR or ATLAS_DIR in path.parents:
+            continue
+        if path.is_file() and path not in expected:
+            path.unlink()
+            removed += 1
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build size-tiered image derivatives")
+    parser.add_argument('--force', action='store_true', help="Ignore the cache")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ Pillow is required: pip install Pillow")
+        sys.exit(1)
+
+    cache = {'settings': settings_key(), 'images': {}} if args.force else load_cache()
+    sources = collect_sources()
+    print(f"🖼️  Building derivatives for {len(sources)} images ({', '.join(TIERS)})")
+
+    manifest: Dict[str, Dict] = {}
+    pending: List[Tuple[str, Path, str]] = []
+
+    for source in sources:
+        relative = source.relative_to(IMG_DIR).as_posix()
+        digest = file_hash(source)
+        cached = cache['images'].get(relative)
+        if cached and cached.get('hash') == digest and outputs_exist(cached):
+            manifest[relative] = cached
+        else:
+            pending.append((relative, source, digest))
+
+    print(f"   {len(manifest)} cached, {len(pending)} to build")
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = {
+                relative: (digest, pool.submit(build_derivatives, str(source), relative))
+                for relative, source, digest in pending
+            }
+            for relative, (digest, future) in futures.items():
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    print(f"  ✗ {relative}: {e}")
+                    continue
+                entry['hash'] = digest
+                manifest[relative] = entry
+                print(f"  ✓ {relative}")
+
+    removed = prune_outputs(sources)
+    if removed:
+        print(f"🧹 Removed {removed} derivative(s) without a source image")
+
+    # Only current sources stay in the cache and manifest
+    manifest = {key: manifest[key] for key in sorted(manifest)}
+    cache['images'] = manifest
+    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    ui_manifest = {
+        f"img/{key}": {tier: info['path'] for tier, info in entry['tiers'].items()}
+        for key, entry in manifest.items()
+    }
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(ui_manifest, f, indent=2)
+
+    source_bytes = sum(s.stat().st_size for s in sources)
+    print("\n📊 Size by tier:")
+    print(f"   source: {source_bytes / 1024 / 1024:.1f} MB")
+    for tier in TIERS:
+        tier_bytes = sum(e['tiers'][tier]['bytes'] for e in manifest.values() if tier in e['tiers'])
+        print(f"   {tier}: {tier_bytes / 1024 / 1024:.1f} MB")
+    print(f"📁 Manifest written to: {MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    main()
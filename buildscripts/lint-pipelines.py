@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Lint src/pipelines: badge, outcome and skill checks in one pass.
+
+Every pipeline file is parsed once (ts_source) and all rules run over that
+parse. Replaces audit-action-badges.py, audit-empty-outcome-badges.py and
+comprehensive-badge-audit.py.
+
+Rules:
+    duplicate-key           error    Object literal repeats a key (earlier one is silently ignored)
+    unknown-skill           error    Skill is not a KingdomSkill (src/types/events.ts)
+    unknown-doctrine        error    Skill doctrine is not idealist/practical/ruthless
+    duplicate-skill         warning  Same skill listed twice
+    missing-outcome         warning  outcomes lacks criticalSuccess/success/failure/criticalFailure
+    empty-static-outcome    warning  Action success outcome has no modifiers and no outcomeBadges
+    preview-without-badges  warning  Action preview.calculate() never creates a badge
+    option-badges-missing   warning  strategicChoice option lacks outcomeBadges for an outcome
+    parse-error             error    File could not be parsed
+
+Only the pipeline folders (actions/, events/, incidents/) are linted;
+PipelineRegistry.ts and shared/ hold helpers, not pipelines.
+
+Usage:
+    python buildscripts/lint-pipelines.py [--format text|json|sarif] [--output PATH] [PATH ...]
+
+Exits with 1 if any error-level finding is reported.
+"""
+
+import argparse
+import bisect
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from ts_source import IDENT, ArrayLiteral, ObjectLiteral, ParseError, parse_source
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PIPELINES_DIR = PROJECT_ROOT / "src" / "pipelines"
+SKILL_TYPES_FILE = PROJECT_ROOT / "src" / "types" / "events.ts"
+PIPELINE_KINDS = ('actions', 'events', 'incidents')
+
+OUTCOMES = ['criticalSuccess', 'success', 'failure', 'criticalFailure']
+DOCTRINES = {'idealist', 'practical', 'ruthless'}
+OPTION_EXTRA_SKILLS = {'applicable lore'}
+BADGE_HELPERS = {'textBadge', 'valueBadge', 'diceBadge'}
+
+RULES = {
+    'duplicate-key': ('error', "Object literal repeats a key"),
+    'unknown-skill': ('error', "Skill is not a KingdomSkill"),
+    'unknown-doctrine': ('error', "Skill doctrine is not idealist/practical/ruthless"),
+    'duplicate-skill': ('warning', "Same skill listed twice"),
+    'missing-outcome': ('warning', "outcomes is missing an outcome"),
+    'empty-static-outcome': ('warning', "Success outcome shows no badges"),
+    'preview-without-badges': ('warning', "Action preview never creates a badge"),
+    'option-badges-missing': ('warning', "Strategic choice option lacks outcome badges"),
+    'parse-error': ('error', "File could not be parsed"),
+}
+
+
+def load_kingdom_skills() -> Set[str]:
+    """The KingdomSkill union from src/types/events.ts."""
+    content = SKILL_TYPES_FILE.read_text(encoding='utf-8')
+    match = re.search(r'export type KingdomSkill\s*=([^;]+);', content)
+    return set(re.findall(r'"([^"]+)"', match.group(1))) if match else set()
+
+
+def pipeline_kind(path: Path) -> Optional[str]:
+    """'actions' / 'events' / 'incidents' for a pipeline file, else None."""
+    try:
+        kind = path.relative_to(PIPELINES_DIR).parts[0]
+    except ValueError:
+        return None
+    return kind if kind in PIPELINE_KINDS else None
+
+
+class LintFile:
+    """One parsed pipeline file plus helpers shared by the rules."""
+
+    def __init__(self, path: Path, text: str, skills: Set[str]):
+        self.path = path
+        self.relative = path.relative_to(PROJECT_ROOT).as_posix()
+        self.text = text
+        self.kind = pipeline_kind(path)
+        self.pipeline = parse_source(text).exported_object()
+        self.kingdom_skills = skills
+        self._line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+
+    def position(self, offset: int) -> Dict[str, int]:
+        line = bisect.bisect_right(self._line_starts, offset)
+        return {'line': line, 'column': offset - self._line_starts[line - 1] + 1}
+
+    def finding(self, rule: str, offset: int, message: str) -> Dict:
+        return {'rule': rule, 'level': RULES[rule][0], 'file': self.relative,
+                **self.position(offset), 'message': message}
+
+
+Rule = Callable[[LintFile], Iterator[Dict]]
+
+
+def walk_objects(node) -> Iterator[ObjectLiteral]:
+    if isinstance(node, ObjectLiteral):
+        yield node
+        for prop in node.properties:
+            yield from walk_objects(prop.value)
+    elif isinstance(node, ArrayLiteral):
+        for element in node.elements:
+            yield from walk_objects(element)
+
+
+def has_badge_call(node) -> bool:
+    return any(t.kind == IDENT and t.value in BADGE_HELPERS for t in node.tokens)
+
+
+def badges_present(outcome: ObjectLiteral) -> bool:
+    badges = outcome.get('outcomeBadges')
+    return badges is not None and not (isinstance(badges, ArrayLiteral) and not badges.elements)
+
+
+def preview_calculate(lint: LintFile):
+    preview = lint.pipeline.get('preview')
+    return preview.get('calculate') if isinstance(preview, ObjectLiteral) else None
+
+
+# ----------------------------------------------------------------------
+# Rules
+# ----------------------------------------------------------------------
+
+def rule_duplicate_key(lint: LintFile) -> Iterator[Dict]:
+    for node in walk_objects(lint.pipeline):
+        seen = set()
+        for prop in node.properties:
+            if prop.key is None:
+                continue
+            if prop.key in seen:
+                yield lint.finding('duplicate-key', prop.key_start, f"Duplicate key '{prop.key}'")
+            seen.add(prop.key)
+
+
+def rule_skills(lint: LintFile) -> Iterator[Dict]:
+    skills = lint.pipeline.get('skills')
+    if isinstance(skills, ArrayLiteral):
+        seen = set()
+        for entry in skills.elements:
+            if not isinstance(entry, ObjectLiteral):
+                continue
+            skill = entry.get('skill')
+            name = skill.string_value() if skill is not None else None
+            if name is not None and name not in lint.kingdom_skills:
+                yield lint.finding('unknown-skill', skill.start, f"Unknown skill '{name}'")
+            if name is not None and name in seen:
+                yield lint.finding('duplicate-skill', skill.start, f"Skill '{name}' listed twice")
+            seen.add(name)
+            doctrine = entry.get('doctrine')
+            value = doctrine.string_value() if doctrine is not None else None
+            if doctrine is not None and value not in DOCTRINES:
+                yield lint.finding('unknown-doctrine', doctrine.start, f"Unknown doctrine {doctrine.text}")
+
+    options = lint.pipeline.get_path('strategicChoice.options')
+    if isinstance(options, ArrayLiteral):
+        allowed = lint.kingdom_skills | OPTION_EXTRA_SKILLS
+        for option in options.elements:
+            option_skills = option.get('skills') if isinstance(option, ObjectLiteral) else None
+            if not isinstance(option_skills, ArrayLiteral):
+                continue
+            seen = set()
+            for element in option_skills.elements:
+                name = element.string_value()
+                if name is not None and name not in allowed:
+                    yield lint.finding('unknown-skill', element.start, f"Unknown skill '{name}'")
+                if name is not None and name in seen:
+                    yield lint.finding('duplicate-skill', element.start, f"Skill '{name}' listed twice")
+                seen.add(name)
+
+
+def rule_outcomes(lint: LintFile) -> Iterator[Dict]:
+    prop = lint.pipeline.get_property('outcomes')
+    if prop is None or not isinstance(prop.value, ObjectLiteral):
+        return
+    outcomes = prop.value
+    calculate = preview_calculate(lint)
+    preview_badges = calculate is not None and has_badge_call(calculate)
+
+    for outcome in OUTCOMES:
+        node = outcomes.get(outcome)
+        if node is None:
+            yield lint.finding('missing-outcome', prop.key_start, f"outcomes.{outcome} is missing")
+            continue
+        # Incident successes legitimately do nothing; actions should always show a result
+        if lint.kind != 'actions' or outcome not in ('criticalSuccess', 'success') \
+                or not isinstance(node, ObjectLiteral):
+            continue
+        modifiers = node.get('modifiers')
+        empty_modifiers = isinstance(modifiers, ArrayLiteral) and not modifiers.elements
+        if empty_modifiers and not badges_present(node):
+            note = " (badges only come from preview.calculate)" if preview_badges else ""
+            yield lint.finding('empty-static-outcome', node.start,
+                               f"outcomes.{outcome} has no modifiers and no outcomeBadges{note}")
+
+
+def rule_preview_badges(lint: LintFile) -> Iterator[Dict]:
+    if lint.kind != 'actions':
+        return
+    calculate = preview_calculate(lint)
+    if calculate is not None and not has_badge_call(calculate):
+        yield lint.finding('preview-without-badges', calculate.start,
+                           "preview.calculate() returns no textBadge/valueBadge/diceBadge")
+
+
+def rule_option_badges(lint: LintFile) -> Iterator[Dict]:
+    options = lint.pipeline.get_path('strategicChoice.options')
+    if not isinstance(options, ArrayLiteral):
+        return
+    for option in options.elements:
+        if not isinstance(option, ObjectLiteral):
+            continue
+        option_id = option.get('id')
+        label = option_id.string_value() if option_id is not None else '?'
+        badges = option.get('outcomeBadges')
+        if not isinstance(badges, ObjectLiteral):
+            yield lint.finding('option-badges-missing', option.start, f"Option '{label}' has no outcomeBadges")
+            continue
+        missing = [o for o in OUTCOMES if o not in badges.keys()]
+        if missing:
+            yield lint.finding('option-badges-missing', badges.start,
+                               f"Option '{label}' outcomeBadges lacks {', '.join(missing)}")
+
+
+ALL_RULES: List[Rule] = [rule_duplicate_key, rule_skills, rule_outcomes, rule_preview_badges, rule_option_badges]
+
+
+def lint_paths(paths: List[Path]) -> Dict:
+    skills = load_kingdom_skills()
+    findings: List[Dict] = []
+    checked = 0
+    for path in paths:
+        text = path.read_text(encoding='utf-8')
+        try:
+            lint = LintFile(path, text, skills)
+        except ParseError as e:
+            findings.append({'rule': 'parse-error', 'level': 'error',
+                             'file': path.relative_to(PROJECT_ROOT).as_posix(),
+                             'line': 1, 'column': 1, 'message': str(e)})
+            continue
+        if lint.pipeline is None:
+            continue
+        checked += 1
+        for rule in ALL_RULES:
+            findings.extend(rule(lint))
+    findings.sort(key=lambda f: (f['file'], f['line'], f['column'], f['rule']))
+    return {'files': checked, 'findings': findings}
+
+
+def to_sarif(result: Dict) -> Dict:
+    rules = [{'id': rule, 'shortDescription': {'text': text},
+              'defaultConfiguration': {'level': level}}
+             for rule, (level, text) in RULES.items()]
+    return {
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': 'lint-pipelines', 'rules': rules}},
+            'results': [{
+                'ruleId': f['rule'],
+                'level': f['level'],
+                'message': {'text': f['message']},
+                'locations': [{'physicalLocation': {
+                    'artifactLocation': {'uri': f['file']},
+                    'region': {'startLine': f['line'], 'startColumn': f['column']},
+                }}],
+            } for f in result['findings']],
+        }],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lint pipeline files")
+    parser.add_argument('paths', nargs='*', type=Path, help="Files to lint (default: src/pipelines/**/*.ts)")
+    parser.add_argument('--format', choices=['text', 'json', 'sarif'], default='text')
+    parser.add_argument('--output', type=Path, help="Write the report here instead of stdout")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    paths = [p.resolve() for p in args.paths]
+    outside = [str(p) for p, resolved in zip(args.paths, paths) if pipeline_kind(resolved) is None]
+    if outside:
+        parser.error(f"not a pipeline file under src/pipelines/{{{','.join(PIPELINE_KINDS)}}}/: "
+                     f"{', '.join(outside)}")
+    paths = paths or sorted(p for kind in PIPELINE_KINDS for p in (PIPELINES_DIR / kind).rglob('*.ts'))
+    result = lint_paths(paths)
+    elapsed = time.perf_counter() - started
+    findings = result['findings']
+    errors = sum(1 for f in findings if f['level'] == 'error')
+
+    if args.format == 'text':
+        lines = [f"{f['file']}:{f['line']}:{f['column']}: {f['level']} [{f['rule']}] {f['message']}"
+                 for f in findings]
+        lines.append(f"\n📊 {result['files']} files, {errors} errors, "
+                     f"{len(findings) - errors} warnings in {elapsed:.2f}s")
+        report = "\n".join(lines)
+    else:
+        data = to_sarif(result) if args.format == 'sarif' else {
+            'files': result['files'], 'elapsedSeconds': round(elapsed, 3), 'findings': findings}
+        report = json.dumps(data, indent=2)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + "\n")
+        print(f"📁 Report written to: {args.output} ({len(findings)} findings)")
+    else:
+        print(report)
+
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
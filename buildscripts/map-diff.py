@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Structural diff and patch for map exports (stolen-lands-map.json format).
+
+Every map export rewrites the whole file with a new exportDate. This tool
+computes a small delta between two exports and can apply it back:
+
+- terrain:      hexes added / removed / changed, keyed by hex id
+- roads:        hex ids added / removed
+- rivers:       paths, cellPaths, crossings, waterfalls keyed by id;
+                rasterizedCells as an (x, y) cell set
+- waterFeatures: lakes, swamps keyed by id; lakeCells, passageCells as cell sets
+- settlements:  keyed by hexId
+- header:       version, exportDate, mapName
+
+Usage:
+    python buildscripts/map-diff.py diff OLD.json NEW.json [-o delta.json]
+    python buildscripts/map-diff.py apply BASE.json DELTA.json (-o out.json | --in-place)
+    python buildscripts/map-diff.py check OLD.json NEW.json
+
+'check' diffs, applies, and verifies the patched map matches NEW
+(list order aside).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from hex_grid import load_json, write_json
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+DELTA_VERSION = 1
+
+HEADER_FIELDS = ('version', 'exportDate', 'mapName')
+
+# (section, list name, key field); section None means top level
+KEYED_LISTS = (
+    (None, 'terrain', 'id'),
+    (None, 'settlements', 'hexId'),
+    ('rivers', 'paths', 'id'),
+    ('rivers', 'cellPaths', 'id'),
+    ('rivers', 'crossings', 'id'),
+    ('rivers', 'waterfalls', 'id'),
+    ('waterFeatures', 'lakes', 'id'),
+    ('waterFeatures', 'swamps', 'id'),
+)
+
+# (section, list name) of plain {x, y} cell lists
+CELL_LISTS = (
+    ('rivers', 'rasterizedCells'),
+    ('waterFeatures', 'lakeCells'),
+    ('waterFeatures', 'passageCells'),
+)
+
+
+def _get_list(data: Dict, section: Optional[str], name: str) -> List:
+    container = data.get(section, {}) if section else data
+    return container.get(name, []) or []
+
+
+def _set_list(data: Dict, section: Optional[str], name: str, values: List) -> None:
+    container = data.setdefault(section, {}) if section else data
+    container[name] = values
+
+
+def _label(section: Optional[str], name: str) -> str:
+    return f"{section}.{name}" if section else name
+
+
+def diff_keyed(old: List[Dict], new: List[Dict], key: str) -> Dict:
+    """Diff two lists of records keyed by a field."""
+    old_by_key = {record[key]: record for record in old}
+    new_by_key = {record[key]: record for record in new}
+    delta = {
+        'added': [r for r in new if r[key] not in old_by_key],
+        'removed': [r[key] for r in old if r[key] not in new_by_key],
+        'changed': [r for r in new if r[key] in old_by_key and old_by_key[r[key]] != r],
+    }
+    return {k: v for k, v in delta.items() if v}
+
+
+def apply_keyed(base: List[Dict], delta: Dict, key: str) -> List[Dict]:
+    """Apply a keyed-list delta, preserving base order for existing records."""
+    removed = set(delta.get('removed', []))
+    changed = {record[key]: record for record in delta.get('changed', [])}
+    result = [changed.get(r[key], r) for r in base if r[key] not in removed]
+    result.extend(delta.get('added', []))
+    return result
+
+
+def _cell(cell: Dict) -> Tuple[int, int]:
+    return cell['x'], cell['y']
+
+
+def diff_cells(old: List[Dict], new: List[Dict]) -> Dict:
+    """Diff two {x, y} cell lists as sets; cells are encoded as [x, y] pairs."""
+    old_cells = {_cell(c) for c in old}
+    new_cells = {_cell(c) for c in new}
+    delta = {
+        'added': [list(c) for c in sorted(new_cells - old_cells)],
+        'removed': [list(c) for c in sorted(old_cells - new_cells)],
+    }
+    return {k: v for k, v in delta.items() if v}
+
+
+def apply_cells(base: List[Dict], delta: Dict) -> List[Dict]:
+    """Apply a cell-set delta."""
+    removed = {tuple(c) for c in delta.get('removed', [])}
+    result = [c for c in base if _cell(c) not in removed]
+    result.extend({'x': x, 'y': y} for x, y in delta.get('added', []))
+    return result
+
+
+def diff_maps(old: Dict, new: Dict) -> Dict:
+    """Compute the structural delta that turns old into new."""
+    delta: Dict = {'deltaVersion': DELTA_VERSION}
+
+    header = {f: new.get(f) for f in HEADER_FIELDS if old.get(f) != new.get(f)}
+    if header:
+        delta['header'] = header
+
+    old_roads, new_roads = set(old.get('roads', [])), set(new.get('roads', []))
+    roads = {
+        'added': [r for r in new.get('roads', []) if r not in old_roads],
+        'removed': [r for r in old.get('roads', []) if r not in new_roads],
+    }
+    roads = {k: v for k, v in roads.items() if v}
+    if roads:
+        delta['roads'] = roads
+
+    for section, name, key in KEYED_LISTS:
+        list_delta = diff_keyed(_get_list(old, section, name), _get_list(new, section, name), key)
+        if list_delta:
+            delta[_label(section, name)] = list_delta
+
+    for section, name in CELL_LISTS:
+        cell_delta = diff_cells(_get_list(old, section, name), _get_list(new, section, name))
+        if cell_delta:
+            delta[_label(section, name)] = cell_delta
+
+    return delta
+
+
+def apply_delta(base: Dict, delta: Dict) -> Dict:
+    """Apply a delta produced by diff_maps() to a map export."""
+    if delta.get('deltaVersion') != DELTA_VERSION:
+        raise ValueError(f"Unsupported delta version: {delta.get('deltaVersion')}")
+
+    result = json.loads(json.dumps(base))  # Deep copy
+    result.update(delta.get('header', {}))
+
+    if 'roads' in delta:
+        removed = set(delta['roads'].get('removed', []))
+        roads = [r for r in result.get('roads', []) if r not in removed]
+        roads.extend(delta['roads'].get('added', []))
+        result['roads'] = roads
+
+    for section, name, key in KEYED_LISTS:
+        label = _label(section, name)
+        if label in delta:
+            _set_list(result, section, name,
+                      apply_keyed(_get_list(result, section, name), delta[label], key))
+
+    for section, name in CELL_LISTS:
+        label = _label(section, name)
+        if label in delta:
+            _set_list(result, section, name,
+                      apply_cells(_get_list(result, section, name), delta[label]))
+
+    return result
+
+
+def normalize(data: Dict) -> Dict:
+    """Order-insensitive form of a map export, for verification."""
+    normalized = json.loads(json.dumps(data))
+    normalized['roads'] = sorted(normalized.get('roads', []))
+    for section, name, key in KEYED_LISTS:
+        values = _get_list(normalized, section, name)
+        if values:
+            _set_list(normalized, section, name, sorted(values, key=lambda r: r[key]))
+    for section, name in CELL_LISTS:
+        values = _get_list(normalized, section, name)
+        if values:
+            _set_list(normalized, section, name, sorted(values, key=_cell))
+    return normalized
+
+
+def summarize(delta: Dict) -> None:
+    """Print a one-line summary per changed section."""
+    for label, section_delta in delta.items():
+        if label == 'deltaVersion':
+            continue
+        if label == 'header':
+            print(f"   • header: {', '.join(section_delta)}")
+            continue
+        counts = ', '.join(f"{len(v)} {k}" for k, v in section_delta.items())
+        print(f"   • {label}: {counts}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff and patch map exports")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    diff_cmd = sub.add_parser('diff', help="Compute delta OLD → NEW")
+    diff_cmd.add_argument('old', type=Path)
+    diff_cmd.add_argument('new', type=Path)
+    diff_cmd.add_argument('-o', '--output', type=Path)
+
+    apply_cmd = sub.add_parser('apply', help="Apply DELTA to BASE")
+    apply_cmd.add_argument('base', type=Path)
+    apply_cmd.add_argument('delta', type=Path)
+    target = apply_cmd.add_mutually_exclusive_group(required=True)
+    target.add_argument('-o', '--output', type=Path)
+    target.add_argument('--in-place', action='store_true', help="Overwrite BASE with the patched map")
+
+    check_cmd = sub.add_parser('check', help="Verify diff + apply round-trips")
+    check_cmd.add_argument('old', type=Path)
+    check_cmd.add_argument('new', type=Path)
+
+    args = parser.parse_args()
+
+    if args.command == 'diff':
+        delta = diff_maps(load_json(args.old), load_json(args.new))
+        print(f"🗺️  Map delta {args.old.name} → {args.new.name}")
+        summarize(delta)
+        if args.output:
+            size = write_json(args.output, delta, indent=None)
+            print(f"📁 Delta written to: {args.output} ({size / 1024:.1f} KB)")
+
+    elif args.command == 'apply':
+        result = apply_delta(load_json(args.base), load_json(args.delta))
+        output = args.base if args.in_place else args.output
+        write_json(output, result)
+        print(f"✅ Patched map written to: {output}")
+
+    elif args.command == 'check':
+        old, new = load_json(args.old), load_json(args.new)
+        delta = diff_maps(old, new)
+        patched = apply_delta(old, delta)
+        summarize(delta)
+        if normalize(patched) == normalize(new):
+            print("✅ Round-trip OK")
+        else:
+            print("❌ Patched map does not match NEW")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Merge Kingmaker waterways with the river layer of the Stolen Lands map export.
+
+Sources:
+- data/kingmaker-support/waterways.json   (rivers.paths / crossings / waterfalls)
+- data/piazolands/stolen-lands-map.json   (rivers.paths / crossings / waterfalls)
+
+Both files describe the same rivers. This script merges them by ID into one
+table and reports points that disagree between the two sources. The map
+export is treated as the newer source and wins on conflicts.
+
+The runtime imports the merged table instead of both sources, and a copy
+of the map export without the river paths, crossings and waterfalls it
+now carries, so each river is bundled once and the JSON is written
+compact. Both files are imported into the bundle, so vite.config.ts
+leaves them out of the data-compiled static copy.
+
+build_edge_index() keys the merged rivers by canonical edge ID
+("i:j:dir,i:j:dir"). The index ships as "edges" in waterways.json, so
+"does this hex edge have water" is a single lookup at runtime
+(TerritoryService.getWaterwayEdge) and in build scripts such as
+pathfinding-oracle.py.
+
+Output: src/data-compiled/waterways.json, src/data-compiled/stolen-lands-map.json
+
+Usage:
+    python buildscripts/merge-waterways.py [--strict]
+
+--strict exits with an error if any conflicts are found.
+"""
+
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from hex_grid import (
+    DATA_COMPILED_DIR,
+    MAP_PATH,
+    WATERWAYS_PATH,
+    canonical_edge_id,
+    load_json,
+    sorted_points,
+    write_json,
+)
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+OUTPUT_FILE = DATA_COMPILED_DIR / "waterways.json"
+MAP_OUTPUT_FILE = DATA_COMPILED_DIR / "stolen-lands-map.json"
+
+# River layers of the map export that the merged table replaces
+MERGED_RIVER_KEYS = ('paths', 'crossings', 'waterfalls')
+
+POINT_FIELDS = ('hexI', 'hexJ', 'edge', 'isCenter')
+
+
+def point_key(point: Dict) -> Tuple:
+    """Comparable identity of a path point (ignores ordering)."""
+    return tuple(point.get(field) for field in POINT_FIELDS)
+
+
+def merge_by_id(kind: str, primary: List[Dict], secondary: List[Dict],
+                conflicts: List[Dict]) -> List[Dict]:
+    """
+    Merge two lists of records by 'id'. Records from primary win.
+
+    Records present in both sources with different content are reported.
+    """
+    merged = {record['id']: record for record in secondary}
+    for record in primary:
+        other = merged.get(record['id'])
+        if other is not None and other != record:
+            conflicts.append({
+                'kind': kind,
+                'id': record['id'],
+                'reason': 'records differ between sources',
+            })
+        merged[record['id']] = record
+    return [merged[key] for key in sorted(merged)]
+
+
+def compare_path_points(primary: List[Dict], secondary: List[Dict],
+                        conflicts: List[Dict]) -> None:
+    """Report the individual points that differ for paths present in both sources."""
+    secondary_by_id = {path['id']: path for path in secondary}
+    for path in primary:
+        other = secondary_by_id.get(path['id'])
+        if other is None:
+            continue
+        ours = {p.get('order'): point_key(p) for p in path.get('points', [])}
+        theirs = {p.get('order'): point_key(p) for p in other.get('points', [])}
+        for order in sorted(set(ours) | set(theirs), key=lambda o: (o is None, o)):
+            if ours.get(order) != theirs.get(order):
+                conflicts.append({
+                    'kind': 'point',
+                    'id': path['id'],
+                    'order': order,
+                    'map': ours.get(order),
+                    'waterways': theirs.get(order),
+                })
+
+
+def point_edge_id(point: Dict) -> Optional[str]:
+    """Canonical edge ID of a path point, or None for hex-center points."""
+    if point.get('isCenter') or not point.get('edge'):
+        return None
+    return canonical_edge_id(point['hexI'], point['hexJ'], point['edge'])
+
+
+def segment_edge_id(points: List[Dict], segment_index: int, position: float) -> Optional[str]:
+    """
+    Resolve a (segmentIndex, position) feature to the nearest edge point.
+
+    Crossings and waterfalls placed along a segment are attributed to the
+    segment endpoint closest to their position; if that endpoint is a hex
+    center the other endpoint is used.
+    """
+    if segment_index < 0 or segment_index + 1 >= len(points):
+        return None
+    start, end = points[segment_index], points[segment_index + 1]
+    ordered = (start, end) if position < 0.5 else (end, start)
+    for point in ordered:
+        edge_id = point_edge_id(point)
+        if edge_id:
+            return edge_id
+    return None
+
+
+def build_edge_index(paths: List[Dict], crossings: List[Dict],
+                     waterfalls: List[Dict], unresolved: List[Dict]) -> Dict[str, Dict]:
+    """Build the canonical edge → waterway lookup table."""
+    index: Dict[str, Dict] = {}
+    points_by_path = {path['id']: sorted_points(path) for path in paths}
+
+    def entry(edge_id: str) -> Dict:
+        return index.setdefault(edge_id, {'paths': []})
+
+    for path_id, points in points_by_path.items():
+        for point in points:
+            edge_id = point_edge_id(point)
+            if edge_id and path_id not in entry(edge_id)['paths']:
+                entry(edge_id)['paths'].append(path_id)
+
+    for crossing in crossings:
+        if crossing.get('edge'):
+            edge_id = canonical_edge_id(crossing['hexI'], crossing['hexJ'], crossing['edge'])
+        else:
+            edge_id = segment_edge_id(points_by_path.get(crossing.get('pathId'), []),
+                                      crossing.get('segmentIndex', -1),
+                                      crossing.get('position', 0.0))
+        if edge_id is None:
+            unresolved.append({'kind': 'crossing', 'id': crossing['id']})
+            continue
+        entry(edge_id)['crossing'] = crossing.get('type', 'ford')
+
+    for waterfall in waterfalls:
+        edge_id = segment_edge_id(points_by_path.get(waterfall.get('pathId'), []),
+                                  waterfall.get('segmentIndex', -1),
+                                  waterfall.get('position', 0.0))
+        if edge_id is None:
+            unresolved.append({'kind': 'waterfall', 'id': waterfall['id']})
+            continue
+        entry(edge_id)['waterfall'] = True
+
+    return {edge_id: index[edge_id] for edge_id in sorted(index)}
+
+
+def runtime_map(map_data: Dict) -> Dict:
+    """The map export without the river layers shipped in waterways.json."""
+    rivers = {key: value for key, value in map_data.get('rivers', {}).items() if key not in MERGED_RIVER_KEYS}
+    return {**map_data, 'rivers': rivers}
+
+
+def merge_waterways(map_data: Dict) -> Tuple[Dict, List[Dict], List[Dict]]:
+    """Merge both sources; returns (compiled data, conflicts, unresolved features)."""
+    waterways = load_json(WATERWAYS_PATH).get('rivers', {})
+    map_rivers = map_data.get('rivers', {})
+
+    conflicts: List[Dict] = []
+    unresolved: List[Dict] = []
+
+    compare_path_points(map_rivers.get('paths', []), waterways.get('paths', []), conflicts)
+
+    paths = merge_by_id('path', map_rivers.get('paths', []), waterways.get('paths', []), [])
+    crossings = merge_by_id('crossing', map_rivers.get('crossings', []),
+                            waterways.get('crossings', []), conflicts)
+    waterfalls = merge_by_id('waterfall', map_rivers.get('waterfalls', []),
+                             waterways.get('waterfalls', []), conflicts)
+
+    compiled = {
+        'rivers': {
+            'paths': paths,
+            'crossings': crossings,
+            'waterfalls': waterfalls,
+        },
+        'edges': build_edge_index(paths, crossings, waterfalls, unresolved),
+    }
+    return compiled, conflicts, unresolved
+
+
+def main():
+    strict = '--strict' in sys.argv
+
+    print("🌊 Merging waterways...")
+    print(f"   Waterways: {WATERWAYS_PATH}")
+    print(f"   Map:       {MAP_PATH}")
+
+    map_data = load_json(MAP_PATH)
+    compiled, conflicts, unresolved = merge_waterways(map_data)
+    size = write_json(OUTPUT_FILE, compiled, indent=None)
+    map_size = write_json(MAP_OUTPUT_FILE, runtime_map(map_data), indent=None)
+
+    rivers = compiled['rivers']
+    print(f"\n✅ Paths: {len(rivers['paths'])}, crossings: {len(rivers['crossings'])}, "
+          f"waterfalls: {len(rivers['waterfalls'])}")
+    print(f"✅ Edge index: {len(compiled['edges'])} edges")
+    if unresolved:
+        print(f"⚠️  {len(unresolved)} features could not be placed on an edge")
+
+    if conflicts:
+        print(f"\n⚠️  {len(conflicts)} conflicts (map export wins):")
+        for conflict in conflicts:
+            details = ', '.join(f"{k}={v}" for k, v in conflict.items() if k not in ('kind', 'id'))
+            print(f"   • {conflict['kind']} {conflict['id']}: {details}")
+    else:
+        print("✅ No conflicts between sources")
+
+    print(f"📁 Output written to: {OUTPUT_FILE} ({size / 1024:.1f} KB)")
+    print(f"📁 Output written to: {MAP_OUTPUT_FILE} ({map_size / 1024:.1f} KB, "
+          f"source {MAP_PATH.stat().st_size / 1024:.1f} KB)")
+
+    if strict and conflicts:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,7 @@ To:
   }
 """
 
-import json
-from pathlib import Path
+from structure_catalog import STRUCTURES_DIR, StructureCatalog
 
 def migrate_skill_structure_tier(tier):
     """Migrate a single tier from bonus/skills to gameEffects."""
@@ -47,12 +46,11 @@ def migrate_skill_structure_tier(tier):
     
     return True
 
-def migrate_skill_structure_file(filepath):
+def migrate_skill_structure_file(catalog, filepath):
     """Migrate a skill structure file."""
     print(f"Processing {filepath.name}...")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = catalog.families[filepath]
     
     # Verify this is a skill structure
     if data.get('type') != 'skill':
@@ -72,25 +70,22 @@ def migrate_skill_structure_file(filepath):
             changes_count += 1
     
     # Write back the migrated data
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')  # Add trailing newline
+    catalog.save_family(filepath)
     
     print(f"  ✅ Migrated {changes_count} tiers")
     return changes_count
 
 def main():
     """Process all skill structure files in data/structures/"""
-    structures_dir = Path(__file__).parent.parent / "data" / "structures"
-    
-    if not structures_dir.exists():
-        print(f"❌ Directory not found: {structures_dir}")
+    if not STRUCTURES_DIR.exists():
+        print(f"❌ Directory not found: {STRUCTURES_DIR}")
         return
     
-    print(f"🔍 Scanning {structures_dir}\n")
+    print(f"🔍 Scanning {STRUCTURES_DIR}\n")
     
-    # Get all skill structure files
-    skill_files = sorted(structures_dir.glob("skill-*.json"))
+    # Load all structure families once
+    catalog = StructureCatalog.load()
+    skill_files = [path for path in catalog.families if path.name.startswith("skill-")]
     
     if not skill_files:
         print("❌ No skill structure files found")
@@ -100,7 +95,7 @@ def main():
     total_files = 0
     
     for filepath in skill_files:
-        tiers = migrate_skill_structure_file(filepath)
+        tiers = migrate_skill_structure_file(catalog, filepath)
         total_tiers += tiers
         total_files += 1
     
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Exact four-degree outcome odds for a d20 check (PF2e rules).
+
+The degree of a check only depends on modifier - DC, and it saturates
+outside -30..+9: at +9 or more only a natural 1 misses a critical
+success, at -30 or less only a natural 20 lifts a critical failure. The
+table is therefore one row of d20 face counts (out of 20) per difference
+in that range, computed with the same rules as
+src/domain/checks/outcomeLogic.ts:
+
+- beat the DC by 10+ → critical success, meet it → success,
+  miss by less than 10 → failure, miss by 10+ → critical failure
+- a natural 20 improves the degree by one step, a natural 1 worsens it
+
+The lookup artifact (docs/planning/outcome-odds.json) holds that table
+plus the level-based DC and skill-bonus tables from
+src/domain/checks/dcLogic.ts, so balance tools can weight each outcome
+column of a CSV row by its real odds.
+
+Use from other build scripts:
+
+    from outcome_odds import odds, odds_for_level, expected_value
+    odds(7, 15)                          # {'criticalSuccess': 0.15, 'success': 0.5, ...}
+    odds_for_level(5)                    # typical skill bonus vs the level-based DC
+    expected_value({'criticalSuccess': 7, 'success': 4, 'failure': -4, 'criticalFailure': -7},
+                   odds_for_level(5))
+
+Usage:
+    python buildscripts/outcome_odds.py                  # per-level table
+    python buildscripts/outcome_odds.py --modifier 12 --dc 20
+    python buildscripts/outcome_odds.py --write          # regenerate the artifact
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ts_source import parse_source
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DC_LOGIC_FILE = PROJECT_ROOT / "src" / "domain" / "checks" / "dcLogic.ts"
+ODDS_FILE = PROJECT_ROOT / "docs" / "planning" / "outcome-odds.json"
+
+OUTCOMES = ['criticalSuccess', 'success', 'failure', 'criticalFailure']
+
+# modifier - DC range outside of which the odds no longer change
+MIN_DIFFERENCE = -30
+MAX_DIFFERENCE = 9
+
+
+def degree(total: int, dc: int, natural: int) -> int:
+    """Index into OUTCOMES for one roll (0 = critical success)."""
+    difference = total - dc
+    if difference >= 10:
+        index = 0
+    elif difference >= 0:
+        index = 1
+    elif difference > -10:
+        index = 2
+    else:
+        index = 3
+    if natural == 20:
+        index = max(index - 1, 0)
+    elif natural == 1:
+        index = min(index + 1, 3)
+    return index
+
+
+def face_counts(difference: int) -> List[int]:
+    """d20 faces landing on each outcome for a given modifier - DC."""
+    counts = [0, 0, 0, 0]
+    for natural in range(1, 21):
+        counts[degree(natural + difference, 0, natural)] += 1
+    return counts
+
+
+COUNTS: List[List[int]] = [face_counts(d) for d in range(MIN_DIFFERENCE, MAX_DIFFERENCE + 1)]
+
+
+def counts_for(modifier: int, dc: int) -> List[int]:
+    difference = min(max(modifier - dc, MIN_DIFFERENCE), MAX_DIFFERENCE)
+    return COUNTS[difference - MIN_DIFFERENCE]
+
+
+def odds(modifier: int, dc: int) -> Dict[str, float]:
+    """Probability of each outcome for modifier vs DC."""
+    return {outcome: count / 20 for outcome, count in zip(OUTCOMES, counts_for(modifier, dc))}
+
+
+def expected_value(values: Dict[str, Optional[float]], weights: Dict[str, float]) -> float:
+    """Probability-weighted value of the four outcome columns (blank cells count 0)."""
+    return sum((values.get(outcome) or 0) * weights[outcome] for outcome in OUTCOMES)
+
+
+# ----------------------------------------------------------------------
+# Level tables (src/domain/checks/dcLogic.ts)
+# ----------------------------------------------------------------------
+
+def load_level_tables() -> Dict[str, Dict[int, int]]:
+    """DC_BY_LEVEL and SKILL_BONUS_BY_LEVEL, keyed by level."""
+    source = parse_source(DC_LOGIC_FILE.read_text(encoding='utf-8'))
+    tables = {}
+    for name in ('DC_BY_LEVEL', 'SKILL_BONUS_BY_LEVEL'):
+        node = source.exported_object(name)
+        if node is None:
+            raise ValueError(f"{name} not found in {DC_LOGIC_FILE}")
+        tables[name] = {int(p.key): int(p.value.text) for p in node.properties}
+    return tables
+
+
+_level_tables: Optional[Dict[str, Dict[int, int]]] = None
+
+
+def level_tables() -> Dict[str, Dict[int, int]]:
+    global _level_tables
+    if _level_tables is None:
+        _level_tables = load_level_tables()
+    return _level_tables
+
+
+def odds_for_level(level: int, modifier_offset: int = 0) -> Dict[str, float]:
+    """Odds for the typical skill bonus (+ offset) against the level-based DC."""
+    tables = level_tables()
+    level = max(1, min(20, level))
+    return odds(tables['SKILL_BONUS_BY_LEVEL'][level] + modifier_offset, tables['DC_BY_LEVEL'][level])
+
+
+# ----------------------------------------------------------------------
+# Artifact
+# ----------------------------------------------------------------------
+
+def build_artifact() -> Dict:
+    tables = level_tables()
+    return {
+        'version': 1,
+        'outcomes': OUTCOMES,
+        'denominator': 20,
+        'minDifference': MIN_DIFFERENCE,
+        'maxDifference': MAX_DIFFERENCE,
+        # counts[i] = d20 faces per outcome at modifier - DC = minDifference + i (clamp outside)
+        'counts': COUNTS,
+        'levels': {
+            str(level): {
+                'dc': tables['DC_BY_LEVEL'][level],
+                'modifier': tables['SKILL_BONUS_BY_LEVEL'][level],
+                'counts': counts_for(tables['SKILL_BONUS_BY_LEVEL'][level], tables['DC_BY_LEVEL'][level]),
+            }
+            for level in sorted(tables['DC_BY_LEVEL'])
+        },
+    }
+
+
+def write_artifact(path: Path = ODDS_FILE) -> Dict:
+    artifact = build_artifact()
+    # One [cs, s, f, cf] row per line keeps the file small and diffable
+    text = re.sub(r'\[\s+(\d+),\s+(\d+),\s+(\d+),\s+(\d+)\s+\]', r'[\1, \2, \3, \4]',
+                  json.dumps(artifact, indent=2))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text + "\n")
+    return artifact
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Four-degree outcome odds for d20 checks")
+    parser.add_argument('--modifier', type=int, help="Total check modifier")
+    parser.add_argument('--dc', type=int, help="Difficulty class")
+    parser.add_argument('--write', action='store_true', help=f"Write {ODDS_FILE.name}")
+    args = parser.parse_args()
+
+    if args.write:
+        artifact = write_artifact()
+        print(f"📁 Wrote {ODDS_FILE.relative_to(PROJECT_ROOT)} "
+              f"({len(artifact['counts'])} differences, {len(artifact['levels'])} levels)")
+        return
+
+    if args.modifier is not None or args.dc is not None:
+        if args.modifier is None or args.dc is None:
+            parser.error("--modifier and --dc go together")
+        weights = odds(args.modifier, args.dc)
+        print(f"🎲 +{args.modifier} vs DC {args.dc}")
+        for outcome in OUTCOMES:
+            print(f"  {outcome:16s} {weights[outcome] * 100:5.1f}%")
+        return
+
+    tables = level_tables()
+    print(f"{'level':>5s} {'mod':>4s} {'DC':>4s}  " + "".join(f"{o:>17s}" for o in OUTCOMES))
+    for level in sorted(tables['DC_BY_LEVEL']):
+        weights = odds_for_level(level)
+        print(f"{level:5d} {tables['SKILL_BONUS_BY_LEVEL'][level]:+4d} {tables['DC_BY_LEVEL'][level]:4d}  "
+              + "".join(f"{weights[o] * 100:16.1f}%" for o in OUTCOMES))
+
+
+if __name__ == "__main__":
+    main()
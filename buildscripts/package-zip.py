@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Create the release zip for package.js - fast and reproducible.
+
+- Already-compressed formats (.webp, .png, .jpg, fonts, ...) are STORED,
+  so 200 MB of images are streamed into the archive without recompression
+- Text formats (.js, .json, .css, .md, ...) are deflated in parallel
+  worker threads (zlib releases the GIL while compressing)
+- Entries are written in sorted path order with a fixed timestamp and
+  fixed permissions, so the same inputs always produce the same bytes
+
+Usage:
+    python buildscripts/package-zip.py SOURCE_DIR ZIP_PATH [--prefix NAME] [--level N]
+
+--prefix puts every entry under NAME/ (e.g. the module id).
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Tuple
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# Formats that are already compressed - deflating them wastes time for ~0% gain
+STORED_SUFFIXES = {
+    '.webp', '.png', '.jpg', '.jpeg', '.gif', '.mp3', '.ogg', '.webm', '.mp4',
+    '.woff', '.woff2', '.zip', '.gz', '.br', '.db',
+}
+
+# 1980-01-01 00:00:00, the earliest DOS timestamp
+DOS_TIME = 0
+DOS_DATE = (0 << 9) | (1 << 5) | 1
+
+FILE_ATTRIBUTES = (0o100644 & 0xFFFF) << 16
+VERSION_MADE_BY = (3 << 8) | 20  # Unix, spec 2.0
+VERSION_NEEDED = 20
+UTF8_FLAG = 0x0800
+CHUNK_SIZE = 1 << 20
+
+STORED, DEFLATED = 0, 8
+
+
+def crc_of_file(path: Path) -> int:
+    """CRC-32 of a file, streamed in chunks."""
+    crc = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def deflate_file(path: Path, level: int) -> Tuple[int, int, bytes]:
+    """Raw-deflate a file; returns (crc, uncompressed size, compressed bytes)."""
+    data = path.read_bytes()
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return zlib.crc32(data), len(data), compressed
+
+
+def prepare_entry(path: Path, level: int) -> Dict:
+    """Compute everything needed for an entry's local header (worker thread)."""
+    if path.suffix.lower() in STORED_SUFFIXES:
+        size = path.stat().st_size
+        return {'method': STORED, 'crc': crc_of_file(path), 'size': size, 'csize': size}
+    crc, size, compressed = deflate_file(path, level)
+    if len(compressed) >= size:
+        # Incompressible after all - store it
+        return {'method': STORED, 'crc': crc, 'size': size, 'csize': size}
+    return {'method': DEFLATED, 'crc': crc, 'size': size, 'csize': len(compressed), 'data': compressed}
+
+
+def write_local_entry(out: BinaryIO, name: bytes, entry: Dict, path: Path) -> None:
+    """Write the local file header and file data."""
+    out.write(struct.pack(
+        '<IHHHHHIIIHH',
+        0x04034B50, VERSION_NEEDED, UTF8_FLAG, entry['method'], DOS_TIME, DOS_DATE,
+        entry['crc'], entry['csize'], entry['size'], len(name), 0,
+    ))
+    out.write(name)
+    if entry['method'] == DEFLATED:
+        out.write(entry['data'])
+    else:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                out.write(chunk)
+
+
+def write_central_directory(out: BinaryIO, records: List[Tuple[bytes, Dict, int]]) -> None:
+    """Write the central directory and end-of-central-directory record."""
+    start = out.tell()
+    for name, entry, offset in records:
+        out.write(struct.pack(
+            '<IHHHHHHIIIHHHHHII',
+            0x02014B50, VERSION_MADE_BY, VERSION_NEEDED, UTF8_FLAG, entry['method'],
+            DOS_TIME, DOS_DATE, entry['crc'], entry['csize'], entry['size'],
+            len(name), 0, 0, 0, 0, FILE_ATTRIBUTES, offset,
+        ))
+        out.write(name)
+    size = out.tell() - start
+    out.write(struct.pack(
+        '<IHHHHIIH',
+        0x06054B50, 0, 0, len(records), len(records), size, start, 0,
+    ))
+
+
+def collect_files(source_dir: Path) -> List[Path]:
+    """All files under source_dir in a stable order."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames.sort()
+        for name in sorted(filenames):
+            files.append(Path(dirpath) / name)
+    return sorted(files, key=lambda p: p.relative_to(source_dir).as_posix())
+
+
+def create_zip(source_dir: Path, zip_path: Path, prefix: str = '', level: int = 9,
+               workers: int = 0) -> Dict[str, int]:
+    """Write a reproducible zip of source_dir; returns entry counts per method."""
+    files = collect_files(source_dir)
+    if len(files) >= 0xFFFF:
+        raise ValueError("Too many files for a non-ZIP64 archive")
+
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    records: List[Tuple[bytes, Dict, int]] = []
+    counts = {'stored': 0, 'deflated': 0}
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool, \
+            open(zip_path, 'wb') as out:
+        # map() yields in submission order, so entries are written sorted
+        prepared = pool.map(lambda p: prepare_entry(p, level), files)
+        for path, entry in zip(files, prepared):
+            relative = path.relative_to(source_dir).as_posix()
+            name = (f"{prefix}/{relative}" if prefix else relative).encode('utf-8')
+            if entry['csize'] > 0xFFFFFFFF or out.tell() > 0xFFFFFFFF:
+                raise ValueError("Archive too large for a non-ZIP64 archive")
+            offset = out.tell()
+            write_local_entry(out, name, entry, path)
+            entry.pop('data', None)
+            records.append((name, entry, offset))
+            counts['deflated' if entry['method'] == DEFLATED else 'stored'] += 1
+
+        write_central_directory(out, records)
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create a reproducible release zip")
+    parser.add_argument('source', type=Path)
+    parser.add_argument('zip_path', type=Path)
+    parser.add_argument('--prefix', default='', help="Top-level folder inside the archive")
+    parser.add_argument('--level', type=int, default=9, help="Deflate level for text files")
+    parser.add_argument('--workers', type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = create_zip(args.source, args.zip_path, args.prefix, args.level, args.workers)
+    elapsed = time.perf_counter() - started
+
+    print(f"   ✓ {counts['deflated']} deflated, {counts['stored']} stored "
+          f"in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
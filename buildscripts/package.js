@@ -7,7 +7,7 @@
 
 import fs from 'fs';
 import path from 'path';
-import { execSync } from 'child_process';
+import { execSync, spawnSync } from 'child_process';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
 
@@ -126,28 +126,61 @@ function copyDirectoryRecursive(source, target) {
     });
 }
 
+/**
+ * Create a reproducible zip archive using buildscripts/package-zip.py
+ * Stores already-compressed images as-is and deflates text files in parallel
+ * @returns true if the archive was created
+ */
+function createReproducibleZip(sourceDir, zipPath) {
+    if (fs.existsSync(zipPath)) {
+        fs.rmSync(zipPath);
+    }
+    const result = spawnSync('node', [
+        path.join(__dirname, 'run-python.js'),
+        path.join(__dirname, 'package-zip.py'),
+        sourceDir,
+        zipPath,
+        '--prefix', MODULE_NAME
+    ], { stdio: 'inherit', cwd: PROJECT_ROOT });
+    return result.status === 0;
+}
+
 /**
  * Create a zip archive from directory
- * Uses platform-specific commands
+ * Prefers the reproducible Python packager, falls back to platform-specific commands.
+ * Both paths put every entry under the same MODULE_NAME/ folder.
  */
 function createZipArchive(sourceDir, zipPath) {
+    if (createReproducibleZip(sourceDir, zipPath)) {
+        return true;
+    }
+    console.log('⚠️  Reproducible packager failed, falling back to platform zip');
+
     const platform = process.platform;
-    const sourceName = path.basename(sourceDir);
-    const parentDir = path.dirname(sourceDir);
-    
+    // Stage the files as <staging>/MODULE_NAME so the archive layout matches package-zip.py --prefix
+    const stagingDir = path.join(path.dirname(sourceDir), '.package-staging');
+    const stagedDir = path.join(stagingDir, MODULE_NAME);
+    fs.rmSync(stagingDir, { recursive: true, force: true });
+    fs.rmSync(zipPath, { force: true });
+    fs.mkdirSync(stagingDir, { recursive: true });
+    fs.renameSync(sourceDir, stagedDir);
+
     try {
         if (platform === 'win32') {
-            // Windows: Use PowerShell Compress-Archive
-            const psCommand = `Compress-Archive -Path "${sourceDir}\\*" -DestinationPath "${zipPath}" -Force`;
-            execSync(`powershell -Command "${psCommand}"`, { cwd: parentDir, stdio: 'inherit' });
+            // Windows: Use PowerShell Compress-Archive (a folder path keeps the folder as the top-level entry)
+            const psCommand = `Compress-Archive -Path "${stagedDir}" -DestinationPath "${zipPath}" -Force`;
+            execSync(`powershell -Command "${psCommand}"`, { cwd: stagingDir, stdio: 'inherit' });
         } else {
             // Unix-like (macOS, Linux): Use zip command
-            execSync(`cd "${parentDir}" && zip -r "${zipPath}" "${sourceName}"`, { stdio: 'inherit' });
+            execSync(`cd "${stagingDir}" && zip -r "${zipPath}" "${MODULE_NAME}"`, { stdio: 'inherit' });
         }
         return true;
     } catch (error) {
         console.error('❌ Failed to create zip archive:', error.message);
         return false;
+    } finally {
+        fs.renameSync(stagedDir, sourceDir);
+        fs.rmSync(stagingDir, { recursive: true, force: true });
     }
 }
 
@@ -6,10 +6,16 @@ This script reads the balance table and outputs the modifier structures needed
 for each event's strategic choice outcomes.
 """
 
-import csv
 import re
 from typing import Dict, List, Tuple
 
+from planning_tables import load_table
+
+# Dice formula in an effect ('1d3', 'd2'); a bare 'd' would also match 'Gold' / 'Food'
+DICE_PATTERN = re.compile(r'\b\d*d\d+')
+# Specific resources count as the generic 'resource' bucket's members
+RESOURCE_PATTERN = r'(Resource|Lumber|Stone|Ore|Materials)'
+
 def parse_effect(effect: str) -> List[Dict]:
     """Parse an effect string into modifier objects."""
     if not effect or effect.strip() == "":
@@ -22,8 +28,16 @@ def parse_effect(effect: str) -> List[Dict]:
         if not part:
             continue
             
+        # Ongoing effects (checked first - they name a resource too)
+        if 'Ongoing' in part:
+            modifiers.append({
+                'type': 'game_command',
+                'command': 'ongoing',
+                'text': part
+            })
+        
         # Faction adjustments
-        if 'Faction +' in part or 'Faction -' in part:
+        elif 'Faction +' in part or 'Faction -' in part:
             match = re.search(r'Faction ([+-])(\d+)', part)
             if match:
                 sign = match.group(1)
@@ -36,8 +50,8 @@ def parse_effect(effect: str) -> List[Dict]:
                 })
         
         # Fame
-        elif 'Fame +' in part or 'Fame -' in part or part == '+1 Fame' or part == '-1 Fame':
-            match = re.search(r'([+-])?(\d+)\s*Fame', part)
+        elif 'Fame' in part:
+            match = re.search(r'([+-])?(\d+)\s*Fame', part) or re.search(r'Fame\s*([+-])(\d+)', part)
             if match:
                 sign = match.group(1) or '+'
                 amount = int(match.group(2))
@@ -49,8 +63,8 @@ def parse_effect(effect: str) -> List[Dict]:
                 })
         
         # Unrest with dice
-        elif 'd' in part and 'Unrest' in part:
-            match = re.search(r'([+-])?(\d+d\d+(?:[+-]\d+)?)\s*Unrest', part)
+        elif DICE_PATTERN.search(part) and 'Unrest' in part:
+            match = re.search(r'([+-])?(\d*d\d+(?:[+-]\d+)?)\s*Unrest', part)
             if match:
                 sign = match.group(1) or '+'
                 formula = match.group(2)
@@ -76,8 +90,8 @@ def parse_effect(effect: str) -> List[Dict]:
                 })
         
         # Gold with dice
-        elif 'd' in part and 'Gold' in part:
-            match = re.search(r'([+-])?(\d+d\d+(?:[+-]\d+)?)\s*Gold', part)
+        elif DICE_PATTERN.search(part) and 'Gold' in part:
+            match = re.search(r'([+-])?(\d*d\d+(?:[+-]\d+)?)\s*Gold', part)
             if match:
                 sign = match.group(1) or '+'
                 formula = match.group(2)
@@ -103,8 +117,8 @@ def parse_effect(effect: str) -> List[Dict]:
                 })
         
         # Food with dice
-        elif 'd' in part and 'Food' in part:
-            match = re.search(r'([+-])?(\d+d\d+(?:[+-]\d+)?)\s*Food', part)
+        elif DICE_PATTERN.search(part) and 'Food' in part:
+            match = re.search(r'([+-])?(\d*d\d+(?:[+-]\d+)?)\s*Food', part)
             if match:
                 sign = match.group(1) or '+'
                 formula = match.group(2)
@@ -130,8 +144,8 @@ def parse_effect(effect: str) -> List[Dict]:
                 })
         
         # Resource with dice (random resource)
-        elif 'd' in part and 'Resource' in part:
-            match = re.search(r'([+-])?(\d+d\d+(?:[+-]\d+)?)\s*Resource', part)
+        elif DICE_PATTERN.search(part) and re.search(RESOURCE_PATTERN, part):
+            match = re.search(r'([+-])?(\d*d\d+(?:[+-]\d+)?)\s*' + RESOURCE_PATTERN, part)
             if match:
                 sign = match.group(1) or '+'
                 formula = match.group(2)
@@ -139,20 +153,20 @@ def parse_effect(effect: str) -> List[Dict]:
                     formula = f'-{formula}'
                 modifiers.append({
                     'type': 'dice',
-                    'resource': 'resource',  # Random resource
+                    'resource': 'resource' if match.group(3) == 'Resource' else match.group(3).lower(),
                     'formula': formula
                 })
         
         # Resource static
-        elif 'Resource' in part and 'Resource' not in ['Lumber', 'Stone', 'Ore']:
-            match = re.search(r'([+-])(\d+)\s*Resource', part)
+        elif re.search(RESOURCE_PATTERN, part):
+            match = re.search(r'([+-])(\d+)\s*' + RESOURCE_PATTERN, part)
             if match:
                 sign = match.group(1)
                 amount = int(match.group(2))
                 value = amount if sign == '+' else -amount
                 modifiers.append({
                     'type': 'static',
-                    'resource': 'resource',  # Random resource
+                    'resource': 'resource' if match.group(3) == 'Resource' else match.group(3).lower(),
                     'value': value
                 })
         
@@ -199,7 +213,7 @@ def parse_effect(effect: str) -> List[Dict]:
                 'command': 'army',
                 'text': part
             })
-        elif 'Claim' in part and 'hex' in part:
+        elif ('Claim' in part or 'Lose' in part) and 'hex' in part:
             modifiers.append({
                 'type': 'game_command',
                 'command': 'claim_hex',
@@ -223,46 +237,37 @@ def parse_effect(effect: str) -> List[Dict]:
                 'command': 'innocents',
                 'text': part
             })
-        elif 'Ongoing' in part:
-            modifiers.append({
-                'type': 'game_command',
-                'command': 'ongoing',
-                'text': part
-            })
     
     return modifiers
 
 def main():
+    table = load_table('balance')
     events = {}
-    current_event = None
     
-    with open('../docs/planning/EVENT_BALANCE_TABLE.csv', 'r') as f:
-        reader = csv.DictReader(f)
+    for event in table.events():
+        rows = table.rows_for(event)
+        if not event or not event[0].isdigit():
+            continue
+        event_num = event.split('.')[0]
+        event_name = event.split('.')[1].strip()
+        events[event_name] = {
+            'number': event_num,
+            'description': table.get(rows[0], 'Description'),
+            'approaches': {}
+        }
         
-        for row in reader:
-            name = row['Name'].strip()
-            if name and name[0].isdigit():
-                # New event
-                event_num = name.split('.')[0]
-                event_name = name.split('.')[1].strip()
-                current_event = event_name
-                events[current_event] = {
-                    'number': event_num,
-                    'description': row['Description'],
-                    'approaches': {}
-                }
+        for row in rows:
+            approach_type = table.approach[row]
+            if not approach_type:
+                continue
             
-            if current_event and row['Approach']:
-                approach_type = row['Approach'].strip()
-                approach_name = row['Approach Descriptor'].strip()
-                
-                events[current_event]['approaches'][approach_type] = {
-                    'name': approach_name,
-                    'criticalSuccess': parse_effect(row['Critical Success']),
-                    'success': parse_effect(row['Success']),
-                    'failure': parse_effect(row['Failure']),
-                    'criticalFailure': parse_effect(row['Critical Failure'])
-                }
+            events[event_name]['approaches'][approach_type] = {
+                'name': table.get(row, 'Approach Descriptor').strip(),
+                'criticalSuccess': parse_effect(table.get(row, 'Critical Success')),
+                'success': parse_effect(table.get(row, 'Success')),
+                'failure': parse_effect(table.get(row, 'Failure')),
+                'criticalFailure': parse_effect(table.get(row, 'Critical Failure'))
+            }
     
     # Output summary
     print("=== EVENT BALANCE TABLE PARSED ===\n")
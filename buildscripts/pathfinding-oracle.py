@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Reference pathfinding oracle for the army movement rules.
+
+A standalone re-implementation of the hex-level movement costs in
+src/services/pathfinding/MovementGraph.ts (getEdgeCost) and the fallback
+A* in src/services/pathfinding/index.ts, run over a map export
+(stolen-lands-map.json or a generate-large-map.py synthetic map). It
+batch-solves random origin/destination pairs and writes the expected
+results as a fixture, so the TS services get a correctness oracle and a
+performance baseline at any map size.
+
+Movement rules (cost of entering the target hex):
+- land: 1 open, 2 difficult, 3 greater-difficult; swamps add 1 (max 3);
+  a road or settlement takes 1 off (min 1); lakes are impassable
+- water (lake / swamp hexes): 1 / 2 with swim or boats, +1 upstream
+- a river edge without a ford or bridge blocks units that cannot swim
+  and have no boats; a waterfall blocks boats unless the unit can swim
+- amphibious units take the cheaper of land and water; flying costs 1
+
+Two graph models (--model):
+- runtime (default): the graph MovementGraph builds. Neighbors follow
+  NavigationGrid.getNeighborHexIds (odd-q column parity); hasCrossing,
+  hasWaterfall and isUpstream are WaterwayLookup's per-hex checks (a
+  feature marks its hex and the hex across its edge, and only features
+  with hexI/hexJ are placed, as in buildCrossingLookup). crossesRiver
+  stands in for the canvas line test of doesMovementCrossRiver: a move
+  crosses a river when either hex has a river point on its center or
+  both hexes carry the river.
+- edge: rivers resolved per hex edge with merge-waterways.py's edge index
+  (a river point on an edge blocks that edge unless a crossing sits on
+  it) over hex_grid.py neighbors (odd rows shifted), the convention of the
+  river editor's edge IDs. Stricter than the runtime; use it to check
+  river data, not the TS services.
+
+totalCost is the oracle value; path is one optimal path (ties may be
+broken differently than the TS A*).
+
+Fixture (JSON Lines, gzip when the name ends in .gz):
+    {"type": "meta", "map": ..., "model": "runtime", "hexes": ..., "maxMovement": 20, ...}
+    {"type": "query", "from": "3.4", "to": "7.9",
+     "results": {"grounded": {"isReachable": true, "totalCost": 9, "path": ["3.4", ...]}, ...}}
+
+Unreachable queries have totalCost null and an empty path (PathResult
+uses Infinity).
+
+Usage:
+    python buildscripts/pathfinding-oracle.py [--map PATH] [--pairs 2000] [--seed 1]
+                                              [--max-movement 20] [--radius N] [--model runtime|edge]
+                                              [--traits grounded,boats,...] [--output PATH]
+    python buildscripts/generate-large-map.py --hexes 100k --output big.json.gz
+    python buildscripts/pathfinding-oracle.py --map big.json.gz --pairs 5000
+"""
+
+import argparse
+import gzip
+import heapq
+import importlib.util
+import json
+import random
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from hex_grid import (
+    EDGE_DIRECTIONS,
+    MAP_PATH,
+    OPPOSITE_EDGE,
+    PROJECT_ROOT,
+    format_hex_id,
+    load_map,
+    map_hex_index,
+    neighbor,
+    neighbor_table,
+    parse_hex_id,
+    sorted_points,
+)
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+OUTPUT_DIR = PROJECT_ROOT / "golden-vectors"
+
+# DEFAULT_MOVEMENT_RANGE in src/services/pathfinding/index.ts
+DEFAULT_MOVEMENT_RANGE = 20
+
+INF = float('inf')
+
+# ArmyMovementTraits (src/utils/armyMovementTraits.ts) combinations worth pinning
+TRAIT_SETS: Dict[str, Dict[str, bool]] = {
+    'grounded': {},
+    'swimmer': {'canSwim': True},
+    'boats': {'hasBoats': True},
+    'amphibious': {'canSwim': True, 'amphibious': True},
+    'flying': {'canFly': True},
+}
+
+# HexNode.waterType
+WATER_NONE, WATER_LAKE, WATER_SWAMP = 0, 1, 2
+
+# EdgeData flags
+CROSSES_RIVER = 1
+HAS_CROSSING = 2
+HAS_WATERFALL = 4
+IS_UPSTREAM = 8
+
+SLOTS = len(EDGE_DIRECTIONS)
+
+# ODD_Q_NEIGHBORS in src/services/pathfinding/NavigationGrid.ts, (row delta, col delta)
+ODD_Q_NEIGHBORS = {
+    'odd': ((-1, 0), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1)),
+    'even': ((-1, 0), (-1, 1), (0, 1), (1, 0), (0, -1), (-1, -1)),
+}
+
+MODELS = ('runtime', 'edge')
+
+
+def load_merge_waterways():
+    spec = importlib.util.spec_from_file_location(
+        'merge_waterways', Path(__file__).parent / 'merge-waterways.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def odd_q_neighbor_table(hex_index: Dict[str, int]) -> List[List[int]]:
+    """neighbor_table() with NavigationGrid.getNeighborHexIds() offsets (-1 off the map)."""
+    table = []
+    for hex_id in hex_index:
+        row, col = parse_hex_id(hex_id)
+        offsets = ODD_Q_NEIGHBORS['odd' if col % 2 == 1 else 'even']
+        table.append([hex_index.get(format_hex_id(row + d_row, col + d_col), -1) for d_row, d_col in offsets])
+    return table
+
+
+class MovementModel:
+    """
+    Array-backed movement graph of one map export.
+
+    Hexes use the dense map_hex_index() IDs; every per-edge array is
+    indexed by hex * 6 + slot, slots in ODD_Q_NEIGHBORS order for the
+    runtime model and EDGE_DIRECTIONS order for the edge model.
+    """
+
+    def __init__(self, map_data: Dict, model: str = 'runtime'):
+        self.model = model
+        self.hex_index = map_hex_index(map_data)
+        self.hex_ids = list(self.hex_index)
+        count = len(self.hex_ids)
+
+        # Axial coordinates for the A* heuristic
+        coords = [parse_hex_id(hex_id) for hex_id in self.hex_ids]
+        axial = [self._axial(row, col) for row, col in coords]
+        self.q = array('i', (q for q, _ in axial))
+        self.r = array('i', (r for _, r in axial))
+        table = odd_q_neighbor_table(self.hex_index) if model == 'runtime' else neighbor_table(self.hex_index)
+        self.neighbors = array('i', (n for row in table for n in row))
+
+        self.water = bytearray(count)
+        self.land_cost = array('d', bytes(8 * count))
+        self.flags = bytearray(count * SLOTS)
+        self.unresolved: List[Dict] = []
+
+        self._build_nodes(map_data)
+        if model == 'runtime':
+            self._build_hex_rivers(map_data.get('rivers', {}))
+        else:
+            self._build_rivers(map_data.get('rivers', {}))
+
+    def _axial(self, row: int, col: int) -> Tuple[int, int]:
+        if self.model == 'runtime':
+            return col, row - (col - (col & 1)) // 2
+        return col - (row - (row & 1)) // 2, row
+
+    def _offset(self, q: int, r: int) -> Tuple[int, int]:
+        """Inverse of _axial(): (row, col)."""
+        if self.model == 'runtime':
+            return r + (q - (q & 1)) // 2, q
+        return r, q + (r - (r & 1)) // 2
+
+    def _build_nodes(self, map_data: Dict) -> None:
+        features = map_data.get('waterFeatures', {})
+        lakes = {f"{lake['hexI']}.{lake['hexJ']}" for lake in features.get('lakes', [])}
+        swamps = {f"{swamp['hexI']}.{swamp['hexJ']}" for swamp in features.get('swamps', [])}
+        roads = set(map_data.get('roads', []))
+        roads.update(s['hexId'] for s in map_data.get('settlements', []) if s.get('hexId'))
+
+        for hex_ in map_data.get('terrain', []):
+            index = self.hex_index[hex_['id']]
+            if hex_['id'] in lakes or hex_.get('terrain') == 'water':
+                self.water[index] = WATER_LAKE
+            elif hex_['id'] in swamps:
+                self.water[index] = WATER_SWAMP
+            self.land_cost[index] = self._land_cost(hex_.get('travel'), self.water[index], hex_['id'] in roads)
+
+    @staticmethod
+    def _land_cost(travel: Optional[str], water: int, has_road: bool) -> float:
+        """MovementGraph.calculateLandCost()."""
+        if water == WATER_LAKE:
+            return INF
+        cost = {'difficult': 2, 'greater-difficult': 3}.get(travel, 1)
+        if water == WATER_SWAMP and cost < 3:
+            cost += 1
+        if has_road:
+            cost = max(1, cost - 1)
+        return cost
+
+    def _slot(self, a: int, b: int) -> int:
+        for slot in range(SLOTS):
+            if self.neighbors[a * SLOTS + slot] == b:
+                return slot
+        return -1
+
+    def _build_rivers(self, rivers: Dict) -> None:
+        paths = rivers.get('paths', [])
+        edge_index = load_merge_waterways().build_edge_index(
+            paths, rivers.get('crossings', []), rivers.get('waterfalls', []), self.unresolved)
+
+        for edge_id, entry in edge_index.items():
+            flag = ((CROSSES_RIVER if entry['paths'] else 0)
+                    | (HAS_CROSSING if 'crossing' in entry else 0)
+                    | (HAS_WATERFALL if entry.get('waterfall') else 0))
+            row, col, edge = edge_id.split(',')[0].split(':')
+            a = self.hex_index.get(f"{row}.{col}")
+            if a is None or not flag:
+                continue
+            slot = EDGE_DIRECTIONS.index(edge)
+            b = self.neighbors[a * SLOTS + slot]
+            self.flags[a * SLOTS + slot] |= flag
+            if b >= 0:
+                self.flags[b * SLOTS + EDGE_DIRECTIONS.index(OPPOSITE_EDGE[edge])] |= flag
+
+        # WaterwayLookup flow edges: consecutive path points in different hexes
+        for path in paths:
+            previous = None
+            for point in sorted_points(path):
+                current = self.hex_index.get(f"{point['hexI']}.{point['hexJ']}")
+                if current is not None and previous is not None and current != previous:
+                    slot = self._slot(current, previous)
+                    if slot >= 0:
+                        self.flags[current * SLOTS + slot] |= IS_UPSTREAM
+                previous = current
+
+    def _build_hex_rivers(self, rivers: Dict) -> None:
+        """WaterwayLookup's per-hex river, crossing, waterfall and flow lookups."""
+        def marked(features: List[Dict], kind: str) -> bytearray:
+            hexes = bytearray(len(self.hex_ids))
+            for feature in features:
+                if feature.get('hexI') is None or feature.get('hexJ') is None:
+                    self.unresolved.append({'kind': kind, 'id': feature.get('id')})
+                    continue
+                for hex_id in self._feature_hexes(feature):
+                    index = self.hex_index.get(hex_id)
+                    if index is not None:
+                        hexes[index] = 1
+            return hexes
+
+        paths = rivers.get('paths', [])
+        points = [point for path in paths for point in path.get('points', [])]
+        river = marked(points, 'river point')
+        center = bytearray(len(self.hex_ids))
+        for point in points:
+            index = self.hex_index.get(f"{point.get('hexI')}.{point.get('hexJ')}")
+            if index is not None and point.get('isCenter'):
+                center[index] = 1
+        crossing = marked(rivers.get('crossings', []), 'crossing')
+        waterfall = marked(rivers.get('waterfalls', []), 'waterfall')
+
+        flow = set()
+        for path in paths:
+            ordered = sorted_points(path)
+            for a, b in zip(ordered, ordered[1:]):
+                flow.add((f"{a['hexI']}.{a['hexJ']}", f"{b['hexI']}.{b['hexJ']}"))
+
+        ids = self.hex_ids
+        for index, target in enumerate(self.neighbors):
+            if target < 0:
+                continue
+            source = index // SLOTS
+            both_river = river[source] and river[target]
+            upstream = (both_river and (ids[source], ids[target]) not in flow
+                        and (ids[target], ids[source]) in flow)
+            self.flags[index] = ((CROSSES_RIVER if center[source] or center[target] or both_river else 0)
+                                 | (HAS_CROSSING if crossing[source] or crossing[target] else 0)
+                                 | (HAS_WATERFALL if waterfall[source] or waterfall[target] else 0)
+                                 | (IS_UPSTREAM if upstream else 0))
+
+    @staticmethod
+    def _feature_hexes(feature: Dict) -> List[str]:
+        """The feature's hex, plus the hex across its edge for edge features."""
+        row, col = feature['hexI'], feature['hexJ']
+        hexes = [format_hex_id(row, col)]
+        if feature.get('edge') and not feature.get('isCenter'):
+            hexes.append(format_hex_id(*neighbor(row, col, feature['edge'])))
+        return hexes
+
+    def edge_costs(self, traits: Dict[str, bool]) -> array:
+        """MovementGraph.getEdgeCost() for every edge, INF where blocked or off the map."""
+        can_fly = traits.get('canFly', False)
+        can_swim = traits.get('canSwim', False)
+        has_boats = traits.get('hasBoats', False)
+        amphibious = traits.get('amphibious', False)
+        neighbors, flags, water, land_cost = self.neighbors, self.flags, self.water, self.land_cost
+
+        costs = array('d', [INF]) * len(neighbors)
+        for index, target in enumerate(neighbors):
+            if target < 0:
+                continue
+            if can_fly:
+                costs[index] = 1
+                continue
+            flag = flags[index]
+            if flag & CROSSES_RIVER and not flag & HAS_CROSSING and not can_swim and not has_boats:
+                continue
+            if flag & HAS_WATERFALL and has_boats and not can_swim:
+                continue
+            kind = water[target]
+            water_cost = (2 if kind == WATER_SWAMP else 1) + (1 if flag & IS_UPSTREAM else 0)
+            if kind != WATER_NONE:
+                if can_swim or has_boats:
+                    costs[index] = water_cost
+                    continue
+                if not amphibious:
+                    continue
+            if amphibious and (can_swim or has_boats):
+                costs[index] = min(land_cost[target], water_cost if kind != WATER_NONE else INF)
+            else:
+                costs[index] = land_cost[target]
+        return costs
+
+    def find_path(self, start: int, target: int, costs: array,
+                  max_movement: float) -> Tuple[Optional[float], List[int], int]:
+        """
+        A* with a binary heap; returns (cost or None, path, expanded hexes).
+
+        Every step costs at least 1, so the hex distance is a consistent
+        heuristic and a hex never needs to be expanded twice.
+        """
+        if start == target:
+            return 0, [start], 0
+        neighbors, q, r = self.neighbors, self.q, self.r
+        target_q, target_r = q[target], r[target]
+        best = {start: 0}
+        parent = {start: -1}
+        closed = set()
+        heap = [(0, 0, start)]
+
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node in closed:
+                continue
+            if node == target:
+                path = [node]
+                while parent[path[-1]] >= 0:
+                    path.append(parent[path[-1]])
+                return cost, path[::-1], len(closed)
+            closed.add(node)
+            base = node * SLOTS
+            for slot in range(SLOTS):
+                step = costs[base + slot]
+                if step == INF:
+                    continue
+                nxt = neighbors[base + slot]
+                tentative = cost + step
+                if tentative > max_movement or nxt in closed or tentative >= best.get(nxt, INF):
+                    continue
+                best[nxt] = tentative
+                parent[nxt] = node
+                d_q, d_r = q[nxt] - target_q, r[nxt] - target_r
+                heapq.heappush(heap, (tentative + (abs(d_q) + abs(d_r) + abs(d_q + d_r)) // 2, tentative, nxt))
+        return None, [], len(closed)
+
+    def sample_pairs(self, count: int, radius: int, rng: random.Random) -> List[Tuple[int, int]]:
+        """Random origins, each with a destination at most `radius` hexes away."""
+        pairs = []
+        while len(pairs) < count:
+            start = rng.randrange(len(self.hex_ids))
+            d_q = rng.randint(-radius, radius)
+            d_r = rng.randint(max(-radius, -d_q - radius), min(radius, -d_q + radius))
+            row, col = self._offset(self.q[start] + d_q, self.r[start] + d_r)
+            target = self.hex_index.get(format_hex_id(row, col))
+            if target is not None:
+                pairs.append((start, target))
+        return pairs
+
+
+def fixture_name(map_path: Path) -> str:
+    name = map_path.name
+    for suffix in ('.gz', '.json'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return f"pathfinding-{name}.jsonl"
+
+
+def open_output(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.gz':
+        return gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    return open(path, 'w', encoding='utf-8')
+
+
+def parse_traits(value: str) -> List[str]:
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in TRAIT_SETS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown trait set(s) {', '.join(unknown)}; "
+                                         f"choose from {', '.join(TRAIT_SETS)}")
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reference pathfinding oracle and fixture generator")
+    parser.add_argument('--map', type=Path, default=MAP_PATH, help="Map export (.json or .json.gz)")
+    parser.add_argument('--pairs', type=int, default=2000, help="Origin/destination pairs to solve")
+    parser.add_argument('--seed', type=int, default=1, help="Random seed for the pairs")
+    parser.add_argument('--max-movement', type=int, default=DEFAULT_MOVEMENT_RANGE,
+                        help="Movement budget (paths costing more are unreachable)")
+    parser.add_argument('--radius', type=int, help="Max hex distance between origin and destination "
+                                                   "(default: the movement budget)")
+    parser.add_argument('--model', choices=MODELS, default='runtime',
+                        help="runtime: MovementGraph's neighbors and per-hex river checks (default); "
+                             "edge: exact per-edge river resolution")
+    parser.add_argument('--traits', type=parse_traits, default=list(TRAIT_SETS),
+                        help=f"Comma-separated trait sets (default: {','.join(TRAIT_SETS)})")
+    parser.add_argument('--output', type=Path, help="Fixture path (.gz to compress; "
+                                                    "default: golden-vectors/pathfinding-<map>.jsonl)")
+    args = parser.parse_args()
+
+    if not args.map.exists():
+        print(f"❌ Map not found: {args.map}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    model = MovementModel(load_map(args.map), args.model)
+    print(f"📊 {len(model.hex_ids)} hexes loaded in {time.perf_counter() - started:.2f}s ({args.model} model)")
+    if model.unresolved and args.model == 'runtime':
+        print(f"⚠️  {len(model.unresolved)} river feature(s) without hexI/hexJ ignored, as WaterwayLookup does")
+    elif model.unresolved:
+        print(f"⚠️  {len(model.unresolved)} crossing(s)/waterfall(s) could not be placed on an edge")
+
+    pairs = model.sample_pairs(args.pairs, args.radius or args.max_movement, random.Random(args.seed))
+    results: List[Dict[str, Dict]] = [{} for _ in pairs]
+    ids = model.hex_ids
+
+    for name in args.traits:
+        costs = model.edge_costs(TRAIT_SETS[name])
+        started = time.perf_counter()
+        reachable = expanded = 0
+        for (start, target), result in zip(pairs, results):
+            cost, path, visited = model.find_path(start, target, costs, args.max_movement)
+            expanded += visited
+            if cost is None:
+                result[name] = {'isReachable': False, 'totalCost': None, 'path': []}
+                continue
+            reachable += 1
+            result[name] = {'isReachable': True, 'totalCost': int(cost), 'path': [ids[n] for n in path]}
+        elapsed = time.perf_counter() - started
+        print(f"  {name:11s} {reachable:6d}/{len(pairs)} reachable  "
+              f"{len(pairs) / elapsed if elapsed else 0:9.0f} paths/s  "
+              f"{expanded / max(len(pairs), 1):7.1f} hexes expanded/path")
+
+    output = args.output or OUTPUT_DIR / fixture_name(args.map)
+    with open_output(output) as out:
+        out.write(json.dumps({
+            'type': 'meta',
+            'map': args.map.name,
+            'model': args.model,
+            'hexes': len(ids),
+            'pairs': len(pairs),
+            'seed': args.seed,
+            'maxMovement': args.max_movement,
+            'traitSets': {name: TRAIT_SETS[name] for name in args.traits},
+            'neighborOrder': ({parity: [list(offset) for offset in offsets]
+                               for parity, offsets in ODD_Q_NEIGHBORS.items()}
+                              if args.model == 'runtime' else list(EDGE_DIRECTIONS)),
+        }) + "\n")
+        for (start, target), result in zip(pairs, results):
+            out.write(json.dumps({'type': 'query', 'from': ids[start], 'to': ids[target],
+                                  'results': result}, separators=(',', ':')) + "\n")
+
+    print(f"📁 Fixture written to: {output} ({len(pairs)} pairs x {len(args.traits)} trait sets)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Codemods for src/pipelines, registered with the codemod framework.
+
+Run them with:
+    python buildscripts/run-codemods.py list
+    python buildscripts/run-codemods.py run static-outcome-badges [--dry-run]
+
+Each transform returns span edits; see codemod.py for the runner contract.
+"""
+
+from typing import List
+
+from codemod import Edit, PipelineSource, register
+from ts_source import ObjectLiteral, line_indent
+
+OUTCOMES = ['criticalSuccess', 'success', 'failure', 'criticalFailure']
+
+# Badges for static outcomes objects that have none (was fix-static-outcome-badges.py)
+STATIC_OUTCOME_BADGES = {
+    'fortifyHex.ts': {
+        'criticalSuccess': "textBadge('Build or upgrade fortification', 'fa-fort-awesome', 'positive')",
+        'success': "textBadge('Build or upgrade fortification', 'fa-fort-awesome', 'positive')"
+    },
+    'arrestDissidents.ts': {
+        'criticalSuccess': "textBadge('Imprison dissidents and reduce unrest', 'fa-user-lock', 'positive')",
+        'success': "textBadge('Imprison dissidents', 'fa-user-lock', 'positive')"
+    },
+    'sendScouts.ts': {
+        'criticalSuccess': "textBadge('Explore 2 hexes', 'fa-binoculars', 'positive')",
+        'success': "textBadge('Explore 1 hex', 'fa-binoculars', 'positive')"
+    }
+}
+
+
+def outcome_objects(source: PipelineSource):
+    """Yield (outcome, ObjectLiteral) for each static outcome of the pipeline."""
+    outcomes = source.pipeline.get('outcomes') if source.pipeline is not None else None
+    if not isinstance(outcomes, ObjectLiteral):
+        return
+    for outcome in OUTCOMES:
+        node = outcomes.get(outcome)
+        if isinstance(node, ObjectLiteral):
+            yield outcome, node
+
+
+@register('static-outcome-badges', version=1, paths='src/pipelines/actions/*.ts')
+def static_outcome_badges(source: PipelineSource) -> List[Edit]:
+    """Add outcomeBadges to static action outcomes that have none."""
+    fixes = STATIC_OUTCOME_BADGES.get(source.path.name)
+    if not fixes:
+        return []
+
+    edits = []
+    for outcome, node in outcome_objects(source):
+        if outcome not in fixes or 'outcomeBadges' in node.keys() or not node.properties:
+            continue
+        last = node.properties[-1]
+        indent = line_indent(source.text, last.key_start)
+        edits.append((last.end, last.end,
+                      f",\n{indent}outcomeBadges: [\n{indent}  {fixes[outcome]}\n{indent}]"))
+    return edits
+
+
+@register('dedupe-outcome-keys', version=1, paths='src/pipelines/**/*.ts')
+def dedupe_outcome_keys(source: PipelineSource) -> List[Edit]:
+    """Remove shadowed duplicate keys in static outcomes (the last one wins at runtime)."""
+    edits = []
+    for _, node in outcome_objects(source):
+        seen = set()
+        properties = node.properties
+        # Walk backwards so the surviving (runtime) definition is the last one
+        for index in range(len(properties) - 1, -1, -1):
+            prop = properties[index]
+            if prop.key is None:
+                continue
+            if prop.key in seen and index + 1 < len(properties):
+                edits.append((prop.start, properties[index + 1].start, ''))
+            seen.add(prop.key)
+    return edits
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Columnar store for the planning tables in docs/planning/.
+
+Each CSV is parsed once into column lists (one list per header, raw cell
+strings) plus typed int arrays for the numeric columns (Skill Count,
+CS/S/F/CF Val). The blank-Name continuation rows of the event tables are
+resolved up front into `event` / `slug` / `approach` columns, so callers
+never track a "current event" themselves.
+
+Parsed tables are cached per process and on disk in .planning-cache/,
+keyed on the CSV's mtime and size - an edited table is re-parsed on the
+next load, an unchanged one is not.
+
+Use from other build scripts:
+
+    from planning_tables import load_table
+    table = load_table('balance')
+    row = table.lookup('criminal-trial', 'Virtuous')   # or '1. Criminal Trial'
+    table.get(row, 'Approach Descriptor')               # 'Show Mercy'
+    table.values('CS Val')                              # array('i', [7, 7, ...])
+    table.rows_for('crime-wave')                        # row indexes of one event
+
+    actions = load_table('actions')
+    actions.lookup('Arrest Dissidents')                 # tables without approaches
+
+Tables: actions, incidents, events (EVENT_SKILLS_TABLE), balance.
+
+Usage:
+    python buildscripts/planning_tables.py
+    python buildscripts/planning_tables.py balance criminal-trial Virtuous
+"""
+
+import csv
+import io
+import pickle
+import re
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PLANNING_DIR = PROJECT_ROOT / "docs" / "planning"
+CACHE_DIR = PROJECT_ROOT / ".planning-cache"
+CACHE_VERSION = 1
+
+TABLE_FILES = {
+    'actions': 'ActionSkillsTable.csv',
+    'incidents': 'IncidentSkillsTable.csv',
+    'events': 'EVENT_SKILLS_TABLE.csv',
+    'balance': 'EVENT_BALANCE_TABLE.csv',
+}
+
+INT_COLUMNS = ('Skill Count', 'CS Val', 'S Val', 'F Val', 'CF Val')
+
+APPROACHES = ('Virtuous', 'Practical', 'Ruthless')
+
+
+def event_slug(name: str) -> str:
+    """'28. Nature's Blessing' → 'natures-blessing' (the pipeline file stem)."""
+    name = name.split('.', 1)[-1].strip().lower() if re.match(r'^\d+\.', name) else name.strip().lower()
+    return re.sub(r'\s+', '-', name.replace("'", ''))
+
+
+def _int(value: str) -> Optional[int]:
+    value = value.strip()
+    if re.fullmatch(r'[+-]?\d+', value):
+        return int(value)
+    return None
+
+
+class PlanningTable:
+    """One planning CSV as columns, with (event, approach) lookup."""
+
+    def __init__(self, path: Path, header: List[str]):
+        self.path = path
+        self.header = header
+        self.columns: Dict[str, List[str]] = {name: [] for name in header}
+        # Typed numeric columns; blank[column][row] is 1 where the cell had no number
+        self.numbers: Dict[str, array] = {name: array('i') for name in INT_COLUMNS if name in header}
+        self.blank: Dict[str, bytearray] = {name: bytearray() for name in self.numbers}
+
+        # Resolved grouping columns
+        self.event: List[str] = []
+        self.slug: List[str] = []
+        self.approach: List[Optional[str]] = []
+
+        self.index: Dict[Tuple[str, Optional[str]], int] = {}
+        self._event_rows: Dict[str, List[int]] = {}
+
+    @classmethod
+    def parse(cls, path: Path) -> 'PlanningTable':
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        table = cls(path, rows[0])
+        for cells in rows[1:]:
+            if cells:
+                table.add_row(cells)
+        return table
+
+    @property
+    def relative_path(self) -> str:
+        return self.path.resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+
+    @property
+    def has_approaches(self) -> bool:
+        return 'Approach' in self.columns
+
+    def __len__(self) -> int:
+        return len(self.event)
+
+    def add_row(self, cells: List[str]) -> None:
+        cells = cells + [''] * (len(self.header) - len(cells))
+        for name, value in zip(self.header, cells):
+            self.columns[name].append(value)
+        for name, values in self.numbers.items():
+            number = _int(self.columns[name][-1])
+            values.append(number if number is not None else 0)
+            self.blank[name].append(number is None)
+
+        row = len(self.event)
+        name = self.columns['Name'][row].strip()
+        if not name and self.event:
+            name = self.event[-1]  # Continuation row of the previous event
+        approach = (self.columns['Approach'][row].strip() or None) if self.has_approaches else None
+
+        self.event.append(name)
+        self.slug.append(event_slug(name))
+        self.approach.append(approach)
+
+        for key in {name, self.slug[-1]}:
+            self.index.setdefault((key, approach), row)
+            self._event_rows.setdefault(key, []).append(row)
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def lookup(self, event: str, approach: Optional[str] = None) -> Optional[int]:
+        """Row index for an event (display name or file slug) and approach."""
+        return self.index.get((event, approach))
+
+    def rows_for(self, event: str) -> List[int]:
+        return self._event_rows.get(event, [])
+
+    def events(self) -> List[str]:
+        """Event display names in table order."""
+        return list(dict.fromkeys(self.event))
+
+    def get(self, row: int, column: str) -> str:
+        return self.columns[column][row]
+
+    def number(self, row: int, column: str) -> Optional[int]:
+        if self.blank[column][row]:
+            return None
+        return self.numbers[column][row]
+
+    def column(self, name: str) -> List[str]:
+        return self.columns[name]
+
+    def values(self, name: str) -> array:
+        return self.numbers[name]
+
+    def record(self, row: int) -> Dict[str, str]:
+        """The row as a DictReader-style dict (raw cell strings)."""
+        return {name: self.columns[name][row] for name in self.header}
+
+    def records(self) -> List[Dict[str, str]]:
+        return [self.record(row) for row in range(len(self))]
+
+    def to_csv(self, records: Optional[List[Dict[str, str]]] = None) -> str:
+        """Serialize records (default: the table's own) as the scripts write them."""
+        out = io.StringIO()
+        writer = csv.DictWriter(out, fieldnames=self.header)
+        writer.writeheader()
+        writer.writerows(records if records is not None else self.records())
+        return out.getvalue()
+
+
+# ----------------------------------------------------------------------
+# Loading and cache
+# ----------------------------------------------------------------------
+
+_loaded: Dict[Path, Tuple[Tuple[int, int], PlanningTable]] = {}
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cache_file(path: Path) -> Path:
+    return CACHE_DIR / f"{path.stem}.pickle"
+
+
+def _read_cache(path: Path, stamp: Tuple[int, int]) -> Optional[PlanningTable]:
+    cache_file = _cache_file(path)
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            version, source, cached_stamp, state = pickle.load(f)
+    except Exception:
+        return None
+    if version != CACHE_VERSION or source != str(path.resolve()) or cached_stamp != stamp:
+        return None
+    table = PlanningTable.__new__(PlanningTable)
+    table.__dict__.update(state)
+    return table
+
+
+def _write_cache(path: Path, stamp: Tuple[int, int], table: PlanningTable) -> None:
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        temp = _cache_file(path).with_suffix('.tmp')
+        with open(temp, 'wb') as f:
+            pickle.dump((CACHE_VERSION, str(path.resolve()), stamp, table.__dict__), f, pickle.HIGHEST_PROTOCOL)
+        temp.replace(_cache_file(path))
+    except OSError:
+        pass  # The cache is an optimization only
+
+
+def load_table(name: str, use_cache: bool = True) -> PlanningTable:
+    """Load a planning table by short name (see TABLE_FILES) or CSV path."""
+    path = Path(name) if name not in TABLE_FILES else PLANNING_DIR / TABLE_FILES[name]
+    path = path.resolve()
+    stamp = _stamp(path)
+
+    loaded = _loaded.get(path)
+    if loaded and loaded[0] == stamp:
+        return loaded[1]
+
+    table = _read_cache(path, stamp) if use_cache else None
+    if table is None:
+        table = PlanningTable.parse(path)
+        if use_cache:
+            _write_cache(path, stamp, table)
+    _loaded[path] = (stamp, table)
+    return table
+
+
+def write_table(table: PlanningTable, records: List[Dict[str, str]]) -> None:
+    """Write records back to the table's CSV (the next load re-parses it)."""
+    with open(table.path, 'w', encoding='utf-8', newline='') as f:
+        f.write(table.to_csv(records))
+    _loaded.pop(table.path, None)
+
+
+def load_all(use_cache: bool = True) -> Dict[str, PlanningTable]:
+    return {name: load_table(name, use_cache) for name in TABLE_FILES}
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        for name, table in load_all().items():
+            grouped = f", {len(table.events())} events" if table.has_approaches else ''
+            print(f"📊 {name:10s} {TABLE_FILES[name]:28s} {len(table):4d} rows{grouped}")
+        return
+
+    if args[0] not in TABLE_FILES or len(args) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    table = load_table(args[0])
+    row = table.lookup(args[1], args[2] if len(args) > 2 else None)
+    if row is None:
+        print(f"❌ No row for {' / '.join(args[1:])} in {TABLE_FILES[args[0]]}")
+        sys.exit(1)
+    for column, value in table.record(row).items():
+        print(f"  {column:24s} {value}")
+
+
+if __name__ == "__main__":
+    main()
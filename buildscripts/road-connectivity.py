@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Precompute road connectivity for a map export.
+
+Mirrors the traversal rules of src/services/RoadConnectivityService.ts:
+- Hexes with a road are traversable
+- Settlement hexes count as roads (you can chain through them)
+- Water terrain counts as an automatic road
+
+Traversable hexes are grouped into connected components with union-find.
+The output has a hex → component table and a settlement × settlement
+connectivity matrix, so "is this settlement connected to the capital" is a
+comparison of two component IDs instead of a BFS.
+
+Faction ownership is not part of the map export, so the matrix is purely
+topological; RoadConnectivityService still checks ownership at runtime.
+
+Output: src/data-compiled/road-connectivity.json
+
+Usage:
+    python buildscripts/road-connectivity.py [--map PATH] [--kingdom SAVE] [--output PATH]
+
+--kingdom adds settlements (and roads) from a kingdom save / starter kingdom.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from hex_grid import (
+    DATA_COMPILED_DIR,
+    MAP_PATH,
+    format_hex_id,
+    load_json,
+    neighbors,
+    parse_hex_id,
+    write_json,
+)
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+OUTPUT_FILE = DATA_COMPILED_DIR / "road-connectivity.json"
+
+
+class UnionFind:
+    """Disjoint-set forest with path halving and union by size."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, node: int) -> int:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+
+def collect_settlements(map_data: Dict, kingdom: Dict) -> List[Dict]:
+    """Settlements from the map export plus any from a kingdom save."""
+    settlements = [
+        {'hexId': s['hexId'], 'name': s.get('name', s['hexId'])}
+        for s in map_data.get('settlements', [])
+    ]
+    for s in kingdom.get('settlements', []):
+        location = s.get('location') or {}
+        if location.get('x', 0) == 0 and location.get('y', 0) == 0:
+            continue  # Unplaced settlement
+        settlements.append({
+            'hexId': format_hex_id(location['x'], location['y']),
+            'name': s.get('name', ''),
+        })
+    return settlements
+
+
+def compute_connectivity(map_data: Dict, kingdom: Dict) -> Dict:
+    """Group traversable hexes into road components."""
+    settlements = collect_settlements(map_data, kingdom)
+
+    traversable = set(map_data.get('roads', []))
+    traversable.update(t['id'] for t in map_data.get('terrain', []) if t.get('terrain') == 'water')
+    traversable.update(h['id'] for h in kingdom.get('hexes', [])
+                       if h.get('hasRoad') or h.get('terrain') == 'water')
+    traversable.update(s['hexId'] for s in settlements)
+
+    hex_ids = sorted(traversable, key=parse_hex_id)
+    index = {hex_id: i for i, hex_id in enumerate(hex_ids)}
+    forest = UnionFind(len(hex_ids))
+
+    for hex_id, i in index.items():
+        row, col = parse_hex_id(hex_id)
+        for _, (n_row, n_col) in neighbors(row, col):
+            j = index.get(format_hex_id(n_row, n_col))
+            if j is not None:
+                forest.union(i, j)
+
+    # Renumber roots densely in hex order so output is stable
+    component_ids: Dict[int, int] = {}
+    components: Dict[str, int] = {}
+    for hex_id, i in index.items():
+        root = forest.find(i)
+        components[hex_id] = component_ids.setdefault(root, len(component_ids))
+
+    component_sizes = [0] * len(component_ids)
+    for component in components.values():
+        component_sizes[component] += 1
+
+    settlement_components = [components[s['hexId']] for s in settlements]
+    matrix = [
+        [1 if a == b else 0 for b in settlement_components]
+        for a in settlement_components
+    ]
+
+    return {
+        'components': components,
+        'componentSizes': component_sizes,
+        'settlements': [
+            {**s, 'component': c} for s, c in zip(settlements, settlement_components)
+        ],
+        'connected': matrix,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute road connectivity for a map export")
+    parser.add_argument('--map', type=Path, default=MAP_PATH, help="Map export JSON")
+    parser.add_argument('--kingdom', type=Path, help="Kingdom save to take settlements from")
+    parser.add_argument('--output', type=Path, default=OUTPUT_FILE, help="Output JSON")
+    args = parser.parse_args()
+
+    print("🛣️  Computing road connectivity...")
+    print(f"   Map: {args.map}")
+
+    map_data = load_json(args.map)
+    kingdom = load_json(args.kingdom) if args.kingdom else {}
+
+    result = compute_connectivity(map_data, kingdom)
+    size = write_json(args.output, result, indent=None)
+
+    print(f"\n✅ {len(result['components'])} traversable hexes in "
+          f"{len(result['componentSizes'])} components")
+    if result['componentSizes']:
+        print(f"   Largest component: {max(result['componentSizes'])} hexes")
+    print(f"✅ {len(result['settlements'])} settlements in connectivity matrix")
+    print(f"📁 Output written to: {args.output} ({size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
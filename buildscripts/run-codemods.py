@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Run registered codemods over src/pipelines (see codemod.py).
+
+Usage:
+    python buildscripts/run-codemods.py list
+    python buildscripts/run-codemods.py run NAME [NAME ...] [--paths GLOB] [--workers N] [--dry-run]
+    python buildscripts/run-codemods.py rollback [--force]
+
+--paths overrides the codemods' own file patterns (relative to the project
+root, e.g. 'src/pipelines/actions/fortifyHex.ts'). Files already processed
+by a codemod at its current version are skipped via the ledger.
+"""
+
+import argparse
+import sys
+
+import codemod
+import pipeline_codemods  # noqa: F401 - registers the built-in codemods
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run pipeline codemods")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help="List registered codemods")
+
+    run_parser = commands.add_parser('run', help="Apply codemods")
+    run_parser.add_argument('names', nargs='+')
+    run_parser.add_argument('--paths', help="Glob overriding the codemods' file patterns")
+    run_parser.add_argument('--workers', type=int, default=0)
+    run_parser.add_argument('--dry-run', action='store_true')
+
+    rollback_parser = commands.add_parser('rollback', help="Undo the last run")
+    rollback_parser.add_argument('--force', action='store_true',
+                                 help="Also restore files edited since the run")
+
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for entry in codemod.CODEMODS.values():
+            print(f"  {entry.key:32s} {entry.paths:32s} {entry.description}")
+        return
+
+    if args.command == 'rollback':
+        result = codemod.rollback(args.force)
+        for path in result['restored']:
+            print(f"  ↩️  {path}")
+        for path in result['skipped']:
+            print(f"  ⚠️  {path} changed since the run - not restored (use --force)")
+        print(f"✅ Restored {len(result['restored'])} files")
+        return
+
+    unknown = [name for name in args.names if name not in codemod.CODEMODS]
+    if unknown:
+        print(f"❌ Unknown codemod(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    if args.dry_run:
+        print("🔍 DRY RUN MODE - No files will be modified\n")
+
+    selected = [codemod.CODEMODS[name] for name in args.names]
+    report = codemod.run(selected, args.paths, args.workers, args.dry_run)
+
+    for change in report['changed']:
+        print(f"  ✓ {change['path']} ({', '.join(change['codemods'])})")
+    for path, error in report['errors'].items():
+        print(f"  ❌ {path}: {error}")
+
+    print(f"\n📊 {len(report['changed'])} changed, {len(report['unchanged'])} unchanged, "
+          f"{len(report['skipped'])} skipped (ledger), {len(report['errors'])} errors")
+    if report['changed'] and not args.dry_run:
+        print("↩️  Undo with: python buildscripts/run-codemods.py rollback")
+    if report['errors']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Skill coverage across every event, action and incident pipeline.
+
+All pipeline files are parsed once (ts_source) into an incidence matrix:
+one row per (kind, pipeline, approach) check and one column per skill.
+Each skill column is stored as a bitmask over the rows, so
+
+- coverage      is a popcount of a column (optionally masked by kind/approach)
+- co-occurrence is a popcount of two columns AND-ed together (MᵀM)
+- archetypes    sum the coverage through SKILL_ARCHETYPES
+                (analyze-event-skills.py)
+
+Approaches are the doctrines: event strategic-choice options are keyed by
+their option id, action skills by their `doctrine` field. Skills without
+one (incidents, undoctrined action skills, events without options) fall
+under 'any'. 'applicable lore' counts as 'lore', as in
+analyze-event-skills.py.
+
+Use from other build scripts:
+
+    from skill_coverage import SkillMatrix
+    matrix = SkillMatrix.load()
+    matrix.coverage(kind='incident')         # {'diplomacy': 12, ...}
+    matrix.coverage(approach='ruthless')
+    matrix.cooccurrence()['diplomacy']['society']
+    matrix.pipelines_using('arcana')
+
+Usage:
+    python buildscripts/skill_coverage.py [--format text|json|csv] [--output PATH]
+    python buildscripts/skill_coverage.py --format csv --matrix cooccurrence
+"""
+
+import argparse
+import csv
+import importlib.util
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ts_source import ArrayLiteral, ObjectLiteral, ParseError, parse_source
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PIPELINES_DIR = PROJECT_ROOT / "src" / "pipelines"
+
+KINDS = {'events': 'event', 'actions': 'action', 'incidents': 'incident'}
+APPROACHES = ['idealist', 'practical', 'ruthless', 'any']
+
+# PF2e core skills, in the order analyze-event-skills.py reports them
+CORE_SKILLS = [
+    'acrobatics', 'arcana', 'athletics', 'crafting', 'deception',
+    'diplomacy', 'intimidation', 'lore', 'medicine', 'nature',
+    'occultism', 'performance', 'religion', 'society', 'stealth',
+    'survival', 'thievery'
+]
+
+
+def _load_archetypes() -> Dict[str, str]:
+    spec = importlib.util.spec_from_file_location(
+        'analyze_event_skills', Path(__file__).parent / 'analyze-event-skills.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SKILL_ARCHETYPES
+
+
+SKILL_ARCHETYPES = _load_archetypes()
+
+
+def normalize_skill(name: str) -> str:
+    name = name.strip().lower()
+    return 'lore' if 'lore' in name else name
+
+
+def _string_list(node) -> List[str]:
+    if not isinstance(node, ArrayLiteral):
+        return []
+    return [value for value in (e.string_value() for e in node.elements) if value is not None]
+
+
+def pipeline_checks(pipeline: ObjectLiteral) -> Dict[str, List[str]]:
+    """Skills of one pipeline grouped by approach."""
+    checks: Dict[str, List[str]] = {}
+
+    options = pipeline.get_path('strategicChoice.options')
+    if isinstance(options, ArrayLiteral) and options.elements:
+        for option in options.elements:
+            if not isinstance(option, ObjectLiteral):
+                continue
+            option_id = option.get('id')
+            approach = option_id.string_value() if option_id is not None else None
+            checks.setdefault(approach or 'any', []).extend(_string_list(option.get('skills')))
+        return checks
+
+    skills = pipeline.get('skills')
+    if isinstance(skills, ArrayLiteral):
+        for entry in skills.elements:
+            if not isinstance(entry, ObjectLiteral) or entry.get('skill') is None:
+                continue
+            name = entry.get('skill').string_value()
+            doctrine = entry.get('doctrine')
+            approach = doctrine.string_value() if doctrine is not None else None
+            if name is not None:
+                checks.setdefault(approach or 'any', []).append(name)
+    return checks
+
+
+class SkillMatrix:
+    """Incidence matrix of (kind, pipeline, approach) rows × skill columns."""
+
+    def __init__(self):
+        # Row columns
+        self.kind: List[str] = []
+        self.pipeline: List[str] = []
+        self.approach: List[str] = []
+        self.file: List[str] = []
+
+        # Skill columns, and the row groups, as bitmasks over the rows
+        self.columns: Dict[str, int] = {}
+        self.kind_masks: Dict[str, int] = {}
+        self.approach_masks: Dict[str, int] = {}
+        self.errors: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, pipelines_dir: Path = PIPELINES_DIR) -> 'SkillMatrix':
+        matrix = cls()
+        for path in sorted(pipelines_dir.rglob('*.ts')):
+            kind = KINDS.get(path.relative_to(pipelines_dir).parts[0])
+            if kind is None:
+                continue
+            relative = path.relative_to(PROJECT_ROOT).as_posix()
+            try:
+                pipeline = parse_source(path.read_text(encoding='utf-8')).exported_object()
+            except ParseError as e:
+                matrix.errors[relative] = str(e)
+                continue
+            if pipeline is None:
+                continue
+            pipeline_id = pipeline.get('id')
+            name = pipeline_id.string_value() if pipeline_id is not None else None
+            for approach, skills in pipeline_checks(pipeline).items():
+                matrix.add_row(kind, name or path.stem, approach, relative, skills)
+        return matrix
+
+    def add_row(self, kind: str, pipeline: str, approach: str, file: str, skills: List[str]) -> None:
+        bit = 1 << len(self.kind)
+        self.kind.append(kind)
+        self.pipeline.append(pipeline)
+        self.approach.append(approach)
+        self.file.append(file)
+        self.kind_masks[kind] = self.kind_masks.get(kind, 0) | bit
+        self.approach_masks[approach] = self.approach_masks.get(approach, 0) | bit
+        for skill in skills:
+            skill = normalize_skill(skill)
+            self.columns[skill] = self.columns.get(skill, 0) | bit
+
+    # ------------------------------------------------------------------
+    # Masks
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    @property
+    def skills(self) -> List[str]:
+        """Core skills first (in report order), then anything else found."""
+        return CORE_SKILLS + sorted(set(self.columns) - set(CORE_SKILLS))
+
+    def mask(self, kind: Optional[str] = None, approach: Optional[str] = None) -> int:
+        """Bitmask of the rows matching a kind and/or approach."""
+        mask = (1 << len(self)) - 1
+        if kind is not None:
+            mask &= self.kind_masks.get(kind, 0)
+        if approach is not None:
+            mask &= self.approach_masks.get(approach, 0)
+        return mask
+
+    def column(self, skill: str) -> int:
+        return self.columns.get(skill, 0)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def coverage(self, kind: Optional[str] = None, approach: Optional[str] = None) -> Dict[str, int]:
+        """Rows offering each skill (column sums of the masked matrix)."""
+        mask = self.mask(kind, approach)
+        return {skill: bin(self.column(skill) & mask).count('1') for skill in self.skills}
+
+    def coverage_by(self, kind: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Coverage per approach: {approach: {skill: rows}}."""
+        return {approach: self.coverage(kind, approach) for approach in APPROACHES}
+
+    def cooccurrence(self, kind: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Rows offering both skills (MᵀM); the diagonal is the coverage."""
+        mask = self.mask(kind)
+        columns = {skill: self.column(skill) & mask for skill in self.skills}
+        return {a: {b: bin(columns[a] & columns[b]).count('1') for b in self.skills}
+                for a in self.skills}
+
+    def archetype_balance(self, kind: Optional[str] = None) -> Dict[str, int]:
+        """Coverage summed per SKILL_ARCHETYPES archetype."""
+        totals: Dict[str, int] = {}
+        for skill, count in self.coverage(kind).items():
+            archetype = SKILL_ARCHETYPES.get(skill, 'Unknown')
+            totals[archetype] = totals.get(archetype, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def pipelines_using(self, skill: str) -> List[Tuple[str, str, str]]:
+        """(kind, pipeline, approach) for every row offering a skill."""
+        column = self.column(skill)
+        return [(self.kind[row], self.pipeline[row], self.approach[row])
+                for row in range(len(self)) if column >> row & 1]
+
+    def gaps(self) -> Dict[str, List[str]]:
+        """Core skills missing per kind and per approach."""
+        gaps = {}
+        for kind in KINDS.values():
+            for approach in APPROACHES:
+                if not self.mask(kind, approach):
+                    continue
+                missing = [s for s, count in self.coverage(kind, approach).items()
+                           if count == 0 and s in CORE_SKILLS]
+                if missing:
+                    gaps[f"{kind}/{approach}"] = missing
+        return gaps
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def incidence_rows(self) -> List[List[object]]:
+        rows = [['Kind', 'Pipeline', 'Approach', 'File'] + self.skills]
+        for row in range(len(self)):
+            rows.append([self.kind[row], self.pipeline[row], self.approach[row], self.file[row]]
+                        + [self.column(skill) >> row & 1 for skill in self.skills])
+        return rows
+
+    def cooccurrence_rows(self) -> List[List[object]]:
+        matrix = self.cooccurrence()
+        return [['Skill'] + self.skills] + [[a] + [matrix[a][b] for b in self.skills] for a in self.skills]
+
+    def summary(self) -> Dict:
+        return {
+            'rows': len(self),
+            'pipelines': {kind: len({p for k, p in zip(self.kind, self.pipeline) if k == kind})
+                          for kind in KINDS.values()},
+            'coverage': {kind: self.coverage_by(kind) for kind in KINDS.values()},
+            'total': self.coverage(),
+            'archetypes': self.archetype_balance(),
+            'cooccurrence': self.cooccurrence(),
+            'gaps': self.gaps(),
+            'errors': self.errors,
+        }
+
+
+def to_csv(rows: List[List[object]]) -> str:
+    out = io.StringIO()
+    csv.writer(out, lineterminator='\n').writerows(rows)
+    return out.getvalue().rstrip('\n')
+
+
+def text_report(matrix: SkillMatrix) -> str:
+    skills = [s for s in matrix.skills if matrix.column(s)] + \
+             [s for s in CORE_SKILLS if not matrix.column(s)]
+    total = matrix.coverage()
+    lines = ["=" * 80, "SKILL COVERAGE (rows offering each skill)", "=" * 80]
+
+    header = f"{'skill':14s}" + ''.join(f"{kind[:6]:>8s}" for kind in KINDS.values())
+    header += ''.join(f"{approach[:6]:>8s}" for approach in APPROACHES) + f"{'total':>8s}  archetype"
+    lines.append(header)
+    by_kind = {kind: matrix.coverage(kind) for kind in KINDS.values()}
+    by_approach = matrix.coverage_by()
+    for skill in skills:
+        line = f"{skill:14s}" + ''.join(f"{by_kind[kind][skill]:8d}" for kind in KINDS.values())
+        line += ''.join(f"{by_approach[approach][skill]:8d}" for approach in APPROACHES)
+        line += f"{total[skill]:8d}  {SKILL_ARCHETYPES.get(skill, 'Unknown')}"
+        lines.append(line)
+
+    lines += ["", "📊 ARCHETYPE BALANCE:"]
+    archetypes = matrix.archetype_balance()
+    average = sum(archetypes.values()) / len(archetypes) if archetypes else 0
+    for archetype, count in archetypes.items():
+        status = "✓" if abs(count - average) < average * 0.3 else "⚠️ "
+        lines.append(f"  {status} {archetype:25s} {count:4d} ({count - average:+.0f} from average)")
+
+    lines += ["", "🔗 MOST FREQUENT PAIRS:"]
+    matrix_pairs = matrix.cooccurrence()
+    pairs = sorted(((matrix_pairs[a][b], a, b) for i, a in enumerate(matrix.skills)
+                    for b in matrix.skills[i + 1:] if matrix_pairs[a][b]), reverse=True)
+    for count, a, b in pairs[:10]:
+        lines.append(f"  {a} + {b}: {count}")
+
+    gaps = matrix.gaps()
+    if gaps:
+        lines += ["", "⚠️  CORE SKILLS NEVER OFFERED:"]
+        for group, missing in gaps.items():
+            lines.append(f"  {group:22s} {', '.join(missing)}")
+
+    for file, error in matrix.errors.items():
+        lines.append(f"❌ {file}: {error}")
+
+    counts = matrix.summary()['pipelines']
+    lines.append(f"\n📊 {len(matrix)} checks across {counts['event']} events, "
+                 f"{counts['action']} actions, {counts['incident']} incidents")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill coverage across pipelines")
+    parser.add_argument('--format', choices=['text', 'json', 'csv'], default='text')
+    parser.add_argument('--matrix', choices=['incidence', 'cooccurrence'], default='incidence',
+                        help="Matrix written by --format csv")
+    parser.add_argument('--output', type=Path, help="Write the report here instead of stdout")
+    args = parser.parse_args()
+
+    matrix = SkillMatrix.load()
+
+    if args.format == 'text':
+        report = text_report(matrix)
+    elif args.format == 'json':
+        report = json.dumps(matrix.summary(), indent=2)
+    else:
+        report = to_csv(matrix.incidence_rows() if args.matrix == 'incidence' else matrix.cooccurrence_rows())
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            f.write(report + "\n")
+        print(f"📁 Report written to: {args.output}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
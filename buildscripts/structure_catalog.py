@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Columnar catalog of the structure families in data/structures/.
+
+Loads every skill-*.json / support-*.json family once and flattens it into
+two column tables:
+
+- tiers:   one row per structure tier (id, name, family, category, type,
+           tier number, cost per resource, source file)
+- effects: one row per effect on a tier (gameEffects, modifiers), with
+           effect type, key (skill / rule / resource / unlocked action)
+           and numeric value where there is one
+
+Queries are mask filters over the columns, so questions like "cheapest
+tier granting +2 diplomacy" or "total lumber to tier 3 in commerce" don't
+re-walk the nested JSON.
+
+Use from other build scripts:
+
+    from structure_catalog import StructureCatalog
+    catalog = StructureCatalog.load()
+    row = catalog.cheapest('settlementSkillBonus', 'diplomacy', min_value=2)
+    catalog.tier_record(row)             # original tier dict
+    catalog.cost_to_tier('commerce', 3, 'lumber')
+
+Usage:
+    python buildscripts/structure_catalog.py
+    python buildscripts/structure_catalog.py --cheapest-skill diplomacy 2
+    python buildscripts/structure_catalog.py --cost-to commerce 3 [lumber]
+    python buildscripts/structure_catalog.py --self-test    # family lookup regression check
+"""
+
+import json
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+STRUCTURES_DIR = Path(__file__).parent.parent / "data" / "structures"
+
+COST_RESOURCES = ('food', 'lumber', 'stone', 'ore', 'gold')
+
+# Key field used for each effect type
+EFFECT_KEYS = {
+    'settlementSkillBonus': 'skill',
+    'ruleMod': 'rule',
+    'modifier': 'resource',
+    'unlock': 'actions',
+}
+
+
+def derive_category_from_family(family: str) -> str:
+    """Convert family name to kebab-case category (same rule as combine-structures.py)."""
+    category = family.lower()
+    category = category.replace(' & ', '-')
+    category = category.replace(' ', '-')
+    return category
+
+
+def _numeric(value) -> Optional[float]:
+    """Numeric form of an effect value (booleans become 0/1), else None."""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _iter_effects(tier: Dict) -> Iterator[Tuple[str, str, object]]:
+    """Yield (effect type, key, raw value) for every effect on a tier."""
+    for effect in tier.get('gameEffects', []):
+        effect_type = effect.get('type', '')
+        key_field = EFFECT_KEYS.get(effect_type)
+        key = effect.get(key_field, '') if key_field else ''
+        if isinstance(key, list):
+            for item in key:
+                yield effect_type, item, effect.get('value')
+        else:
+            yield effect_type, key, effect.get('value')
+    for modifier in tier.get('modifiers', []):
+        yield 'modifier', modifier.get('resource', ''), modifier.get('value')
+
+
+class StructureCatalog:
+    """Column tables over all structure tiers and their effects."""
+
+    def __init__(self):
+        # Tier columns
+        self.tier_id: List[str] = []
+        self.name: List[str] = []
+        self.family: List[str] = []
+        self.category: List[str] = []
+        self.type: List[str] = []
+        self.tier = array('i')
+        self.cost: Dict[str, array] = {r: array('i') for r in COST_RESOURCES}
+        self.total_cost = array('i')
+        self.file: List[Path] = []
+
+        # Effect columns (effect_tier indexes into the tier columns)
+        self.effect_tier = array('i')
+        self.effect_type: List[str] = []
+        self.effect_key: List[str] = []
+        self.effect_value: List[Optional[float]] = []
+
+        self.families: Dict[Path, Dict] = {}
+        self._records: List[Dict] = []
+
+    @classmethod
+    def load(cls, structures_dir: Path = STRUCTURES_DIR) -> 'StructureCatalog':
+        """Load every family file in the directory."""
+        catalog = cls()
+        for path in sorted(structures_dir.glob("*.json")):
+            if path.name in ("structures.json", "all_structures.json"):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                catalog.add_family(path, json.load(f))
+        return catalog
+
+    def add_family(self, path: Path, data: Dict) -> None:
+        """Append one family's tiers and effects to the columns."""
+        self.families[path] = data
+        family = data.get('family', path.stem)
+        category = derive_category_from_family(family)
+        for number, tier in enumerate(data.get('tiers', []), start=1):
+            row = len(self.tier_id)
+            cost = tier.get('cost', {})
+            self.tier_id.append(tier.get('id', ''))
+            self.name.append(tier.get('name', ''))
+            self.family.append(family)
+            self.category.append(category)
+            self.type.append(data.get('type', ''))
+            self.tier.append(number)
+            for resource in COST_RESOURCES:
+                self.cost[resource].append(int(cost.get(resource, 0)))
+            self.total_cost.append(sum(int(v) for v in cost.values()))
+            self.file.append(path)
+            self._records.append(tier)
+
+            for effect_type, key, value in _iter_effects(tier):
+                self.effect_tier.append(row)
+                self.effect_type.append(effect_type)
+                self.effect_key.append(str(key).lower())
+                self.effect_value.append(_numeric(value))
+
+    def __len__(self) -> int:
+        return len(self.tier_id)
+
+    def tier_record(self, row: int) -> Dict:
+        """The original tier dict for a row (mutations are visible in families)."""
+        return self._records[row]
+
+    def iter_tiers(self) -> Iterator[Tuple[Path, Dict, Dict]]:
+        """Yield (file, family data, tier dict) for migration-style scripts."""
+        for path, data in self.families.items():
+            for tier in data.get('tiers', []):
+                yield path, data, tier
+
+    def save_family(self, path: Path) -> None:
+        """Write a (possibly modified) family back in the repo's JSON format."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.families[path], f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    # ------------------------------------------------------------------
+    # Filters
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _mask(column: Sequence, predicate: Callable) -> List[bool]:
+        return [predicate(value) for value in column]
+
+    def match_family(self, family: str) -> List[bool]:
+        """
+        Mask of tiers in a family, matched exactly by name, category, file
+        stem, or file stem without its type prefix ('culture' is
+        support-culture.json, not skill-performance-culture.json).
+        """
+        needle = family.lower()
+        return [
+            needle in (fam.lower(), cat, path.stem, path.stem.split('-', 1)[-1])
+            for fam, cat, path in zip(self.family, self.category, self.file)
+        ]
+
+    def effect_rows(self, effect_type: str, key: Optional[str] = None,
+                    min_value: Optional[float] = None) -> List[int]:
+        """Indices of effect rows matching type, key and minimum value."""
+        key = key.lower() if key else None
+        mask = [
+            t == effect_type
+            and (key is None or k == key)
+            and (min_value is None or (v is not None and v >= min_value))
+            for t, k, v in zip(self.effect_type, self.effect_key, self.effect_value)
+        ]
+        return [i for i, hit in enumerate(mask) if hit]
+
+    def tiers_with(self, effect_type: str, key: Optional[str] = None,
+                   min_value: Optional[float] = None) -> List[int]:
+        """Tier rows that carry a matching effect (sorted, unique)."""
+        return sorted({self.effect_tier[i] for i in self.effect_rows(effect_type, key, min_value)})
+
+    def cheapest(self, effect_type: str, key: Optional[str] = None,
+                 min_value: Optional[float] = None,
+                 resource: Optional[str] = None) -> Optional[int]:
+        """
+        Cheapest tier row granting a matching effect.
+
+        Cost is the total over all resources unless a resource is given.
+        Ties break on tier number, then tier id.
+        """
+        rows = self.tiers_with(effect_type, key, min_value)
+        if not rows:
+            return None
+        cost = self.cost[resource] if resource else self.total_cost
+        return min(rows, key=lambda r: (cost[r], self.tier[r], self.tier_id[r]))
+
+    def cost_to_tier(self, family: str, tier: int, resource: Optional[str] = None) -> int:
+        """Total cost of building a family from tier 1 up to and including tier."""
+        cost = self.cost[resource] if resource else self.total_cost
+        in_family = self.match_family(family)
+        return sum(
+            c for c, hit, t in zip(cost, in_family, self.tier)
+            if hit and t <= tier
+        )
+
+
+def self_test(catalog: StructureCatalog) -> List[str]:
+    """Every family name, category and file stem selects exactly its own file."""
+    failures = []
+    for path, data in catalog.families.items():
+        family = data.get('family', path.stem)
+        for needle in (family, derive_category_from_family(family), path.stem, path.stem.split('-', 1)[-1]):
+            files = {f for f, hit in zip(catalog.file, catalog.match_family(needle)) if hit}
+            if files != {path}:
+                failures.append(f"'{needle}' matches {sorted(f.name for f in files)}, expected {path.name}")
+    return failures
+
+
+def main():
+    catalog = StructureCatalog.load()
+    args = sys.argv[1:]
+
+    if args[:1] == ['--self-test']:
+        failures = self_test(catalog)
+        for failure in failures:
+            print(f"❌ {failure}")
+        if failures:
+            sys.exit(1)
+        print(f"✅ Family lookups are unambiguous across {len(catalog.families)} families")
+        return
+
+    if args[:1] == ['--cheapest-skill'] and len(args) >= 3:
+        skill, value = args[1], float(args[2])
+        row = catalog.cheapest('settlementSkillBonus', skill, min_value=value)
+        if row is None:
+            print(f"❌ No structure grants +{value:g} {skill}")
+            sys.exit(1)
+        cost = {r: catalog.cost[r][row] for r in COST_RESOURCES if catalog.cost[r][row]}
+        print(f"🏛️  {catalog.name[row]} ({catalog.family[row]} tier {catalog.tier[row]}): {cost}")
+        return
+
+    if args[:1] == ['--cost-to'] and len(args) >= 3:
+        family, tier = args[1], int(args[2])
+        resource = args[3] if len(args) > 3 else None
+        total = catalog.cost_to_tier(family, tier, resource)
+        print(f"🏛️  {family} to tier {tier}: {total} {resource or 'resources (total)'}")
+        return
+
+    print(f"🏛️  Structure catalog: {len(catalog.families)} families, "
+          f"{len(catalog)} tiers, {len(catalog.effect_type)} effects")
+    for resource in COST_RESOURCES:
+        total = sum(catalog.cost[resource])
+        if total:
+            print(f"   {resource}: {total} across all tiers")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,192 +6,296 @@ This script updates:
 1. Approach labels (from "Approach Descriptor" column)
 2. OutcomeBadges arrays (from outcome columns)
 
-All events use standard IDs: virtuous, practical, ruthless
+Each event file is parsed once with ts_source, which gives exact spans for
+strategicChoice.options[*].label and .outcomeBadges.<outcome>. All changes
+are collected as non-overlapping span replacements, applied in one pass,
+re-parsed to verify the result, and written with a single write. Arrays
+that already match the table are left untouched.
+
+Only table-generated badges are synced:
+- an array that holds anything other than textBadge / valueBadge /
+  diceBadge calls (hand-written helpers such as genericGrantStructure(1))
+  is kept as it is and reported
+- every generated badge must be one of those helpers called with literal
+  arguments; any other table entry is refused and reported, and its
+  array is not written
+
+The Virtuous approach is matched by id 'virtuous'. Options that use the
+newer id 'idealist' are only synced with --match-idealist.
+
+Every label and array that changes is listed (with --dry-run, the ones
+that would change).
+
+Usage:
+    cd buildscripts
+    python3 sync-balance-table.py [--dry-run] [--match-idealist]
 """
 
 import json
-import re
 import os
-from typing import Dict, List
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from ts_source import (
+    IDENT,
+    ArrayLiteral,
+    ObjectLiteral,
+    apply_edits,
+    line_indent,
+    literal_call,
+    parse_source,
+    quote,
+    verify_parses,
+)
+
+# Set UTF-8 encoding for stdout to handle Unicode characters
+if sys.stdout.encoding != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+APPROACH_IDS = {
+    'Virtuous': ('virtuous',),
+    'Practical': ('practical',),
+    'Ruthless': ('ruthless',),
+}
+IDEALIST_ID = 'idealist'
+
+OUTCOMES = ['criticalSuccess', 'success', 'failure', 'criticalFailure']
+
+# Helpers the balance table generates; any other call in an array is hand-written
+BADGE_HELPERS = {'textBadge', 'valueBadge', 'diceBadge'}
+
 
 def format_badge_array(badges: List[str], indent: int = 10) -> str:
-    """Format a badge array with proper indentation."""
+    """Format a badge array with proper indentation (no trailing comma)."""
     if not badges:
         return "[]"
-    
+
     indent_str = " " * indent
+    last_badge = max((i for i, b in enumerate(badges) if not b.startswith("//")), default=-1)
     lines = ["["]
-    for badge in badges:
-        if badge.startswith("//"):
+    for i, badge in enumerate(badges):
+        if badge.startswith("//") or i == last_badge:
             lines.append(f"{indent_str}  {badge}")
         else:
             lines.append(f"{indent_str}  {badge},")
     lines.append(f"{indent_str}]")
     return "\n".join(lines)
 
-def update_approach_label(content: str, approach_id: str, new_label: str) -> tuple[str, bool]:
-    """Update the label for a specific approach."""
-    # Pattern to find: id: 'virtuous', label: '...',
-    pattern = rf"(id: '{approach_id}',\s*label: ')[^']*(')"
-    match = re.search(pattern, content)
-    
-    if match:
-        old_text = match.group(0)
-        new_text = f"id: '{approach_id}',\n        label: '{new_label}',"
-        content = content.replace(old_text, new_text, 1)
-        return content, True
-    return content, False
-
-def update_outcome_badges(content: str, approach_id: str, outcome: str, badges: List[str]) -> tuple[str, bool]:
-    """Update outcome badges for a specific approach and outcome."""
-    # Find the approach section
-    approach_pattern = rf"id: '{approach_id}'[\s\S]*?outcomeBadges: \{{"
-    approach_match = re.search(approach_pattern, content)
-    
-    if not approach_match:
-        return content, False
-    
-    approach_start = approach_match.start()
-    
-    # Find end of this approach (next approach or end of options array)
-    next_pattern = r"(\},\s*\{[\s\n]*id: '(?:virtuous|practical|ruthless)'|\}[\s\n]*\][\s\n]*\})"
-    next_match = re.search(next_pattern, content[approach_start + 100:])
-    
-    if next_match:
-        approach_end = approach_start + 100 + next_match.start()
-    else:
-        approach_end = len(content)
-    
-    approach_section = content[approach_start:approach_end]
-    
-    # Find the specific outcome within this approach
-    outcome_pattern = rf"{outcome}:\s*\[[\s\S]*?\](?=,?\s*(?:success:|failure:|criticalFailure:|\}}))"
-    outcome_match = re.search(outcome_pattern, approach_section)
-    
-    if not outcome_match:
-        return content, False
-    
-    old_outcome = outcome_match.group(0)
-    new_badges = format_badge_array(badges, indent=10)
-    
-    # Preserve comma
-    has_comma = ',' in old_outcome.split(']')[1] if ']' in old_outcome else False
-    new_outcome = f"{outcome}: {new_badges}" + ("," if has_comma else "")
-    
-    new_approach_section = approach_section.replace(old_outcome, new_outcome, 1)
-    content = content[:approach_start] + new_approach_section + content[approach_end:]
-    
-    return content, True
-
-def sync_event_file(event_name: str, event_data: Dict, base_path: str) -> Dict:
-    """Sync a single event file with balance table data."""
-    file_path = os.path.join(base_path, f"src/pipelines/events/{event_data['file']}.ts")
-    
+
+def normalize(code: str) -> str:
+    """Whitespace- and trailing-comma-insensitive form for comparing arrays."""
+    return re.sub(r',\]', ']', re.sub(r'\s+', '', code))
+
+
+def find_option(options: ArrayLiteral, ids: Tuple[str, ...]) -> Optional[ObjectLiteral]:
+    """The strategicChoice option with one of the given ids."""
+    for option in options.elements:
+        if not isinstance(option, ObjectLiteral):
+            continue
+        option_id = option.get('id')
+        if option_id is not None and option_id.string_value() in ids:
+            return option
+    return None
+
+
+def is_table_badge(element) -> bool:
+    """True for a textBadge / valueBadge / diceBadge call in an existing array."""
+    tokens = element.tokens
+    return (len(tokens) > 1 and tokens[0].kind == IDENT and tokens[0].value in BADGE_HELPERS
+            and tokens[1].value == '(')
+
+
+def refused_badges(badges: List[str]) -> List[str]:
+    """Generated badges that are not a known helper called with literal arguments."""
+    refused = []
+    for badge in badges:
+        if badge.startswith('//'):
+            continue
+        call = literal_call(badge)
+        if call is None or call[0] not in BADGE_HELPERS:
+            refused.append(badge)
+    return refused
+
+
+def plan_event_edits(content: str, event_data: Dict,
+                     match_idealist: bool = False) -> Tuple[List[Tuple[int, int, str]], Dict]:
+    """Collect label and badge edits for one event file."""
     result = {
         'labels_updated': 0,
         'badges_updated': 0,
+        'changes': [],
+        'kept': [],
+        'notes': [],
         'errors': []
     }
-    
-    if not os.path.exists(file_path):
-        result['errors'].append(f"File not found: {file_path}")
-        return result
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    if 'strategicChoice:' not in content:
+    edits: List[Tuple[int, int, str]] = []
+
+    pipeline = parse_source(content).exported_object()
+    options = pipeline.get_path('strategicChoice.options') if pipeline is not None else None
+    if not isinstance(options, ArrayLiteral):
         result['errors'].append("No strategicChoice found")
-        return result
-    
-    original_content = content
-    
-    # Update each approach
+        return edits, result
+
     for approach_type in ['Virtuous', 'Practical', 'Ruthless']:
         if approach_type not in event_data['approaches']:
             continue
-        
+
         approach = event_data['approaches'][approach_type]
-        approach_id = approach_type.lower()
-        
+        ids = APPROACH_IDS[approach_type]
+        if approach_type == 'Virtuous' and match_idealist:
+            ids = ids + (IDEALIST_ID,)
+        option = find_option(options, ids)
+        if option is None:
+            if approach_type == 'Virtuous' and find_option(options, (IDEALIST_ID,)) is not None:
+                result['notes'].append(f"Virtuous option has id '{IDEALIST_ID}' - skipped "
+                                       f"(use --match-idealist to sync it)")
+            else:
+                result['errors'].append(f"No option with id {' / '.join(ids)}")
+            continue
+
         # Update label
-        new_label = approach['name']
-        content, updated = update_approach_label(content, approach_id, new_label)
-        if updated:
+        label = option.get('label')
+        if label is not None and label.string_value() != approach['name']:
+            edits.append((label.start, label.end, quote(approach['name'])))
             result['labels_updated'] += 1
-        
+            result['changes'].append(f"{approach_type}.label")
+
         # Update outcome badges
-        for outcome in ['criticalSuccess', 'success', 'failure', 'criticalFailure']:
-            outcome_data = approach[outcome]
-            badges = outcome_data['badges']
-            
-            content, updated = update_outcome_badges(content, approach_id, outcome, badges)
-            if updated:
-                result['badges_updated'] += 1
-    
-    # Write back if changes were made
-    if content != original_content:
-        with open(file_path, 'w') as f:
-            f.write(content)
-    
+        outcome_badges = option.get('outcomeBadges')
+        if not isinstance(outcome_badges, ObjectLiteral):
+            result['errors'].append(f"{approach_type}: no outcomeBadges object")
+            continue
+
+        for outcome in OUTCOMES:
+            current = outcome_badges.get(outcome)
+            if not isinstance(current, ArrayLiteral):
+                result['errors'].append(f"{approach_type}: no outcomeBadges.{outcome} array")
+                continue
+
+            key_indent = len(line_indent(content, outcome_badges.get_property(outcome).key_start))
+            new_badges = format_badge_array(approach[outcome]['badges'], indent=key_indent)
+            if normalize(new_badges) == normalize(current.text):
+                continue
+            where = f"{approach_type}.outcomeBadges.{outcome}"
+            if not all(is_table_badge(element) for element in current.elements):
+                result['kept'].append(where)
+                continue
+            refused = refused_badges(approach[outcome]['badges'])
+            if refused:
+                result['errors'].extend(f"{where}: refusing {badge!r} (not a {' / '.join(sorted(BADGE_HELPERS))} "
+                                        f"call with literal arguments)" for badge in refused)
+                continue
+            edits.append((current.start, current.end, new_badges))
+            result['badges_updated'] += 1
+            result['changes'].append(where)
+
+    return edits, result
+
+
+def sync_event_file(event_name: str, event_data: Dict, base_path: str, dry_run: bool = False,
+                    match_idealist: bool = False) -> Dict:
+    """Sync a single event file with balance table data."""
+    file_path = os.path.join(base_path, f"src/pipelines/events/{event_data['file']}.ts")
+
+    if not os.path.exists(file_path):
+        return {'labels_updated': 0, 'badges_updated': 0, 'changes': [], 'kept': [], 'notes': [],
+                'errors': [f"File not found: {file_path}"]}
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    edits, result = plan_event_edits(content, event_data, match_idealist)
+    if not edits:
+        return result
+
+    new_content = apply_edits(content, edits)
+    error = verify_parses(new_content)
+    if error:
+        result['errors'].append(f"Edited file does not parse ({error}) - not written")
+        result['labels_updated'] = result['badges_updated'] = 0
+        result['changes'] = []
+        return result
+
+    if not dry_run:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+
     return result
 
+
 def main():
+    dry_run = '--dry-run' in sys.argv
+    match_idealist = '--match-idealist' in sys.argv
+
     # Load parsed balance table
-    with open('../docs/planning/balance-table-parsed.json', 'r') as f:
+    with open('../docs/planning/balance-table-parsed.json', 'r', encoding='utf-8') as f:
         events = json.load(f)
-    
+
     base_path = '..'
-    
+
     print("=== SYNCING EVENT PIPELINES WITH BALANCE TABLE ===\n")
-    
+    if dry_run:
+        print("🔍 DRY RUN MODE - No files will be modified\n")
+
     total_labels = 0
     total_badges = 0
     total_errors = 0
+    total_kept = 0
     processed = 0
-    
+
     for event_name in sorted(events.keys(), key=lambda x: int(events[x]['number'])):
         event_data = events[event_name]
-        
+
         if event_name == 'Scholarly Discovery':
             print(f"{event_data['number']}. {event_name} - SKIPPED (removed)")
             continue
-        
+
         print(f"{event_data['number']}. {event_name}")
-        
+
         try:
-            result = sync_event_file(event_name, event_data, base_path)
-            
+            result = sync_event_file(event_name, event_data, base_path, dry_run, match_idealist)
+            file_name = f"{event_data['file']}.ts"
+
+            for change in result['changes']:
+                print(f"  {'🔍 Would update' if dry_run else '✅ Updated'} {file_name}: {change}")
+            for kept in result['kept']:
+                print(f"  ⏭️  Kept {file_name}: {kept} (hand-written helper calls)")
+            for note in result['notes']:
+                print(f"  ℹ️  {note}")
+            for error in result['errors']:
+                print(f"  ❌ {error}")
+
+            total_labels += result['labels_updated']
+            total_badges += result['badges_updated']
+            total_kept += len(result['kept'])
             if result['errors']:
-                for error in result['errors']:
-                    print(f"  ❌ {error}")
                 total_errors += 1
             else:
-                if result['labels_updated'] > 0:
-                    print(f"  ✅ Updated {result['labels_updated']} approach labels")
-                if result['badges_updated'] > 0:
-                    print(f"  ✅ Updated {result['badges_updated']} outcome badge arrays")
-                
-                total_labels += result['labels_updated']
-                total_badges += result['badges_updated']
                 processed += 1
-                
-                if result['labels_updated'] == 0 and result['badges_updated'] == 0:
+                if not result['changes'] and not result['kept'] and not result['notes']:
                     print(f"  ℹ️  Already in sync")
-        
+
         except Exception as e:
             print(f"  ❌ Error: {e}")
             total_errors += 1
-        
+
         print()
-    
+
     print("=" * 80)
     print(f"\n📊 Summary:")
     print(f"   Events processed: {processed}")
     print(f"   Approach labels updated: {total_labels}")
     print(f"   Outcome badges updated: {total_badges}")
+    print(f"   Arrays kept (hand-written helpers): {total_kept}")
     print(f"   Errors: {total_errors}")
-    print(f"\n✅ All events synced with balance table!")
+    if total_errors:
+        print(f"\n⚠️  Some events could not be synced")
+    elif dry_run:
+        print(f"\n✅ Dry run complete - no files were modified")
+    else:
+        print(f"\n✅ All events synced with balance table!")
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,644 @@
+#!/usr/bin/env python3
+"""
+Lightweight TypeScript source model for pipeline files (src/pipelines/**).
+
+This is not a full TypeScript parser. It tokenizes the file properly
+(strings, template literals, comments, regex literals) and parses object
+and array literals into a tree with exact character spans. Everything else
+(calls, arrow functions, identifiers) is kept as an opaque Expr span.
+
+That is enough to locate things like strategicChoice.options[n].outcomeBadges
+reliably, without regexes that break on nested brackets, and to apply edits
+as non-overlapping span replacements.
+
+verify_parses() also checks every opaque Expr for token sequences that are
+never valid TypeScript in an expression (two operands with no operator
+between them, a statement keyword such as `if` after an operand), so an
+edit that only keeps the brackets balanced is still rejected.
+
+Usage from other build scripts:
+
+    from ts_source import parse_source, apply_edits
+
+    source = parse_source(text)
+    pipeline = source.exported_object()          # first `export const x = {...}`
+    options = pipeline.get_path('strategicChoice.options')
+    label = options.elements[0].get('label')     # Expr with .start/.end/.text
+    text = apply_edits(text, [(label.start, label.end, "'New Label'")])
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple, Union
+
+# ----------------------------------------------------------------------
+# Tokenizer
+# ----------------------------------------------------------------------
+
+STRING, TEMPLATE, COMMENT, REGEX, IDENT, NUMBER, PUNCT = (
+    'string', 'template', 'comment', 'regex', 'ident', 'number', 'punct')
+
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER = re.compile(r'\d[\w.]*')
+_WHITESPACE = re.compile(r'\s+')
+
+# Keywords that never end an operand
+KEYWORDS = {
+    'abstract', 'async', 'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger',
+    'declare', 'default', 'delete', 'do', 'else', 'enum', 'export', 'extends', 'finally', 'for', 'from',
+    'function', 'get', 'if', 'implements', 'import', 'in', 'infer', 'instanceof', 'interface', 'is',
+    'keyof', 'let', 'new', 'of', 'readonly', 'return', 'satisfies', 'set', 'static', 'switch', 'throw',
+    'try', 'type', 'typeof', 'unique', 'var', 'void', 'while', 'with', 'yield', 'as',
+}
+# A '{' after these opens a statement block (function body, else, ...) rather than an object
+_BLOCK_PRECEDERS = {'=>', ')', 'else', 'try', 'finally', 'do'}
+
+# Keywords that may follow an operand inside an expression
+INFIX_KEYWORDS = {'as', 'satisfies', 'in', 'instanceof', 'of', 'is', 'extends'}
+
+# After these tokens a '/' starts a regex literal rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^') | {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', '=>'}
+
+
+class Token:
+    __slots__ = ('kind', 'start', 'end', 'value')
+
+    def __init__(self, kind: str, start: int, end: int, value: str):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind}, {self.value!r}, {self.start})"
+
+
+class ParseError(ValueError):
+    pass
+
+
+def _scan_string(text: str, i: int) -> int:
+    """End index (exclusive) of the quoted string starting at i."""
+    quote = text[i]
+    i += 1
+    while i < len(text):
+        c = text[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == quote:
+            return i + 1
+        if c == '\n':
+            break
+        i += 1
+    raise ParseError(f"Unterminated string at offset {i}")
+
+
+def _scan_template(text: str, i: int) -> int:
+    """End index of the template literal starting at i (handles nested ${})."""
+    i += 1
+    while i < len(text):
+        c = text[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '`':
+            return i + 1
+        if c == '$' and text.startswith('${', i):
+            i = _scan_braced(text, i + 2)
+            continue
+        i += 1
+    raise ParseError(f"Unterminated template literal at offset {i}")
+
+
+def _scan_braced(text: str, i: int) -> int:
+    """Skip an expression inside ${ ... } and return the index after its '}'."""
+    depth = 1
+    for token in _tokens(text, i):
+        if token.kind == PUNCT and token.value == '{':
+            depth += 1
+        elif token.kind == PUNCT and token.value == '}':
+            depth -= 1
+            if depth == 0:
+                return token.end
+    raise ParseError(f"Unterminated template expression at offset {i}")
+
+
+def _scan_regex(text: str, i: int) -> int:
+    """End index of the regex literal starting at i (including flags)."""
+    i += 1
+    in_class = False
+    while i < len(text):
+        c = text[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            break
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            i += 1
+            while i < len(text) and (text[i].isalnum() or text[i] == '_'):
+                i += 1
+            return i
+        i += 1
+    raise ParseError(f"Unterminated regex literal at offset {i}")
+
+
+def _tokens(text: str, i: int = 0) -> Iterator[Token]:
+    previous: Optional[Token] = None
+    length = len(text)
+    while i < length:
+        c = text[i]
+        if c.isspace():
+            i = _WHITESPACE.match(text, i).end()
+            continue
+        if text.startswith('//', i):
+            end = text.find('\n', i)
+            end = length if end == -1 else end
+            yield Token(COMMENT, i, end, text[i:end])
+            i = end
+            continue
+        if text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            if end == -1:
+                raise ParseError(f"Unterminated comment at offset {i}")
+            yield Token(COMMENT, i, end + 2, text[i:end + 2])
+            i = end + 2
+            continue
+        if c in '\'"':
+            end = _scan_string(text, i)
+            token = Token(STRING, i, end, text[i:end])
+        elif c == '`':
+            end = _scan_template(text, i)
+            token = Token(TEMPLATE, i, end, text[i:end])
+        elif c == '/' and (previous is None or previous.value in _REGEX_PRECEDERS):
+            end = _scan_regex(text, i)
+            token = Token(REGEX, i, end, text[i:end])
+        elif c == '=' and text.startswith('=>', i):
+            end = i + 2
+            token = Token(PUNCT, i, end, '=>')
+        elif c == '.' and text.startswith('...', i):
+            end = i + 3
+            token = Token(PUNCT, i, end, '...')
+        else:
+            match = _IDENT.match(text, i)
+            if match:
+                end = match.end()
+                token = Token(IDENT, i, end, match.group())
+            else:
+                match = _NUMBER.match(text, i)
+                if match:
+                    end = match.end()
+                    token = Token(NUMBER, i, end, match.group())
+                else:
+                    end = i + 1
+                    token = Token(PUNCT, i, end, c)
+        yield token
+        previous = token
+        i = end
+
+
+def tokenize(text: str, include_comments: bool = False) -> List[Token]:
+    """Tokenize TypeScript source. Comments are dropped unless requested."""
+    return [t for t in _tokens(text) if include_comments or t.kind != COMMENT]
+
+
+# ----------------------------------------------------------------------
+# Literal tree
+# ----------------------------------------------------------------------
+
+class Expr:
+    """An opaque expression span (call, identifier, string, arrow fn, ...)."""
+
+    def __init__(self, text: str, start: int, end: int, tokens: List[Token]):
+        self.source = text
+        self.start = start
+        self.end = end
+        self.tokens = tokens
+
+    @property
+    def text(self) -> str:
+        return self.source[self.start:self.end]
+
+    def string_value(self) -> Optional[str]:
+        """The value of a plain string literal expression, else None."""
+        if len(self.tokens) == 1 and self.tokens[0].kind == STRING:
+            return unquote(self.tokens[0].value)
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.text[:40]!r})"
+
+
+class Property:
+    __slots__ = ('key', 'key_start', 'start', 'end', 'value')
+
+    def __init__(self, key: Optional[str], key_start: int, start: int, end: int, value: Optional['Node']):
+        self.key = key              # None for spreads
+        self.key_start = key_start
+        self.start = start          # Start of key
+        self.end = end              # End of value (before any trailing comma)
+        self.value = value
+
+
+class ObjectLiteral(Expr):
+    def __init__(self, text: str, start: int, end: int, tokens: List[Token]):
+        super().__init__(text, start, end, tokens)
+        self.properties: List[Property] = []
+
+    def get(self, key: str) -> Optional['Node']:
+        for prop in self.properties:
+            if prop.key == key:
+                return prop.value
+        return None
+
+    def get_property(self, key: str) -> Optional[Property]:
+        for prop in self.properties:
+            if prop.key == key:
+                return prop
+        return None
+
+    def keys(self) -> List[str]:
+        return [p.key for p in self.properties if p.key is not None]
+
+    def get_path(self, path: str) -> Optional['Node']:
+        """Follow a dotted path of keys / array indices, e.g. 'a.options.0.label'."""
+        node: Optional[Node] = self
+        for part in path.split('.'):
+            if isinstance(node, ObjectLiteral):
+                node = node.get(part)
+            elif isinstance(node, ArrayLiteral) and part.isdigit():
+                index = int(part)
+                node = node.elements[index] if index < len(node.elements) else None
+            else:
+                return None
+        return node
+
+
+class ArrayLiteral(Expr):
+    def __init__(self, text: str, start: int, end: int, tokens: List[Token]):
+        super().__init__(text, start, end, tokens)
+        self.elements: List[Node] = []
+
+
+Node = Union[Expr, ObjectLiteral, ArrayLiteral]
+
+_OPENERS = {'{': '}', '[': ']', '(': ')'}
+_CLOSERS = {'}', ']', ')'}
+
+
+def unquote(literal: str) -> str:
+    """Decode a simple single/double-quoted JS string literal."""
+    body = literal[1:-1]
+    return re.sub(r"\\(.)", lambda m: {'n': '\n', 't': '\t'}.get(m.group(1), m.group(1)), body)
+
+
+def quote(value: str) -> str:
+    """Encode a value as a single-quoted JS string literal."""
+    escaped = value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n')
+    return f"'{escaped}'"
+
+
+class _Parser:
+    def __init__(self, text: str, tokens: List[Token]):
+        self.text = text
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def skip_balanced(self) -> None:
+        """Skip one token, or a whole bracketed group if it opens one."""
+        depth = 0
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            self.pos += 1
+            if token.kind == PUNCT and token.value in _OPENERS:
+                depth += 1
+            elif token.kind == PUNCT and token.value in _CLOSERS:
+                depth -= 1
+                if depth < 0:
+                    raise ParseError(f"Unbalanced '{token.value}' at offset {token.start}")
+            if depth == 0:
+                return
+        raise ParseError("Unexpected end of file inside brackets")
+
+    def parse_value(self) -> Node:
+        """Parse an expression up to the next ',' or closing bracket at depth 0."""
+        start_index = self.pos
+        first = self.peek()
+        if first is None:
+            raise ParseError("Unexpected end of file")
+
+        node: Optional[Node] = None
+        if first.kind == PUNCT and first.value == '{':
+            node = self.parse_object()
+        elif first.kind == PUNCT and first.value == '[':
+            node = self.parse_array()
+
+        while True:
+            token = self.peek()
+            if token is None:
+                break
+            if token.kind == PUNCT and (token.value == ',' or token.value in _CLOSERS):
+                break
+            node = None  # Literal followed by more tokens: treat as opaque
+            self.skip_balanced()
+
+        if node is not None:
+            return node
+        tokens = self.tokens[start_index:self.pos]
+        if not tokens:
+            raise ParseError(f"Empty expression at offset {first.start}")
+        return Expr(self.text, tokens[0].start, tokens[-1].end, tokens)
+
+    def expect(self, value: str) -> Token:
+        token = self.peek()
+        if token is None or token.value != value:
+            where = token.start if token else len(self.text)
+            raise ParseError(f"Expected '{value}' at offset {where}")
+        self.pos += 1
+        return token
+
+    def parse_object(self) -> ObjectLiteral:
+        open_token = self.expect('{')
+        start_index = self.pos - 1
+        node = ObjectLiteral(self.text, open_token.start, open_token.start, [])
+        while True:
+            token = self.peek()
+            if token is None:
+                raise ParseError(f"Unterminated object at offset {open_token.start}")
+            if token.value == '}' and token.kind == PUNCT:
+                self.pos += 1
+                break
+            if token.value == '...':
+                self.pos += 1
+                value = self.parse_value()
+                node.properties.append(Property(None, token.start, token.start, value.end, value))
+            else:
+                key_token = token
+                if key_token.kind == STRING:
+                    key = unquote(key_token.value)
+                elif key_token.kind in (IDENT, NUMBER):
+                    key = key_token.value
+                elif key_token.value == '[':
+                    # Computed key - keep the raw text
+                    self.skip_balanced()
+                    key = self.text[key_token.start:self.tokens[self.pos - 1].end]
+                    self.pos -= 1
+                else:
+                    raise ParseError(f"Unexpected '{key_token.value}' in object at offset {key_token.start}")
+                self.pos += 1
+                after = self.peek()
+                if after is not None and after.value == '?':
+                    self.pos += 1
+                    after = self.peek()
+                if after is not None and after.value == ':':
+                    self.pos += 1
+                    value = self.parse_value()
+                    node.properties.append(Property(key, key_token.start, key_token.start, value.end, value))
+                elif after is not None and after.value == '(':
+                    # Method shorthand: key(args) { body }
+                    self.skip_balanced()
+                    while self.peek() is not None and self.peek().value != '{':
+                        self.pos += 1
+                    body_start = self.pos
+                    self.skip_balanced()
+                    body = Expr(self.text, key_token.start, self.tokens[self.pos - 1].end,
+                                self.tokens[body_start:self.pos])
+                    node.properties.append(Property(key, key_token.start, key_token.start, body.end, body))
+                else:
+                    # Shorthand property { foo }
+                    value = Expr(self.text, key_token.start, key_token.end, [key_token])
+                    node.properties.append(Property(key, key_token.start, key_token.start, key_token.end, value))
+            token = self.peek()
+            if token is not None and token.value == ',':
+                self.pos += 1
+        node.end = self.tokens[self.pos - 1].end
+        node.tokens = self.tokens[start_index:self.pos]
+        return node
+
+    def parse_array(self) -> ArrayLiteral:
+        open_token = self.expect('[')
+        start_index = self.pos - 1
+        node = ArrayLiteral(self.text, open_token.start, open_token.start, [])
+        while True:
+            token = self.peek()
+            if token is None:
+                raise ParseError(f"Unterminated array at offset {open_token.start}")
+            if token.kind == PUNCT and token.value == ']':
+                self.pos += 1
+                break
+            if token.value == '...':
+                self.pos += 1
+            node.elements.append(self.parse_value())
+            token = self.peek()
+            if token is not None and token.value == ',':
+                self.pos += 1
+        node.end = self.tokens[self.pos - 1].end
+        node.tokens = self.tokens[start_index:self.pos]
+        return node
+
+
+class SourceFile:
+    """A parsed pipeline file: tokens plus the exported object literals."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.exports: List[Tuple[str, ObjectLiteral]] = []
+        self._parse_exports()
+
+    def _parse_exports(self) -> None:
+        tokens = self.tokens
+        for index, token in enumerate(tokens):
+            if token.kind != IDENT or token.value not in ('const', 'let'):
+                continue
+            if index == 0 or tokens[index - 1].value != 'export':
+                continue
+            name_token = tokens[index + 1] if index + 1 < len(tokens) else None
+            if name_token is None or name_token.kind != IDENT:
+                continue
+            # Find '=' then require an object literal
+            j = index + 2
+            depth = 0
+            while j < len(tokens):
+                value = tokens[j].value
+                if value in ('<', '(', '['):
+                    depth += 1
+                elif value in ('>', ')', ']'):
+                    depth -= 1
+                elif value == '=' and depth <= 0:
+                    break
+                elif value == ';':
+                    j = len(tokens)
+                    break
+                j += 1
+            if j + 1 < len(tokens) and tokens[j + 1].value == '{':
+                parser = _Parser(self.text, tokens)
+                parser.pos = j + 1
+                self.exports.append((name_token.value, parser.parse_object()))
+
+    def exported_object(self, name: Optional[str] = None) -> Optional[ObjectLiteral]:
+        """The named export (or the first exported object literal)."""
+        for export_name, node in self.exports:
+            if name is None or export_name == name:
+                return node
+        return None
+
+
+def parse_source(text: str) -> SourceFile:
+    """Tokenize and parse a pipeline source file."""
+    return SourceFile(text)
+
+
+def line_indent(text: str, offset: int) -> str:
+    """Leading whitespace of the line containing offset."""
+    line_start = text.rfind('\n', 0, offset) + 1
+    match = _WHITESPACE.match(text, line_start)
+    indent = match.group() if match else ''
+    return indent.split('\n')[-1]
+
+
+Edit = Tuple[int, int, str]
+
+
+def apply_edits(text: str, edits: List[Edit]) -> str:
+    """
+    Apply (start, end, replacement) edits in one pass.
+
+    Edits must not overlap; raises ValueError if they do.
+    """
+    ordered = sorted(edits, key=lambda e: (e[0], e[1]))
+    pieces = []
+    cursor = 0
+    for start, end, replacement in ordered:
+        if start < cursor:
+            raise ValueError(f"Overlapping edits at offset {start}")
+        pieces.append(text[cursor:start])
+        pieces.append(replacement)
+        cursor = end
+    pieces.append(text[cursor:])
+    return ''.join(pieces)
+
+
+def _ends_operand(token: Token) -> bool:
+    if token.kind in (STRING, TEMPLATE, NUMBER, REGEX):
+        return True
+    if token.kind == IDENT:
+        return token.value not in KEYWORDS
+    return token.kind == PUNCT and token.value in (')', ']')
+
+
+def _starts_operand(token: Token) -> bool:
+    """Tokens that cannot directly follow an operand (tagged templates aside)."""
+    if token.kind in (STRING, NUMBER, REGEX):
+        return True
+    return token.kind == IDENT and token.value not in INFIX_KEYWORDS
+
+
+def expression_error(node: 'Node') -> Optional[str]:
+    """
+    First token sequence in an Expr that cannot be a TypeScript expression.
+
+    Statement blocks (function bodies, method bodies) are skipped, since
+    automatic semicolon insertion makes adjacent operands legal there;
+    parenthesised groups, arrays and object literals inside them are
+    checked again.
+    """
+    tokens = node.tokens
+    # Innermost context: True = expression, False = statement block
+    stack = [not (tokens and tokens[0].value == '{' and not isinstance(node, ObjectLiteral))]
+    previous: Optional[Token] = None
+    for token in tokens:
+        if token.kind == PUNCT and token.value == '{':
+            if previous is None:
+                block = not stack[-1]
+            else:
+                block = (previous.value in _BLOCK_PRECEDERS
+                         or (not stack[-1] and previous.value in (';', '{', '}')))
+            stack.append(not block)
+        elif token.kind == PUNCT and token.value in _OPENERS:
+            stack.append(True)
+        elif token.kind == PUNCT and token.value in _CLOSERS:
+            if len(stack) > 1:
+                stack.pop()
+        elif stack[-1] and previous is not None and _ends_operand(previous) and _starts_operand(token):
+            return f"Unexpected '{token.value}' after '{previous.value}' at offset {token.start}"
+        previous = token
+    return None
+
+
+def literal_call(code: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    (name, argument texts) if code is exactly one call with literal arguments.
+
+    Literals are strings, numbers (optionally negative), templates without
+    substitutions, true/false/null/undefined. Anything else returns None.
+    """
+    try:
+        tokens = tokenize(code)
+    except ParseError:
+        return None
+    if len(tokens) < 3 or tokens[0].kind != IDENT or tokens[0].value in KEYWORDS \
+            or tokens[1].value != '(' or tokens[-1].value != ')':
+        return None
+    args: List[str] = []
+    index, last = 2, len(tokens) - 1
+    while index < last:
+        token = tokens[index]
+        if token.value == '-' and index + 1 < last and tokens[index + 1].kind == NUMBER:
+            args.append('-' + tokens[index + 1].value)
+            index += 2
+        elif token.kind in (STRING, NUMBER) or (token.kind == TEMPLATE and '${' not in token.value) \
+                or (token.kind == IDENT and token.value in ('true', 'false', 'null', 'undefined')):
+            args.append(token.value)
+            index += 1
+        else:
+            return None
+        if index < last:
+            if tokens[index].value != ',':
+                return None
+            index += 1
+    return tokens[0].value, args
+
+
+def _walk_exprs(node: 'Node') -> Iterator['Node']:
+    if isinstance(node, ObjectLiteral):
+        for prop in node.properties:
+            if prop.value is not None:
+                yield from _walk_exprs(prop.value)
+    elif isinstance(node, ArrayLiteral):
+        for element in node.elements:
+            yield from _walk_exprs(element)
+    else:
+        yield node
+
+
+def verify_parses(text: str) -> Optional[str]:
+    """Return None if the text tokenizes, balances, its exports parse and their expressions are valid; else the error."""
+    try:
+        depth = 0
+        for token in tokenize(text):
+            if token.kind == PUNCT and token.value in _OPENERS:
+                depth += 1
+            elif token.kind == PUNCT and token.value in _CLOSERS:
+                depth -= 1
+                if depth < 0:
+                    return f"Unbalanced '{token.value}' at offset {token.start}"
+        if depth != 0:
+            return "Unbalanced brackets at end of file"
+        for _, export in SourceFile(text).exports:
+            for expr in _walk_exprs(export):
+                error = expression_error(expr)
+                if error:
+                    return error
+    except ParseError as e:
+        return str(e)
+    return None
@@ -4,9 +4,10 @@ Extract actual skills from event pipeline TypeScript files and update CSV.
 """
 
 import re
-import csv
 from pathlib import Path
 
+from planning_tables import load_table, write_table
+
 # Map event names to their file names
 EVENT_FILE_MAP = {
     '1. Criminal Trial': 'criminal-trial.ts',
@@ -72,27 +73,17 @@ def extract_skills_from_file(filepath: Path, approach_id: str):
 
 def main():
     events_dir = Path('src/pipelines/events')
-    csv_path = Path('docs/planning/EVENT_SKILLS_TABLE.csv')
-    
-    # Read CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    table = load_table('events')
+    csv_path = table.relative_path
+    rows = table.records()
     
     updated_count = 0
-    last_event_name = None
     
     # Update skills for each row
-    for row in rows:
-        event_name = row['Name']
+    for index, row in enumerate(rows):
+        event_name = table.event[index]
         approach = row['Approach']
         
-        # Track the last valid event name (for rows where Name is empty)
-        if event_name:
-            last_event_name = event_name
-        elif last_event_name:
-            event_name = last_event_name
-        
         if event_name in EVENT_FILE_MAP and approach in APPROACH_MAP:
             filename = EVENT_FILE_MAP[event_name]
             filepath = events_dir / filename
@@ -111,10 +102,7 @@ def main():
                 print(f"✗ File not found: {filepath}")
     
     # Write updated CSV
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=reader.fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    write_table(table, rows)
     
     print(f"\n✅ Updated {csv_path} ({updated_count} rows updated)")
 
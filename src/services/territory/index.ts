@@ -37,10 +37,10 @@ import { logger } from '../../utils/Logger';
 import { normalizeTerrainType, getTravelDifficultyFromTerrain } from '../../types/terrain';
 import type { TerrainType, TravelDifficulty } from '../../types/terrain';
 import { PLAYER_KINGDOM } from '../../types/ownership';
-// @ts-ignore - Static JSON import for Vite
-import waterwaysData from '../../../data/kingmaker-support/waterways.json';
-// @ts-ignore - Static JSON import for Vite - Stolen Lands map data
-import stolenLandsMapData from '../../../data/piazolands/stolen-lands-map.json';
+// @ts-ignore - Static JSON import for Vite - merged by buildscripts/merge-waterways.py
+import waterwaysData from '../../data-compiled/waterways.json';
+// @ts-ignore - Static JSON import for Vite - Stolen Lands map data (river paths live in waterways.json)
+import stolenLandsMapData from '../../data-compiled/stolen-lands-map.json';
 import type { ExportedMapData } from '../MapDataExportService';
 
 // Declare Foundry globals
@@ -54,6 +54,19 @@ export interface TerritoryMetrics {
     totalProduction: Map<string, number>;
 }
 
+/**
+ * Water on one hex edge, from the edge index in waterways.json
+ */
+export interface WaterwayEdge {
+    paths: string[];       // River path IDs passing through the edge
+    crossing?: string;     // Crossing type ('bridge', 'ford') if any
+    waterfall?: boolean;
+}
+
+// Canonical edge ID ("i:j:dir,i:j:dir") → water on that edge
+const waterwayEdges: Record<string, WaterwayEdge> =
+    ((waterwaysData as any).default || waterwaysData).edges || {};
+
 export interface KingmakerSyncResult {
     success: boolean;
     hexesSynced: number;
@@ -356,7 +369,7 @@ export class TerritoryService {
             // Handle both default export and direct object depending on how Vite bundles it
             const data = (waterwaysData as any).default || waterwaysData;
             logger.info('[Territory Service] Loaded Kingmaker waterways data');
-            logger.info(`[Territory Service] Waterways structure check: has rivers=${!!data?.rivers}, paths=${data?.rivers?.paths?.length || 0}, crossings=${data?.rivers?.crossings?.length || 0}`);
+            logger.info(`[Territory Service] Waterways structure check: has rivers=${!!data?.rivers}, paths=${data?.rivers?.paths?.length || 0}, crossings=${data?.rivers?.crossings?.length || 0}, indexed edges=${Object.keys(waterwayEdges).length}`);
             return data;
         } catch (error) {
             logger.warn('[Territory Service] Could not load Kingmaker waterways:', error);
@@ -979,6 +992,24 @@ export class TerritoryService {
         };
     }
     
+    /**
+     * Get the water on a hex edge from the shipped Kingmaker waterways
+     * Single lookup in the edge index - no scan of the river paths
+     *
+     * @param edgeId - Canonical edge ID (e.g., "4:4:se,5:4:nw"), see getCanonicalEdgeId()
+     * @returns River paths, crossing and waterfall on the edge, or null if it has no water
+     */
+    getWaterwayEdge(edgeId: string): WaterwayEdge | null {
+        return waterwayEdges[edgeId] ?? null;
+    }
+
+    /**
+     * Check whether a hex edge has water in the shipped Kingmaker waterways
+     */
+    hasWaterOnEdge(edgeId: string): boolean {
+        return edgeId in waterwayEdges;
+    }
+
     /**
      * Get information about a specific hex
      */
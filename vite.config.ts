@@ -133,7 +133,12 @@ export default defineConfig(({ mode }) =>
                   dest: '.'
                },
                {
-                  src: 'data-compiled/*.json',
+                  // waterways.json and stolen-lands-map.json are imported into the bundle
+                  src: [
+                     'data-compiled/*.json',
+                     '!data-compiled/waterways.json',
+                     '!data-compiled/stolen-lands-map.json'
+                  ],
                   dest: '.'
                }
             ]